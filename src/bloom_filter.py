@@ -0,0 +1,161 @@
+"""
+Bloom filter implementation for the web scraper application.
+
+This module provides a compact Bloom filter used as an in-memory
+front-end for duplicate detection, so that definitely-new URLs and content
+hashes can be recognized without a database round-trip.
+"""
+
+import hashlib
+import math
+import struct
+from typing import Iterable
+
+
+class BloomFilter:
+    """
+    Space-efficient probabilistic set membership.
+    
+    Membership checks may return false positives (bounded by the configured
+    error rate) but never false negatives, so a miss can be trusted as
+    "definitely not seen" while a hit must still be confirmed elsewhere.
+    """
+    
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 1e-6):
+        """
+        Initialize an empty Bloom filter.
+        
+        Args:
+            capacity: Expected number of items to be stored
+            error_rate: Target false positive probability at full capacity
+        """
+        if capacity <= 0:
+            raise ValueError("Bloom filter capacity must be greater than 0")
+        if not 0 < error_rate < 1:
+            raise ValueError("Bloom filter error_rate must be between 0 and 1")
+        
+        self.capacity = capacity
+        self.error_rate = error_rate
+        
+        # Optimal bit count and hash count for the requested error rate
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self.count = 0
+        
+        self._bits = bytearray((self.num_bits + 7) // 8)
+    
+    def _positions(self, item: str):
+        """Yield bit positions for item using double hashing."""
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1, h2 = struct.unpack('>QQ', digest)
+        h2 |= 1  # Ensure the stride is odd so positions don't collapse
+        
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+    
+    def add(self, item: str) -> None:
+        """
+        Add item to the filter.
+        
+        Args:
+            item: String key to add
+        """
+        bits = self._bits
+        for position in self._positions(item):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+    
+    def update(self, items: Iterable[str]) -> None:
+        """
+        Add multiple items to the filter.
+        
+        Args:
+            items: Iterable of string keys to add
+        """
+        for item in items:
+            self.add(item)
+    
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        for position in self._positions(item):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+    
+    def __len__(self) -> int:
+        return self.count
+
+
+class ScalableBloomFilter:
+    """
+    Bloom filter that grows as items are added.
+    
+    When the current filter reaches its capacity a larger one with a tighter
+    error rate is added, so the overall false positive probability stays
+    below error_rate however many items are stored.
+    """
+    
+    def __init__(self, initial_capacity: int = 100_000, error_rate: float = 1e-6,
+                 growth_factor: int = 2, tightening_ratio: float = 0.5):
+        """
+        Initialize an empty scalable Bloom filter.
+        
+        Args:
+            initial_capacity: Capacity of the first underlying filter
+            error_rate: Upper bound on the overall false positive probability
+            growth_factor: Capacity multiplier for each added filter
+            tightening_ratio: Error rate multiplier for each added filter
+        """
+        if growth_factor < 1:
+            raise ValueError("Scalable Bloom filter growth_factor must be at least 1")
+        if not 0 < tightening_ratio < 1:
+            raise ValueError("Scalable Bloom filter tightening_ratio must be between 0 and 1")
+        
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self.growth_factor = growth_factor
+        self.tightening_ratio = tightening_ratio
+        
+        # The per-filter error rates form a geometric series summing to error_rate
+        self._filters = [BloomFilter(initial_capacity, error_rate * (1 - tightening_ratio))]
+    
+    def add(self, item: str) -> None:
+        """
+        Add item to the filter.
+        
+        Items already reported as present are not added again, so repeated
+        adds don't use up capacity.
+        
+        Args:
+            item: String key to add
+        """
+        if item in self:
+            return
+        
+        current = self._filters[-1]
+        if current.count >= current.capacity:
+            current = BloomFilter(current.capacity * self.growth_factor,
+                                  current.error_rate * self.tightening_ratio)
+            self._filters.append(current)
+        current.add(item)
+    
+    def update(self, items: Iterable[str]) -> None:
+        """
+        Add multiple items to the filter.
+        
+        Args:
+            items: Iterable of string keys to add
+        """
+        for item in items:
+            self.add(item)
+    
+    def __contains__(self, item: str) -> bool:
+        return any(item in bloom for bloom in reversed(self._filters))
+    
+    def __len__(self) -> int:
+        return sum(len(bloom) for bloom in self._filters)
+    
+    @property
+    def capacity(self) -> int:
+        """Total capacity of the underlying filters."""
+        return sum(bloom.capacity for bloom in self._filters)
@@ -6,28 +6,57 @@ operations with connection pooling, transaction management, and error recovery.
 """
 
 import logging
+import re
 import psycopg2
 import psycopg2.pool
+from psycopg2 import sql
 from psycopg2.extras import RealDictCursor
 from typing import Dict, List, Any, Optional, Tuple
+import sys
 import time
-import hashlib
 from contextlib import contextmanager
 import threading
-from dataclasses import dataclass
+from dataclasses import dataclass, InitVar
 
+# Re-exported so database callers hash exactly like the scraper does
+from utils import calculate_content_hash
 
-@dataclass
+# One ScrapedContent is built per URL; slots drop the per-instance __dict__
+# where dataclasses support them (Python 3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Schema names usable unquoted in search_path and quoted in CREATE SCHEMA alike
+_SCHEMA_NAME_RE = re.compile(r'[a-z_][a-z0-9_]{0,62}')
+
+
+@dataclass(**_SLOTS)
 class ScrapedContent:
-    """Data class for scraped content."""
+    """
+    Data class for scraped content.
+    
+    When content_hash is omitted it is calculated from content once, on
+    construction, with hash_algorithm. Pass the scraper's configured
+    content_hash_algorithm, since hashes only match within one algorithm.
+    """
     url: str
     title: Optional[str] = None
     content: Optional[str] = None
     content_hash: Optional[str] = None
+    # Hash with digits and tag attributes normalized away, for volatile-content dedup
+    normalized_hash: Optional[str] = None
     response_status: Optional[int] = None
     response_time_ms: Optional[int] = None
     content_length: Optional[int] = None
     last_modified: Optional[str] = None
+    # MinHash signature for near-duplicate detection (in-memory only, not stored)
+    minhash_signature: Optional[Tuple[int, ...]] = None
+    # Algorithm for a content_hash calculated here (not stored on the instance)
+    hash_algorithm: InitVar[str] = 'sha256'
+    
+    def __post_init__(self, hash_algorithm: str) -> None:
+        """Calculate content_hash from content when it was not given."""
+        if self.content_hash is None and self.content:
+            self.content_hash = calculate_content_hash(self.content, hash_algorithm)
 
 
 class DatabaseManager:
@@ -56,6 +85,12 @@ class DatabaseManager:
                 - max_connections: Maximum pool connections (default: 20)
                 - min_connections: Minimum pool connections (default: 5)
                 - connection_timeout: Connection timeout in seconds (default: 30)
+                - schema: Schema to create and use tables in (default: the
+                  server's search_path, normally public); lowercase letters,
+                  digits and underscores only
+        
+        Raises:
+            ValueError: If schema is not a plain lowercase identifier
         """
         self.config = config
         self.logger = logging.getLogger(__name__)
@@ -66,6 +101,11 @@ class DatabaseManager:
         self.min_connections = config.get('min_connections', 5)
         self.max_connections = config.get('max_connections', 20)
         self.connection_timeout = config.get('connection_timeout', 30)
+        self.schema = config.get('schema')
+        # search_path folds unquoted names to lowercase while CREATE SCHEMA quotes
+        # them, so only names that mean the same thing both ways are accepted
+        if self.schema and not _SCHEMA_NAME_RE.fullmatch(self.schema):
+            raise ValueError(f"Invalid database schema name: {self.schema!r}")
         
         # Database connection parameters
         self.db_params = {
@@ -76,6 +116,8 @@ class DatabaseManager:
             'password': config['password'],
             'connect_timeout': self.connection_timeout
         }
+        if self.schema:
+            self.db_params['options'] = f"-c search_path={self.schema}"
         
         self.logger.info(f"DatabaseManager initialized for {config['host']}:{config['port']}/{config['database']}")
     
@@ -133,9 +175,9 @@ class DatabaseManager:
         query = """
         INSERT INTO scraped_content (
             url, title, content, content_hash, response_status, 
-            response_time_ms, content_length, last_modified
+            response_time_ms, content_length, last_modified, normalized_hash
         ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s, %s
+            %s, %s, %s, %s, %s, %s, %s, %s, %s
         ) RETURNING id
         """
         
@@ -147,7 +189,8 @@ class DatabaseManager:
             content.response_status,
             content.response_time_ms,
             content.content_length,
-            content.last_modified
+            content.last_modified,
+            content.normalized_hash
         )
         
         try:
@@ -231,6 +274,36 @@ class DatabaseManager:
             self.logger.error(f"Failed to check content existence for {url}: {e}")
             raise
     
+    def normalized_content_exists(self, url: str, normalized_hash: str) -> bool:
+        """
+        Check if content with specific normalized hash already exists for URL.
+        
+        Args:
+            url: The URL to check
+            normalized_hash: SHA-256 hash of the content with digits and tag attributes normalized
+            
+        Returns:
+            bool: True if content exists, False otherwise
+        """
+        query = """
+        SELECT 1 FROM scraped_content 
+        WHERE url = %s AND normalized_hash = %s 
+        LIMIT 1
+        """
+        
+        try:
+            with self._get_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(query, (url, normalized_hash))
+                    exists = cursor.fetchone() is not None
+                    
+                    self.logger.debug(f"Normalized content exists check for {url}: {exists}")
+                    return exists
+                    
+        except psycopg2.Error as e:
+            self.logger.error(f"Failed to check normalized content existence for {url}: {e}")
+            raise
+    
     def get_latest_content_hash(self, url: str) -> Optional[str]:
         """
         Get the most recent content hash for a URL.
@@ -266,6 +339,72 @@ class DatabaseManager:
             self.logger.error(f"Failed to get latest content hash for {url}: {e}")
             raise
     
+    def get_latest_scrape_info(self, urls: List[str]) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+        """
+        Get the content hash and Last-Modified value of the most recent scrape of each URL.
+        
+        Replaces per-URL latest-hash and Last-Modified lookups with a single query.
+        
+        Args:
+            urls: URLs to look up
+        
+        Returns:
+            Dictionary mapping each previously scraped URL to (content_hash, last_modified)
+        """
+        if not urls:
+            return {}
+        
+        query = """
+        SELECT DISTINCT ON (url) url, content_hash, last_modified
+        FROM scraped_content 
+        WHERE url = ANY(%s) 
+        ORDER BY url, scraped_at DESC
+        """
+        
+        try:
+            with self._get_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(query, (list(urls),))
+                    latest = {row[0]: (row[1], row[2]) for row in cursor.fetchall()}
+                    
+                    self.logger.debug(f"Retrieved latest scrape info for {len(latest)} of {len(urls)} URLs")
+                    return latest
+        
+        except psycopg2.Error as e:
+            self.logger.error(f"Failed to get latest scrape info: {e}")
+            raise
+    
+    def get_url_hash_pairs(self, urls: List[str]) -> List[Tuple[str, Optional[str]]]:
+        """
+        Get every distinct (url, content_hash) pair stored for the given URLs.
+        
+        Used to seed in-memory duplicate detection filters with a single indexed
+        query instead of one lookup per URL.
+        
+        Args:
+            urls: URLs to look up
+        
+        Returns:
+            List of (url, content_hash) tuples
+        """
+        if not urls:
+            return []
+        
+        query = "SELECT DISTINCT url, content_hash FROM scraped_content WHERE url = ANY(%s)"
+        
+        try:
+            with self._get_connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(query, (list(urls),))
+                    pairs = [(row[0], row[1]) for row in cursor.fetchall()]
+                    
+                    self.logger.debug(f"Retrieved {len(pairs)} url/hash pairs for {len(urls)} URLs")
+                    return pairs
+        
+        except psycopg2.Error as e:
+            self.logger.error(f"Failed to get url/hash pairs: {e}")
+            raise
+    
     def insert_scraping_stats(self, session_id: str, total_urls: int, 
                             successful_scrapes: int, failed_scrapes: int,
                             total_execution_time_ms: int) -> int:
@@ -382,6 +521,7 @@ class DatabaseManager:
             response_time_ms INTEGER,
             content_length INTEGER,
             last_modified VARCHAR(255),
+            normalized_hash VARCHAR(64),
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
         """
@@ -402,6 +542,7 @@ class DatabaseManager:
         create_indexes = [
             "CREATE INDEX IF NOT EXISTS idx_scraped_content_url_date ON scraped_content(url, scraped_at)",
             "CREATE INDEX IF NOT EXISTS idx_scraped_content_hash ON scraped_content(content_hash)",
+            "CREATE INDEX IF NOT EXISTS idx_scraped_content_url_normalized_hash ON scraped_content(url, normalized_hash)",
             "CREATE INDEX IF NOT EXISTS idx_scraped_content_created_at ON scraped_content(created_at)",
             "CREATE INDEX IF NOT EXISTS idx_scraping_stats_session ON scraping_stats(scrape_session_id)",
             "CREATE INDEX IF NOT EXISTS idx_scraping_stats_date ON scraping_stats(started_at)"
@@ -410,6 +551,10 @@ class DatabaseManager:
         try:
             with self._get_connection() as conn:
                 with conn.cursor() as cursor:
+                    if self.schema:
+                        cursor.execute(sql.SQL("CREATE SCHEMA IF NOT EXISTS {}").format(
+                            sql.Identifier(self.schema)))
+                    
                     # Create tables
                     cursor.execute(create_content_table)
                     cursor.execute(create_stats_table)
@@ -446,6 +591,29 @@ class DatabaseManager:
             self.logger.error(f"Failed to run migration for last_modified column: {e}")
             raise
     
+    def migrate_add_normalized_hash_column(self) -> None:
+        """
+        Add normalized_hash column and index to scraped_content table if they don't exist.
+        This migration is safe to run multiple times.
+        """
+        migration_queries = [
+            "ALTER TABLE scraped_content ADD COLUMN IF NOT EXISTS normalized_hash VARCHAR(64)",
+            "CREATE INDEX IF NOT EXISTS idx_scraped_content_url_normalized_hash "
+            "ON scraped_content(url, normalized_hash)"
+        ]
+        
+        try:
+            with self._get_connection() as conn:
+                with conn.cursor() as cursor:
+                    for query in migration_queries:
+                        cursor.execute(query)
+                    conn.commit()
+                    self.logger.info("Migration: Added normalized_hash column to scraped_content table")
+                    
+        except psycopg2.Error as e:
+            self.logger.error(f"Failed to run migration for normalized_hash column: {e}")
+            raise
+    
     def get_connection_pool_stats(self) -> Dict[str, Any]:
         """
         Get connection pool statistics.
@@ -532,22 +700,6 @@ class DatabaseManager:
                     self.logger.error(f"Failed to return connection to pool: {e}")
 
 
-def calculate_content_hash(content: str) -> str:
-    """
-    Calculate SHA-256 hash of content for duplicate detection.
-    
-    Args:
-        content: Content string to hash
-        
-    Returns:
-        str: SHA-256 hash in hexadecimal format
-    """
-    if not content:
-        return ""
-    
-    return hashlib.sha256(content.encode('utf-8')).hexdigest()
-
-
 # Example usage and testing functions
 if __name__ == "__main__":
     # This section is for testing purposes
@@ -585,7 +737,6 @@ if __name__ == "__main__":
             url="https://example.com",
             title="Example Title",
             content="Example content for testing",
-            content_hash=calculate_content_hash("Example content for testing"),
             response_status=200,
             response_time_ms=150,
             content_length=25
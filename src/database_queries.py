@@ -14,10 +14,41 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Union, Tuple
 from dataclasses import dataclass, asdict
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
 from contextlib import contextmanager
 
-from utils import get_logger, log_performance
+from utils import get_logger, log_performance, hash_contents_batch, normalize_volatile_content
+
+# Optional C-accelerated JSON encoder for reports; json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps_report(report: Dict[str, Any]) -> str:
+    """
+    Serialize a report to indented JSON.
+    
+    Values JSON can't represent (datetimes, Decimals) are written with str()
+    and non-ASCII text is written unescaped by either encoder, so ordinary
+    reports serialize identically with or without orjson. The encoders still
+    differ on edge cases: orjson writes NaN/Infinity as null and rejects
+    integers wider than 64 bits, where json writes NaN/Infinity literals and
+    arbitrary-size integers.
+    
+    Args:
+        report: Report dictionary
+        
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            report, default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        ).decode('utf-8')
+    return json.dumps(report, indent=2, default=str, ensure_ascii=False)
 
 
 @dataclass
@@ -567,15 +598,7 @@ class DatabaseAnalytics:
                         status_counts[status] = status_counts.get(status, 0) + 1
                     report['status_breakdown'] = status_counts
                     
-                    # Format according to requested format
-                    if format.lower() == 'json':
-                        return json.dumps(report, indent=2, default=str)
-                    elif format.lower() == 'csv':
-                        return self._format_report_as_csv(report)
-                    elif format.lower() == 'html':
-                        return self._format_report_as_html(report)
-                    else:
-                        return report
+                    return self.format_scraping_report(report, format)
                         
         except psycopg2.Error as e:
             self.logger.error(f"Failed to generate scraping report: {e}")
@@ -584,6 +607,30 @@ class DatabaseAnalytics:
             self.logger.error(f"Unexpected error generating scraping report: {e}")
             raise
     
+    def format_scraping_report(self, report: Dict[str, Any],
+                               format: str = 'dict') -> Union[Dict[str, Any], str]:
+        """
+        Format a report returned by generate_scraping_report(format='dict').
+        
+        Lets one fetched report be rendered in several formats without
+        querying the database again.
+        
+        Args:
+            report: Report dictionary
+            format: Output format ('dict', 'json', 'csv', 'html')
+            
+        Returns:
+            Report in requested format
+        """
+        if format.lower() == 'json':
+            return _dumps_report(report)
+        elif format.lower() == 'csv':
+            return self._format_report_as_csv(report)
+        elif format.lower() == 'html':
+            return self._format_report_as_html(report)
+        else:
+            return report
+    
     def _format_report_as_csv(self, report: Dict[str, Any]) -> str:
         """Format report as CSV string."""
         output = io.StringIO()
@@ -700,13 +747,16 @@ class DatabaseBulkOps:
     
     @log_performance
     def bulk_insert_content(self, content_list: List[Dict[str, Any]], 
-                          batch_size: int = 1000) -> int:
+                          batch_size: int = 1000, algorithm: str = 'sha256') -> int:
         """
         Efficient batch insertion of content.
         
         Args:
-            content_list: List of content dictionaries to insert
+            content_list: List of content dictionaries to insert; a missing
+                content_hash or normalized_hash is calculated from the content
             batch_size: Number of records to insert per batch
+            algorithm: Content hash algorithm for missing hashes, which should
+                match the scraper's content_hash_algorithm setting
             
         Returns:
             Number of records successfully inserted
@@ -714,41 +764,60 @@ class DatabaseBulkOps:
         if not content_list:
             return 0
         
+        # Hash everything records arrived without in one parallel batch, the
+        # same way ContentExtractor hashes content for insert_content()
+        pending = []  # (index, column, text to hash)
+        unchanged = []  # Indexes whose normalized content is the content itself
+        for index, content in enumerate(content_list):
+            text = content.get('content')
+            if not text:
+                continue
+            if not content.get('content_hash'):
+                pending.append((index, 'content_hash', text))
+            if not content.get('normalized_hash'):
+                normalized = normalize_volatile_content(text)
+                if normalized is text:
+                    unchanged.append(index)
+                else:
+                    pending.append((index, 'normalized_hash', normalized))
+        computed_hashes = dict(zip(((index, column) for index, column, _ in pending),
+                                   hash_contents_batch([text for _, _, text in pending], algorithm)))
+        for index in unchanged:
+            computed_hashes[index, 'normalized_hash'] = (content_list[index].get('content_hash')
+                                                         or computed_hashes[index, 'content_hash'])
+        
         total_inserted = 0
         
         try:
             with self.db_manager._get_connection() as conn:
                 with conn.cursor() as cursor:
+                    insert_query = """
+                        INSERT INTO scraped_content 
+                        (url, title, content, content_hash, response_status, 
+                         response_time_ms, content_length, last_modified, normalized_hash)
+                        VALUES %s
+                    """
+                    
                     # Process in batches
                     for i in range(0, len(content_list), batch_size):
                         batch = content_list[i:i + batch_size]
-                        
-                        # Prepare batch insert query
-                        values_template = "(%s, %s, %s, %s, %s, %s, %s, %s)"
-                        values_list = []
-                        params = []
-                        
-                        for content in batch:
-                            values_list.append(values_template)
-                            params.extend([
+                        rows = [
+                            (
                                 content.get('url'),
                                 content.get('title'),
                                 content.get('content'),
-                                content.get('content_hash'),
+                                content.get('content_hash') or computed_hashes.get((index, 'content_hash')),
                                 content.get('response_status'),
                                 content.get('response_time_ms'),
                                 content.get('content_length'),
-                                content.get('last_modified')
-                            ])
-                        
-                        insert_query = f"""
-                            INSERT INTO scraped_content 
-                            (url, title, content, content_hash, response_status, 
-                             response_time_ms, content_length, last_modified)
-                            VALUES {', '.join(values_list)}
-                        """
+                                content.get('last_modified'),
+                                content.get('normalized_hash') or computed_hashes.get((index, 'normalized_hash'))
+                            )
+                            for index, content in enumerate(batch, i)
+                        ]
                         
-                        cursor.execute(insert_query, params)
+                        # One multi-row statement per batch, so rowcount covers the whole batch
+                        execute_values(cursor, insert_query, rows, page_size=len(rows))
                         batch_inserted = cursor.rowcount
                         total_inserted += batch_inserted
                         
@@ -40,6 +40,7 @@ class WebScraperApp:
         """Initialize the web scraper application."""
         self.config = None
         self.database_manager = None
+        self.scraper = None
         self.logger = None
         self.shutdown_requested = False
         self.session_id = str(uuid.uuid4())[:8]  # Short session ID for tracking
@@ -256,6 +257,7 @@ Analytics and Reporting:
             # Run migrations for existing installations
             self.logger.info("Running database migrations...")
             db_manager.migrate_add_last_modified_column()
+            db_manager.migrate_add_normalized_hash_column()
             self.logger.info("Database migrations completed successfully")
         except Exception as e:
             self.logger.error(f"Failed to create database tables: {e}")
@@ -309,6 +311,7 @@ Analytics and Reporting:
                 try:
                     self.logger.info("Running database migrations...")
                     self.database_manager.migrate_add_last_modified_column()
+                    self.database_manager.migrate_add_normalized_hash_column()
                     self.logger.info("Database migrations completed successfully")
                     return 0  # Success
                 except Exception as e:
@@ -340,6 +343,7 @@ Analytics and Reporting:
             
             try:
                 with WebScraper(self.config, self.database_manager) as scraper:
+                    self.scraper = scraper
                     if args.dry_run:
                         self.logger.info("Dry-run mode enabled - simulating scraping process")
                         session = scraper.scrape_urls(dry_run=True)
@@ -371,6 +375,8 @@ Analytics and Reporting:
             except Exception as e:
                 self.logger.error(f"Web scraping failed: {type(e).__name__} - {str(e)}")
                 return 4  # Runtime error
+            finally:
+                self.scraper = None
             
             # Calculate execution time
             execution_time = time.time() - start_time
@@ -432,6 +438,10 @@ Analytics and Reporting:
         
         self.shutdown_requested = True
         
+        # Cut short any retry backoff the scraper is sleeping in
+        if self.scraper:
+            self.scraper.http_client.request_shutdown()
+        
         # If this is the second signal, force exit
         if hasattr(self, '_shutdown_signal_received'):
             if self.logger:
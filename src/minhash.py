@@ -0,0 +1,207 @@
+"""
+MinHash near-duplicate detection for the web scraper application.
+
+This module provides MinHash signatures over word shingles and a banded
+locality-sensitive hashing (LSH) index, so pages whose extracted text is
+nearly identical (e.g. templated pages differing only in a timestamp) can be
+recognized without comparing every pair of documents.
+"""
+
+import hashlib
+import random
+import re
+import threading
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+# Mersenne prime modulus for the universal hash permutations
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+class MinHasher:
+    """
+    Compute fixed-length MinHash signatures for text.
+    
+    The permutation parameters are derived from a fixed seed, so signatures
+    produced by different instances with the same settings are comparable.
+    """
+    
+    def __init__(self, num_perm: int = 64, shingle_size: int = 5, seed: int = 1):
+        """
+        Initialize the hasher.
+        
+        Args:
+            num_perm: Number of hash permutations (signature length)
+            shingle_size: Number of consecutive words per shingle
+            seed: Seed for the permutation parameters
+        """
+        if num_perm <= 0:
+            raise ValueError("MinHash num_perm must be greater than 0")
+        if shingle_size <= 0:
+            raise ValueError("MinHash shingle_size must be greater than 0")
+        
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        
+        rng = random.Random(seed)
+        self._permutations = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+    
+    def _shingle_hashes(self, text: str) -> List[int]:
+        """Hash each distinct word shingle of text to a 32-bit integer."""
+        tokens = _TOKEN_RE.findall(text.lower())
+        if not tokens:
+            return []
+        
+        size = min(self.shingle_size, len(tokens))
+        shingles = {' '.join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+        
+        return [
+            int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=4).digest(), 'big')
+            for shingle in shingles
+        ]
+    
+    def signature(self, text: str) -> Tuple[int, ...]:
+        """
+        Compute the MinHash signature of text.
+        
+        Args:
+            text: Extracted page text
+        
+        Returns:
+            Tuple of num_perm integers (all maximal for text without words)
+        """
+        hashes = self._shingle_hashes(text)
+        if not hashes:
+            return (_MAX_HASH,) * self.num_perm
+        
+        return tuple(
+            min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+            for a, b in self._permutations
+        )
+
+
+def estimate_jaccard(signature1: Sequence[int], signature2: Sequence[int]) -> float:
+    """
+    Estimate Jaccard similarity from two MinHash signatures.
+    
+    Args:
+        signature1: First signature
+        signature2: Second signature of the same length
+    
+    Returns:
+        Fraction of matching signature positions (0.0-1.0)
+    """
+    if len(signature1) != len(signature2):
+        raise ValueError("MinHash signatures must have the same length")
+    if not signature1:
+        return 0.0
+    
+    matches = sum(1 for value1, value2 in zip(signature1, signature2) if value1 == value2)
+    return matches / len(signature1)
+
+
+class MinHashLSH:
+    """
+    Banded LSH index over MinHash signatures.
+    
+    Signatures are split into bands; documents sharing any band become
+    candidates, which are then confirmed by their estimated Jaccard
+    similarity against the threshold. insert() and query() are thread-safe.
+    """
+    
+    def __init__(self, threshold: float = 0.85, num_perm: int = 64):
+        """
+        Initialize an empty index.
+        
+        Args:
+            threshold: Minimum estimated Jaccard similarity for a match
+            num_perm: Signature length of the indexed MinHashes
+        """
+        if not 0 < threshold <= 1:
+            raise ValueError("MinHashLSH threshold must be between 0 and 1")
+        
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands, self.rows = self._choose_bands(threshold, num_perm)
+        
+        self._buckets: List[Dict[Tuple[int, ...], List[Hashable]]] = [{} for _ in range(self.bands)]
+        self._signatures: Dict[Hashable, Tuple[int, ...]] = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _choose_bands(threshold: float, num_perm: int) -> Tuple[int, int]:
+        """
+        Choose the band layout whose S-curve midpoint is closest below threshold.
+        
+        Keeping the midpoint at or below the threshold favours recall; the
+        Jaccard check on candidates removes the extra false positives.
+        """
+        best = (num_perm, 1)
+        for rows in range(1, num_perm + 1):
+            if num_perm % rows:
+                continue
+            bands = num_perm // rows
+            if (1 / bands) ** (1 / rows) <= threshold:
+                best = (bands, rows)
+        return best
+    
+    def _band_keys(self, signature: Sequence[int]):
+        """Yield (band index, band key) pairs for signature."""
+        if len(signature) != self.num_perm:
+            raise ValueError(f"Expected a signature of length {self.num_perm}, got {len(signature)}")
+        
+        for band in range(self.bands):
+            start = band * self.rows
+            yield band, tuple(signature[start:start + self.rows])
+    
+    def insert(self, key: Hashable, signature: Sequence[int]) -> None:
+        """
+        Add a signature to the index.
+        
+        Args:
+            key: Identifier returned by query() for this document
+            signature: MinHash signature
+        """
+        signature = tuple(signature)
+        band_keys = list(self._band_keys(signature))
+        
+        with self._lock:
+            # Store the signature before the key becomes reachable from a bucket
+            self._signatures[key] = signature
+            for band, band_key in band_keys:
+                self._buckets[band].setdefault(band_key, []).append(key)
+    
+    def query(self, signature: Sequence[int]) -> Optional[Hashable]:
+        """
+        Find an indexed document similar to signature.
+        
+        Args:
+            signature: MinHash signature
+        
+        Returns:
+            Key of the first indexed document at or above the threshold, or None
+        """
+        signature = tuple(signature)
+        band_keys = list(self._band_keys(signature))
+        checked = set()
+        
+        with self._lock:
+            for band, band_key in band_keys:
+                for key in self._buckets[band].get(band_key, ()):
+                    if key in checked:
+                        continue
+                    checked.add(key)
+                    if estimate_jaccard(signature, self._signatures[key]) >= self.threshold:
+                        return key
+        
+        return None
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._signatures)
@@ -6,16 +6,28 @@ This module provides the core scraping functionality including HTTP client,
 content extraction, robots.txt compliance, and scraping orchestration.
 """
 
+import asyncio
+import io
+import os
 import time
 import random
 import re
+import logging
 import hashlib
-from typing import Dict, Any, Tuple, Optional
-from dataclasses import dataclass
+import codecs
+import pickle
+from typing import Dict, Any, List, Tuple, Optional, Callable, Union
+from collections import Counter, OrderedDict, deque
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from datetime import datetime
-from urllib.parse import urlparse, urljoin
+from urllib.parse import urljoin
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
 import threading
 
+import psycopg2
 import requests
 from requests.adapters import HTTPAdapter
 from requests.exceptions import (
@@ -23,10 +35,309 @@ from requests.exceptions import (
     TooManyRedirects, SSLError, ChunkedEncodingError
 )
 from bs4 import BeautifulSoup, NavigableString
-import chardet
+import lxml.html
+from lxml import etree
+import soupsieve
 
-from utils import get_logger, log_performance, calculate_content_hash
+# Prefer the C-accelerated detector when installed; charset-normalizer is the
+# required fallback and exposes the same detect() interface
+try:
+    import cchardet as encoding_detector
+except ImportError:
+    import charset_normalizer as encoding_detector
+
+from utils import (get_logger, log_performance, calculate_content_hash, calculate_content_hashes,
+                   canonicalize_url, parse_url, get_base_url, get_host, get_worker_log_queue, setup_worker_logging)
 from database import ScrapedContent
+from bloom_filter import ScalableBloomFilter
+from minhash import MinHasher, MinHashLSH
+
+
+# Charset declarations in the Content-Type header and in <meta> tags
+_CHARSET_HEADER_RE = re.compile(r'charset=["\']?([\w.:-]+)', re.IGNORECASE)
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset[=\s]*["\']?([^"\'>\s]+)', re.IGNORECASE)
+
+# Whitespace runs and trailing " - Site Name" style title suffixes
+_WHITESPACE_RE = re.compile(r'\s+')
+# Title cleanup in one pass: whitespace runs (group 1) or a trailing " - Site Name" suffix (group 2)
+_TITLE_CLEAN_RE = re.compile(r'(\s+)|(\s*[-|–—]\s*[^-|–—]*$)')
+
+# Elements whose text BeautifulSoup's get_text() leaves out, wherever they appear
+_NON_TEXT_TAGS = ('script', 'style', 'template', 'rt', 'rp')
+_VISIBLE_TEXT_XPATH = etree.XPath(
+    './/text()[not(' + ' or '.join(f'ancestor::{tag}' for tag in _NON_TEXT_TAGS) + ')]',
+    smart_strings=False
+)
+
+# Media types extract_content parses; anything else (images, PDFs, video) is skipped
+_HTML_CONTENT_TYPES = frozenset(('text/html', 'application/xhtml+xml'))
+
+# Per-thread random generators so retry jitter doesn't contend on the shared module RNG
+_thread_local = threading.local()
+
+
+def _get_thread_rng() -> random.Random:
+    """Get the calling thread's random generator, creating it on first use."""
+    rng = getattr(_thread_local, 'rng', None)
+    if rng is None:
+        rng = _thread_local.rng = random.Random(os.urandom(16))
+    return rng
+
+
+def _parse_simple_selector(selector: str) -> Tuple[str, str]:
+    """
+    Split a simple CSS selector (tag, .class or #id) into its kind and name.
+    
+    Args:
+        selector: CSS selector string
+        
+    Returns:
+        Tuple of ('tag' | 'class' | 'id', name)
+        
+    Raises:
+        ValueError: If the selector is not a single tag, class or id
+    """
+    if re.fullmatch(r'[a-zA-Z][\w-]*', selector):
+        return 'tag', selector.lower()
+    if re.fullmatch(r'\.[\w-]+', selector):
+        return 'class', selector[1:]
+    if re.fullmatch(r'#[\w-]+', selector):
+        return 'id', selector[1:]
+    raise ValueError(f"Unsupported selector for single-pass extraction: {selector}")
+
+
+def _element_matches(element: etree._Element, kind: str, name: str) -> bool:
+    """
+    Check whether an element matches a selector from _parse_simple_selector().
+    
+    Args:
+        element: lxml element
+        kind: Selector kind ('tag', 'class' or 'id')
+        name: Tag, class or id name
+        
+    Returns:
+        True if the element matches
+    """
+    if kind == 'tag':
+        return element.tag == name
+    if kind == 'class':
+        return name in (element.get('class') or '').split()
+    return element.get('id') == name
+
+
+def _is_html_content_type(content_type: Optional[str]) -> bool:
+    """
+    Check whether a Content-Type header value is an HTML media type.
+    
+    A missing header is assumed to be HTML.
+    
+    Args:
+        content_type: Content-Type header value, or None
+        
+    Returns:
+        True if the content should be parsed as HTML
+    """
+    if not content_type:
+        return True
+    return content_type.split(';', 1)[0].strip().lower() in _HTML_CONTENT_TYPES
+
+
+def _visible_text(element: etree._Element) -> List[str]:
+    """
+    Collect the text nodes below an element that get_text() would return.
+    
+    Text inside script, style, template and ruby annotation elements is left
+    out, while the text following those elements is kept.
+    
+    Args:
+        element: lxml element
+        
+    Returns:
+        Text nodes in document order
+    """
+    if next(element.iter(*_NON_TEXT_TAGS), None) is None:
+        return list(element.itertext())
+    return _VISIBLE_TEXT_XPATH(element)
+
+
+def _ends_mid_character(body: bytes, encoding: str) -> bool:
+    """
+    Check whether a body ends partway through a multi-byte character.
+    
+    lxml and Python's decoder disagree on how many replacement characters such
+    a tail produces, so callers fall back to decoding in Python.
+    
+    Args:
+        body: Raw (possibly truncated) response body
+        encoding: Character encoding of body
+        
+    Returns:
+        True if the final bytes are an incomplete character
+    """
+    try:
+        decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+        decoder.decode(body[-8:], final=False)
+    except (LookupError, UnicodeError):
+        # Codecs that need the start of the stream (UTF-16 without its BOM)
+        return False
+    return bool(decoder.getstate()[0])
+
+
+@lru_cache(maxsize=1024)
+def _compile_robots_pattern(pattern: str) -> Optional[re.Pattern]:
+    """
+    Compile a robots.txt path pattern to a regex, memoized per pattern.
+    
+    Args:
+        pattern: robots.txt pattern (may contain wildcards)
+        
+    Returns:
+        Compiled regex, or None if the pattern cannot be compiled
+    """
+    # robots.txt patterns are simple prefix matches with optional wildcards
+    # Convert to regex for proper matching
+    
+    # Escape special regex characters except * and $
+    escaped_pattern = re.escape(pattern)
+    
+    # Replace escaped wildcards with regex equivalents
+    escaped_pattern = escaped_pattern.replace(r'\*', '.*')
+    
+    # Handle end-of-line anchor
+    if escaped_pattern.endswith('$'):
+        escaped_pattern = escaped_pattern[:-1] + '$'
+    else:
+        # If no $ at end, pattern matches prefix
+        escaped_pattern = '^' + escaped_pattern
+    
+    # Add start anchor if not present
+    if not escaped_pattern.startswith('^'):
+        escaped_pattern = '^' + escaped_pattern
+    
+    try:
+        return re.compile(escaped_pattern)
+    except re.error:
+        return None
+
+
+def _robots_matcher(pattern: str) -> Union[str, re.Pattern]:
+    """
+    Build the matcher for a robots.txt pattern.
+    
+    Args:
+        pattern: robots.txt pattern (may contain wildcards)
+        
+    Returns:
+        Prefix string for patterns matched with str.startswith(), or a
+        compiled regex for wildcard patterns
+    """
+    # Without wildcards the pattern is a plain prefix ('$' is matched
+    # literally, as in the regex translation)
+    if '*' not in pattern:
+        return pattern
+    
+    compiled_pattern = _compile_robots_pattern(pattern)
+    if compiled_pattern is None:
+        # Invalid regex - fall back to simple prefix matching
+        return pattern.rstrip('*')
+    
+    return compiled_pattern
+
+
+def _robots_matcher_matches(matcher: Union[str, re.Pattern], path: str) -> bool:
+    """
+    Check a path against a matcher from _robots_matcher().
+    
+    Args:
+        matcher: Prefix string or compiled regex
+        path: URL path to check
+        
+    Returns:
+        True if path matches
+    """
+    if isinstance(matcher, str):
+        return path.startswith(matcher)
+    return matcher.match(path) is not None
+
+
+_CHARSET_VALUE_TERMINATORS = frozenset(b'"\'> \t\n\r\f\v')
+
+
+def _find_meta_charset(sample: bytes) -> Optional[bytes]:
+    """
+    Find a <meta> charset declaration with plain byte scanning.
+    
+    Handles both <meta charset="..."> and the http-equiv content form. Returns
+    None when no declaration is found, leaving odd markup to the regex.
+    
+    Args:
+        sample: Leading bytes of the document
+        
+    Returns:
+        Declared charset bytes, or None
+    """
+    lowered = sample.lower()
+    index = lowered.find(b'charset')
+    
+    while index != -1:
+        # Only count occurrences inside an unclosed <meta ...> tag
+        tag_start = lowered.rfind(b'<', 0, index)
+        if tag_start != -1 and lowered.startswith(b'<meta', tag_start) and lowered.find(b'>', tag_start, index) == -1:
+            position = index + len(b'charset')
+            
+            # Skip '=' and whitespace, then an optional opening quote
+            while position < len(sample) and sample[position] in b'= \t\n\r\f\v':
+                position += 1
+            if position < len(sample) and sample[position] in b'"\'':
+                position += 1
+            
+            end = position
+            while end < len(sample) and sample[end] not in _CHARSET_VALUE_TERMINATORS:
+                end += 1
+            if end > position:
+                return sample[position:end]
+        
+        index = lowered.find(b'charset', index + 1)
+    
+    return None
+
+
+def _known_encoding(name: Optional[str]) -> Optional[str]:
+    """
+    Validate an encoding name against Python's codec registry.
+    
+    Args:
+        name: Declared or detected encoding name
+        
+    Returns:
+        The name unchanged if Python can decode it, otherwise None
+    """
+    if not name:
+        return None
+    try:
+        codecs.lookup(name)
+        return name
+    except LookupError:
+        return None
+
+
+def _title_clean_replacement(match: re.Match) -> str:
+    """Replacement for _TITLE_CLEAN_RE: whitespace runs become one space, suffixes are dropped."""
+    return ' ' if match.lastindex == 1 else ''
+
+
+def _format_timestamp_ns(timestamp_ns: int) -> str:
+    """
+    Format a nanosecond epoch timestamp as an ISO 8601 local time string.
+    
+    Args:
+        timestamp_ns: Nanoseconds since the epoch, as returned by time.time_ns()
+        
+    Returns:
+        Timestamp string in the same format as datetime.isoformat()
+    """
+    seconds, nanos = divmod(timestamp_ns, 1_000_000_000)
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(seconds))}.{nanos // 1000:06d}"
 
 
 # Custom exception classes for scraping errors
@@ -37,7 +348,26 @@ class ScrapingError(Exception):
         super().__init__(message)
         self.url = url
         self.retry_after = retry_after
-        self.timestamp = datetime.now()
+        self.timestamp_ns = time.time_ns()
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Local time the error was raised, built on demand from timestamp_ns."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
+    
+    @property
+    def timestamp_iso(self) -> str:
+        """ISO 8601 local timestamp with microseconds, without building a datetime."""
+        return _format_timestamp_ns(self.timestamp_ns)
+    
+    def error_attributes(self) -> Dict[str, Any]:
+        """
+        Get the error-specific attributes to include in structured error logs.
+        
+        Returns:
+            Dictionary of attribute names to values
+        """
+        return {'retry_after': self.retry_after}
 
 
 class NetworkError(ScrapingError):
@@ -46,6 +376,9 @@ class NetworkError(ScrapingError):
     def __init__(self, message: str, url: str = None, status_code: int = None):
         super().__init__(message, url)
         self.status_code = status_code
+    
+    def error_attributes(self) -> Dict[str, Any]:
+        return {'status_code': self.status_code, 'retry_after': self.retry_after}
 
 
 class ParseError(ScrapingError):
@@ -54,6 +387,9 @@ class ParseError(ScrapingError):
     def __init__(self, message: str, url: str = None, content_length: int = None):
         super().__init__(message, url)
         self.content_length = content_length
+    
+    def error_attributes(self) -> Dict[str, Any]:
+        return {'content_length': self.content_length, 'retry_after': self.retry_after}
 
 
 class RobotsError(ScrapingError):
@@ -62,6 +398,9 @@ class RobotsError(ScrapingError):
     def __init__(self, message: str, url: str = None, robots_url: str = None):
         super().__init__(message, url)
         self.robots_url = robots_url
+    
+    def error_attributes(self) -> Dict[str, Any]:
+        return {'robots_url': self.robots_url, 'retry_after': self.retry_after}
 
 
 class ConfigurationError(ScrapingError):
@@ -69,6 +408,11 @@ class ConfigurationError(ScrapingError):
     pass
 
 
+class DatabaseError(ScrapingError):
+    """Database storage errors raised while persisting scraped content."""
+    pass
+
+
 @dataclass
 class RequestMetrics:
     """Metrics collected for HTTP requests."""
@@ -81,7 +425,7 @@ class RequestMetrics:
     error: str = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class ErrorDecision:
     """Decision for how to handle a specific error."""
     should_retry: bool
@@ -108,6 +452,55 @@ class ErrorDecisionEngine:
     | Database error | Yes | No | CRITICAL | Yes |
     """
     
+    # Decisions are immutable value objects, so each outcome is built once and shared
+    NETWORK_CLIENT_ERROR = ErrorDecision(
+        should_retry=False, should_continue=True, log_level='ERROR',
+        count_as_failure=True, recovery_action='skip_url'
+    )
+    NETWORK_RETRY = ErrorDecision(
+        should_retry=True, should_continue=True, log_level='WARNING',
+        count_as_failure=False, recovery_action='retry_with_backoff'
+    )
+    NETWORK_EXHAUSTED = ErrorDecision(
+        should_retry=False, should_continue=True, log_level='WARNING',
+        count_as_failure=True, recovery_action='skip_url'
+    )
+    PARSE_ERROR = ErrorDecision(
+        should_retry=False, should_continue=True, log_level='ERROR',
+        count_as_failure=False,  # Parse errors don't count as failures
+        recovery_action='save_partial_content'
+    )
+    ROBOTS_ERROR = ErrorDecision(
+        should_retry=False, should_continue=True, log_level='WARNING',
+        count_as_failure=False,  # Robots.txt violations are skips, not failures
+        recovery_action='skip_url'
+    )
+    CONFIGURATION_ERROR = ErrorDecision(
+        should_retry=False,
+        should_continue=False,  # Configuration errors require manual intervention
+        log_level='CRITICAL', count_as_failure=True, recovery_action='stop_execution'
+    )
+    DATABASE_RETRY = ErrorDecision(
+        should_retry=True, should_continue=False, log_level='CRITICAL',
+        count_as_failure=True, recovery_action='retry_database_operation'
+    )
+    DATABASE_EXHAUSTED = ErrorDecision(
+        should_retry=False, should_continue=True, log_level='CRITICAL',
+        count_as_failure=True, recovery_action='stop_execution'
+    )
+    UNKNOWN_ERROR = ErrorDecision(
+        should_retry=False, should_continue=True, log_level='ERROR',
+        count_as_failure=True, recovery_action='skip_url'
+    )
+    
+    _LOG_LEVELS = {
+        'DEBUG': logging.DEBUG,
+        'INFO': logging.INFO,
+        'WARNING': logging.WARNING,
+        'ERROR': logging.ERROR,
+        'CRITICAL': logging.CRITICAL
+    }
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize error decision engine with configuration.
@@ -128,6 +521,23 @@ class ErrorDecisionEngine:
             'Unknown': 0
         }
         self.total_requests = 0
+        # Concurrent URL workers report errors through the same engine
+        self._counts_lock = threading.Lock()
+        
+        # Error rates are recomputed only after the counts change
+        self._rates_cache = None
+        self._rates_dirty = True
+        
+        # Decision matrix keyed by exception class, resolved along the MRO
+        self._handlers = {
+            NetworkError: self._handle_network_error,
+            ParseError: self._handle_parse_error,
+            RobotsError: self._handle_robots_error,
+            ConfigurationError: self._handle_configuration_error,
+            DatabaseError: self._handle_database_error,
+            psycopg2.Error: self._handle_database_error
+        }
+        self._handler_cache = {}
     
     def get_error_decision(self, error: Exception, context: Dict[str, Any] = None) -> ErrorDecision:
         """
@@ -145,103 +555,73 @@ class ErrorDecisionEngine:
         max_retries = context.get('max_retries', 3)
         
         # Update error tracking
-        error_type = type(error).__name__
-        self.error_counts[error_type] = self.error_counts.get(error_type, 0) + 1
-        self.total_requests += 1
+        error_class = type(error)
+        error_type = error_class.__name__
+        with self._counts_lock:
+            self.error_counts[error_type] = self.error_counts.get(error_type, 0) + 1
+            self.total_requests += 1
+            self._rates_dirty = True
         
         # Apply decision matrix based on error type
-        if isinstance(error, NetworkError):
-            return self._handle_network_error(error, attempt_number, max_retries, context)
-        elif isinstance(error, ParseError):
-            return self._handle_parse_error(error, context)
-        elif isinstance(error, RobotsError):
-            return self._handle_robots_error(error, context)
-        elif isinstance(error, ConfigurationError):
-            return self._handle_configuration_error(error, context)
-        elif 'database' in str(error).lower() or 'psycopg2' in str(error).lower():
-            return self._handle_database_error(error, attempt_number, max_retries, context)
-        else:
-            return self._handle_unknown_error(error, context)
+        return self._get_handler(error_class)(error, attempt_number, max_retries, context)
+    
+    def _get_handler(self, error_class: type) -> Callable[..., ErrorDecision]:
+        """
+        Resolve the decision handler for an exception class, memoized per class.
+        
+        Args:
+            error_class: Concrete exception class
+            
+        Returns:
+            Bound handler method
+        """
+        handler = self._handler_cache.get(error_class)
+        if handler is None:
+            handler = self._handle_unknown_error
+            for base_class in error_class.__mro__:
+                if base_class in self._handlers:
+                    handler = self._handlers[base_class]
+                    break
+            self._handler_cache[error_class] = handler
+        return handler
     
     def _handle_network_error(self, error: NetworkError, attempt_number: int, max_retries: int, context: Dict[str, Any]) -> ErrorDecision:
         """Handle network errors (timeouts, connection failures, HTTP 5xx)."""
         
         # Check if this is a client error (4xx) or server error (5xx)
-        status_code = getattr(error, 'status_code', None)
+        status_code = error.status_code
         
         if status_code and 400 <= status_code < 500:
             # HTTP 4xx - No retry, Continue, ERROR, Count as failure
-            return ErrorDecision(
-                should_retry=False,
-                should_continue=True,
-                log_level='ERROR',
-                count_as_failure=True,
-                recovery_action='skip_url'
-            )
-        else:
-            # Network timeout or HTTP 5xx - Retry until max, Continue, WARNING, No failure until max retries
-            should_retry = attempt_number < max_retries
-            count_as_failure = not should_retry  # Only count as failure if we've exhausted retries
-            
-            return ErrorDecision(
-                should_retry=should_retry,
-                should_continue=True,
-                log_level='WARNING',
-                count_as_failure=count_as_failure,
-                recovery_action='retry_with_backoff' if should_retry else 'skip_url'
-            )
+            return self.NETWORK_CLIENT_ERROR
+        
+        # Network timeout or HTTP 5xx - Retry until max, Continue, WARNING, No failure until max retries
+        if attempt_number < max_retries:
+            return self.NETWORK_RETRY
+        return self.NETWORK_EXHAUSTED
     
-    def _handle_parse_error(self, error: ParseError, context: Dict[str, Any]) -> ErrorDecision:
+    def _handle_parse_error(self, error: ParseError, attempt_number: int, max_retries: int, context: Dict[str, Any]) -> ErrorDecision:
         """Handle content parsing and extraction errors."""
-        return ErrorDecision(
-            should_retry=False,
-            should_continue=True,
-            log_level='ERROR',
-            count_as_failure=False,  # Parse errors don't count as failures
-            recovery_action='save_partial_content'
-        )
+        return self.PARSE_ERROR
     
-    def _handle_robots_error(self, error: RobotsError, context: Dict[str, Any]) -> ErrorDecision:
+    def _handle_robots_error(self, error: RobotsError, attempt_number: int, max_retries: int, context: Dict[str, Any]) -> ErrorDecision:
         """Handle robots.txt compliance violations."""
-        return ErrorDecision(
-            should_retry=False,
-            should_continue=True,
-            log_level='WARNING',
-            count_as_failure=False,  # Robots.txt violations are skips, not failures
-            recovery_action='skip_url'
-        )
+        return self.ROBOTS_ERROR
     
-    def _handle_configuration_error(self, error: ConfigurationError, context: Dict[str, Any]) -> ErrorDecision:
+    def _handle_configuration_error(self, error: ConfigurationError, attempt_number: int, max_retries: int, context: Dict[str, Any]) -> ErrorDecision:
         """Handle scraping configuration errors."""
-        return ErrorDecision(
-            should_retry=False,
-            should_continue=False,  # Configuration errors require manual intervention
-            log_level='CRITICAL',
-            count_as_failure=True,
-            recovery_action='stop_execution'
-        )
+        return self.CONFIGURATION_ERROR
     
     def _handle_database_error(self, error: Exception, attempt_number: int, max_retries: int, context: Dict[str, Any]) -> ErrorDecision:
         """Handle database-related errors."""
-        should_retry = attempt_number < max_retries
-        
-        return ErrorDecision(
-            should_retry=should_retry,
-            should_continue=not should_retry,  # Stop if we can't retry
-            log_level='CRITICAL',
-            count_as_failure=True,
-            recovery_action='retry_database_operation' if should_retry else 'stop_execution'
-        )
+        # Stop if we can't retry
+        if attempt_number < max_retries:
+            return self.DATABASE_RETRY
+        return self.DATABASE_EXHAUSTED
     
-    def _handle_unknown_error(self, error: Exception, context: Dict[str, Any]) -> ErrorDecision:
+    def _handle_unknown_error(self, error: Exception, attempt_number: int, max_retries: int, context: Dict[str, Any]) -> ErrorDecision:
         """Handle unexpected/unknown errors."""
-        return ErrorDecision(
-            should_retry=False,
-            should_continue=True,
-            log_level='ERROR',
-            count_as_failure=True,
-            recovery_action='skip_url'
-        )
+        return self.UNKNOWN_ERROR
     
     def get_error_rates(self) -> Dict[str, float]:
         """
@@ -250,13 +630,37 @@ class ErrorDecisionEngine:
         Returns:
             Dictionary with error rates (0.0-1.0) by error type
         """
-        if self.total_requests == 0:
-            return {error_type: 0.0 for error_type in self.error_counts.keys()}
+        return dict(self._get_cached_error_rates())
+    
+    def get_error_counts(self) -> Tuple[Dict[str, int], int]:
+        """
+        Get a consistent snapshot of the error counts.
         
-        return {
-            error_type: count / self.total_requests 
-            for error_type, count in self.error_counts.items()
-        }
+        Returns:
+            Tuple of (error counts by type, total requests)
+        """
+        with self._counts_lock:
+            return dict(self.error_counts), self.total_requests
+    
+    def _get_cached_error_rates(self) -> Dict[str, float]:
+        """
+        Get error rates, recomputing them only if counts changed since the last call.
+        
+        Returns:
+            Shared error rates dictionary (callers must not modify it)
+        """
+        with self._counts_lock:
+            if self._rates_dirty:
+                if self.total_requests == 0:
+                    self._rates_cache = {error_type: 0.0 for error_type in self.error_counts.keys()}
+                else:
+                    self._rates_cache = {
+                        error_type: count / self.total_requests 
+                        for error_type, count in self.error_counts.items()
+                    }
+                self._rates_dirty = False
+            
+            return self._rates_cache
     
     def log_error_with_context(self, error: Exception, context: Dict[str, Any], decision: ErrorDecision) -> None:
         """
@@ -267,12 +671,24 @@ class ErrorDecisionEngine:
             context: Context information
             decision: Error handling decision
         """
+        # Skip building the error data entirely if this level is filtered out
+        log_level = self._LOG_LEVELS.get(decision.log_level, logging.ERROR)
+        if not self.logger.isEnabledFor(log_level):
+            return
+        
+        if isinstance(error, ScrapingError):
+            url = error.url
+            timestamp_ns = error.timestamp_ns
+        else:
+            url = context.get('url', 'unknown')
+            timestamp_ns = time.time_ns()
+        
         # Build comprehensive error data structure
         error_data = {
             'error_type': type(error).__name__,
             'message': str(error),
-            'url': getattr(error, 'url', context.get('url', 'unknown')),
-            'timestamp': getattr(error, 'timestamp', datetime.now()).isoformat(),
+            'url': url,
+            'timestamp': _format_timestamp_ns(timestamp_ns),
             'decision': {
                 'should_retry': decision.should_retry,
                 'should_continue': decision.should_continue,
@@ -280,35 +696,20 @@ class ErrorDecisionEngine:
                 'recovery_action': decision.recovery_action
             },
             'context': context,
-            'error_rates': self.get_error_rates()
+            'error_rates': self._get_cached_error_rates()
         }
         
         # Add error-specific attributes
-        if hasattr(error, 'status_code'):
-            error_data['status_code'] = error.status_code
-        if hasattr(error, 'content_length'):
-            error_data['content_length'] = error.content_length
-        if hasattr(error, 'robots_url'):
-            error_data['robots_url'] = error.robots_url
-        if hasattr(error, 'retry_after'):
-            error_data['retry_after'] = error.retry_after
-        
-        # Log at appropriate level based on decision
-        log_message = f"Scraping error: {error_data}"
-        
-        if decision.log_level == 'DEBUG':
-            self.logger.debug(log_message)
-        elif decision.log_level == 'INFO':
-            self.logger.info(log_message)
-        elif decision.log_level == 'WARNING':
-            self.logger.warning(log_message)
-        elif decision.log_level == 'ERROR':
-            self.logger.error(log_message)
-        elif decision.log_level == 'CRITICAL':
-            self.logger.critical(log_message)
-        else:
-            # Fallback to error level
-            self.logger.error(log_message)
+        if isinstance(error, ScrapingError):
+            error_data.update(error.error_attributes())
+        
+        # Log at appropriate level based on decision; the full structure travels
+        # on the record as `error_data` for structured (e.g. JSON) formatters
+        self.logger.log(
+            log_level, "Scraping error: %s for %s: %s",
+            error_data['error_type'], error_data['url'], error_data['message'],
+            extra={'error_data': error_data}
+        )
 
 
 class HTTPClient:
@@ -316,7 +717,7 @@ class HTTPClient:
     HTTP client with retry logic, session management, and comprehensive error handling.
     
     This class provides robust HTTP request capabilities including:
-    - Persistent session with connection pooling
+    - Persistent per-thread sessions with connection pooling
     - Intelligent retry logic with exponential backoff
     - Request/response metrics collection
     - Configurable timeouts and delays
@@ -334,6 +735,9 @@ class HTTPClient:
                 - retry_delay: Base delay between retries in seconds
                 - user_agent: User agent string for requests
                 - delay_between_requests: Delay between consecutive requests
+                - max_content_size: Maximum response body size to download in bytes
+                - pool_connections: Number of hosts whose keep-alive connections are kept
+                - pool_maxsize: Keep-alive connections kept per host
         """
         self.config = config
         self.logger = get_logger(__name__)
@@ -342,43 +746,66 @@ class HTTPClient:
         self.timeout = config.get('timeout', 30)
         self.max_retries = config.get('retry_attempts', 3)
         self.base_retry_delay = config.get('retry_delay', 5)
+        self._base_retry_delay_ms = int(round(self.base_retry_delay * 1000))
+        self._max_retry_delay_ms = 60_000
         self.user_agent = config.get('user_agent', 'WebScraper/1.0')
         self.request_delay = config.get('delay_between_requests', 1)
-        
-        # Session management
-        self.session = None
+        self.max_content_size = config.get('max_content_size', 10 * 1024 * 1024)  # 10MB
+        self.pool_connections = config.get('pool_connections', 32)
+        self.pool_maxsize = config.get('pool_maxsize', 32)
+        
+        # Session management: requests.Session is not thread-safe, so each thread
+        # gets its own; close() closes them all and bumps the generation so
+        # threads create fresh sessions on their next request
+        self._local = threading.local()
+        self._sessions: List[requests.Session] = []
+        self._session_generation = 0
         self._session_lock = threading.Lock()
-        self._last_request_time = 0
+        # Earliest time.monotonic() at which each host may be requested again; the
+        # single per-host schedule for every caller, including concurrent URL workers
+        self._next_request_times: Dict[str, float] = {}
+        self._schedule_lock = threading.Lock()
+        
+        # Set on shutdown to interrupt retry backoff waits
+        self._shutdown = threading.Event()
         
-        # Request metrics
+        # Request metrics, updated from concurrent URL workers
         self.total_requests = 0
         self.successful_requests = 0
         self.failed_requests = 0
+        self._stats_lock = threading.Lock()
         
         self.logger.info(f"HTTPClient initialized with timeout={self.timeout}s, "
                         f"max_retries={self.max_retries}, user_agent='{self.user_agent}'")
     
     @log_performance
-    def fetch_url(self, url: str, if_modified_since: str = None) -> Tuple[requests.Response, RequestMetrics]:
+    def fetch_url(self, url: str, if_modified_since: str = None, crawl_delay: float = 0.0,
+                  html_only: bool = False) -> Tuple[requests.Response, RequestMetrics]:
         """
         Fetch URL with retry logic and comprehensive error handling.
         
         Args:
             url: URL to fetch
             if_modified_since: Optional If-Modified-Since header value for conditional requests
+            crawl_delay: robots.txt Crawl-delay for the host; the next request to the
+                host waits for the longer of this and the configured request delay
+            html_only: If True, a response whose Content-Type is not HTML is
+                returned with an empty body, which is never downloaded
             
         Returns:
             Tuple of (response, metrics) for successful requests
             
         Raises:
             NetworkError: For network-related failures
+            ParseError: If the response body exceeds max_content_size
             ScrapingError: For other scraping-related failures
         """
-        self.total_requests += 1
+        with self._stats_lock:
+            self.total_requests += 1
         start_time = time.time()
         
-        # Ensure minimum delay between requests
-        self._apply_request_delay()
+        # Ensure minimum delay between requests to the same host
+        self._apply_request_delay(get_host(url), crawl_delay)
         
         # Get or create session
         session = self._get_session()
@@ -399,8 +826,21 @@ class HTTPClient:
                     headers['If-Modified-Since'] = if_modified_since
                     self.logger.debug(f"Adding If-Modified-Since header: {if_modified_since}")
                 
-                # Make the request
-                response = session.get(url, timeout=self.timeout, headers=headers)
+                # Make the request, deferring the body download until status is known
+                response = session.get(url, timeout=self.timeout, headers=headers, stream=True)
+                
+                # Download the body only for responses we are going to use. The
+                # headers are already in, so non-HTML bodies (images, PDFs, video)
+                # can be skipped before a byte of them is read
+                if response.status_code >= 300:
+                    response.close()
+                elif html_only and not _is_html_content_type(response.headers.get('content-type')):
+                    self.logger.debug(f"Not downloading {response.headers.get('content-type')} body of {url}")
+                    response.close()
+                    response._content = b''
+                    response._content_consumed = True
+                else:
+                    self._read_body(response, url)
                 
                 # Calculate metrics
                 response_time_ms = max(1, int((time.time() - request_start) * 1000))
@@ -418,7 +858,7 @@ class HTTPClient:
                 # Handle 304 Not Modified response (success for conditional requests)
                 if response.status_code == 304:
                     self._log_request_metrics(metrics)
-                    self.successful_requests += 1
+                    self._count_result(successful=True)
                     self.logger.debug(f"Content not modified for {url} (304 response)")
                     return response, metrics
                 
@@ -429,19 +869,20 @@ class HTTPClient:
                     
                     # Decide whether to retry based on status code
                     if self._should_retry_status_code(response.status_code) and attempt < self.max_retries:
-                        self.logger.warning(f"{error_msg}, retrying in {self._calculate_retry_delay(attempt)}s")
-                        self._wait_for_retry(attempt)
+                        retry_delay = self._calculate_retry_delay(attempt)
+                        self.logger.warning(f"{error_msg}, retrying in {retry_delay}s")
+                        self._wait_for_retry(retry_delay)
                         continue
                     else:
                         # Don't retry 4xx errors (except 429) - fail immediately
                         metrics.error = error_msg
                         self._log_request_metrics(metrics)
-                        self.failed_requests += 1
+                        self._count_result(successful=False)
                         raise NetworkError(error_msg, url, response.status_code)
                 
                 # Success!
                 self._log_request_metrics(metrics)
-                self.successful_requests += 1
+                self._count_result(successful=True)
                 self.logger.debug(f"Successfully fetched {url} ({content_length} bytes, {response_time_ms}ms)")
                 
                 return response, metrics
@@ -453,14 +894,19 @@ class HTTPClient:
                 if attempt < self.max_retries and self._should_retry(e):
                     retry_delay = self._calculate_retry_delay(attempt)
                     self.logger.warning(f"{error_msg}, retrying in {retry_delay}s")
-                    self._wait_for_retry(attempt)
+                    self._wait_for_retry(retry_delay)
                     continue
                 else:
                     # Max retries reached or non-retryable error
                     break
                     
-            except NetworkError:
-                # Re-raise NetworkError exceptions (from immediate 4xx failures)
+            except ParseError:
+                # Oversized body - retrying would download the same thing
+                self._count_result(successful=False)
+                raise
+                
+            except ScrapingError:
+                # Re-raise immediate failures (4xx responses, shutdown during backoff)
                 raise
                 
             except RequestException as e:
@@ -489,22 +935,87 @@ class HTTPClient:
         )
         
         self._log_request_metrics(metrics)
-        self.failed_requests += 1
+        self._count_result(successful=False)
         
         # Raise NetworkError with status code if we have it
         raise NetworkError(error_msg, url, last_status_code)
     
+    def _read_body(self, response: requests.Response, url: str) -> None:
+        """
+        Download a streamed response body, refusing bodies over max_content_size.
+        
+        The bytes read are stored on the response so response.content and
+        response.text behave as for a non-streamed request. Oversized bodies
+        fail the same way whether the size is declared up front or only found
+        while downloading, and the download stops at the limit.
+        
+        Args:
+            response: Streamed HTTP response object
+            url: Requested URL (for error reporting)
+            
+        Raises:
+            ParseError: If the declared Content-Length or the body read exceeds max_content_size
+        """
+        try:
+            declared_length = int(response.headers.get('Content-Length', 0))
+        except (TypeError, ValueError):
+            declared_length = 0
+        
+        if declared_length > self.max_content_size:
+            response.close()
+            raise ParseError(f"Content-Length {declared_length} for {url} exceeds maximum "
+                             f"content size {self.max_content_size}", url, declared_length)
+        
+        body = bytearray()
+        for chunk in response.iter_content(chunk_size=65536):
+            body.extend(chunk)
+            if len(body) > self.max_content_size:
+                response.close()
+                raise ParseError(f"Response body for {url} exceeds maximum content size "
+                                 f"{self.max_content_size}", url, len(body))
+        
+        response._content = bytes(body)
+        response._content_consumed = True
+    
+    def _count_result(self, successful: bool) -> None:
+        """
+        Count a finished request as successful or failed.
+        
+        Args:
+            successful: Whether the request succeeded
+        """
+        with self._stats_lock:
+            if successful:
+                self.successful_requests += 1
+            else:
+                self.failed_requests += 1
+    
+    @property
+    def session(self) -> Optional[requests.Session]:
+        """The calling thread's session, or None if it has not made a request since the last close()."""
+        local = self._local
+        if getattr(local, 'generation', None) != self._session_generation:
+            return None
+        return local.session
+    
     def _get_session(self) -> requests.Session:
         """
-        Get or create a requests session with proper configuration.
+        Get or create the calling thread's requests session.
         
         Returns:
             Configured requests session
         """
-        with self._session_lock:
-            if self.session is None:
-                self.session = self._create_session()
-            return self.session
+        session = self.session
+        if session is None:
+            with self._session_lock:
+                # The first session after close() re-arms retry backoff
+                if not self._sessions:
+                    self._shutdown.clear()
+                session = self._create_session()
+                self._sessions.append(session)
+                self._local.session = session
+                self._local.generation = self._session_generation
+        return session
     
     def _create_session(self) -> requests.Session:
         """
@@ -525,16 +1036,16 @@ class HTTPClient:
             'Upgrade-Insecure-Requests': '1',
         })
         
-        # Configure adapters for connection pooling
-        adapter = HTTPAdapter(
-            pool_connections=10,  # Number of connection pools
-            pool_maxsize=20,      # Number of connections per pool
-            max_retries=0,        # We handle retries manually
-            pool_block=False      # Don't block when pool is full
-        )
-        
-        session.mount('http://', adapter)
-        session.mount('https://', adapter)
+        # Configure adapters for connection pooling. Host pools beyond
+        # pool_connections are evicted, dropping their keep-alive connections,
+        # so it is sized for multi-host and concurrent sessions
+        for prefix in ('http://', 'https://'):
+            session.mount(prefix, HTTPAdapter(
+                pool_connections=self.pool_connections,  # Number of connection pools
+                pool_maxsize=self.pool_maxsize,          # Number of connections per pool
+                max_retries=0,                           # We handle retries manually
+                pool_block=False                         # Don't block when pool is full
+            ))
         
         self.logger.debug("Created new HTTP session with connection pooling")
         return session
@@ -602,45 +1113,67 @@ class HTTPClient:
         Returns:
             Delay in seconds
         """
-        # Exponential backoff: base_delay * (2 ^ attempt)
-        exponential_delay = self.base_retry_delay * (2 ** attempt)
+        # Exponential backoff in integer milliseconds: base_delay << attempt
+        exponential_delay_ms = self._base_retry_delay_ms << attempt
         
-        # Add jitter to prevent thundering herd (�25% of delay)
-        jitter_range = exponential_delay * 0.25
-        jitter = random.uniform(-jitter_range, jitter_range)
-        
-        # Calculate final delay with jitter
-        delay = exponential_delay + jitter
+        # Add jitter to prevent thundering herd (�25% of delay): a signed
+        # 16-bit sample scaled by delay / 2^17
+        jitter_ms = ((_get_thread_rng().getrandbits(16) - 0x8000) * exponential_delay_ms) >> 17
         
         # Cap maximum delay at 60 seconds
-        return min(delay, 60.0)
+        return min(exponential_delay_ms + jitter_ms, self._max_retry_delay_ms) / 1000
     
-    def _wait_for_retry(self, attempt: int) -> None:
+    def _wait_for_retry(self, delay: float) -> None:
         """
-        Wait for the calculated retry delay.
+        Wait for the calculated retry delay, returning early on shutdown.
         
         Args:
-            attempt: Current attempt number (0-based)
+            delay: Delay in seconds from _calculate_retry_delay()
+            
+        Raises:
+            ScrapingError: If shutdown was requested before or during the wait
         """
-        delay = self._calculate_retry_delay(attempt)
-        time.sleep(delay)
+        if self._shutdown.wait(delay):
+            raise ScrapingError("HTTP client shut down during retry backoff")
     
-    def _apply_request_delay(self) -> None:
+    def _apply_request_delay(self, host: str = '', crawl_delay: float = 0.0) -> None:
         """
         Apply configured delay between requests to be respectful to servers.
+        
+        The delay is tracked per host, so requests to other hosts don't wait.
+        Each caller reserves the host's next slot before sleeping, so concurrent
+        requests to one host are spaced out rather than released together.
+        
+        Args:
+            host: Host (netloc) about to be requested
+            crawl_delay: robots.txt Crawl-delay, used when longer than request_delay
         """
-        if self.request_delay <= 0:
+        delay = max(self.request_delay, crawl_delay or 0.0)
+        if delay <= 0:
             return
         
-        current_time = time.time()
-        time_since_last_request = current_time - self._last_request_time
+        with self._schedule_lock:
+            now = time.monotonic()
+            start = max(now, self._next_request_times.get(host, 0.0))
+            self._next_request_times[host] = start + delay
         
-        if time_since_last_request < self.request_delay:
-            sleep_time = self.request_delay - time_since_last_request
-            self.logger.debug(f"Applying request delay: {sleep_time:.2f}s")
+        sleep_time = start - now
+        if sleep_time > 0:
+            self.logger.debug("Applying request delay: %.2fs", sleep_time)
             time.sleep(sleep_time)
+    
+    def host_wait_time(self, host: str) -> float:
+        """
+        Get how long until host may be requested again, without reserving a slot.
         
-        self._last_request_time = time.time()
+        Args:
+            host: Host (netloc) about to be requested
+            
+        Returns:
+            Seconds until host may be requested again (0 or negative if already allowed)
+        """
+        with self._schedule_lock:
+            return self._next_request_times.get(host, 0.0) - time.monotonic()
     
     def _log_request_metrics(self, metrics: RequestMetrics) -> None:
         """
@@ -668,12 +1201,16 @@ class HTTPClient:
         Returns:
             Dictionary containing client statistics
         """
-        success_rate = (self.successful_requests / self.total_requests * 100) if self.total_requests > 0 else 0
+        with self._stats_lock:
+            total_requests = self.total_requests
+            successful_requests = self.successful_requests
+            failed_requests = self.failed_requests
+        success_rate = (successful_requests / total_requests * 100) if total_requests > 0 else 0
         
         return {
-            'total_requests': self.total_requests,
-            'successful_requests': self.successful_requests,
-            'failed_requests': self.failed_requests,
+            'total_requests': total_requests,
+            'successful_requests': successful_requests,
+            'failed_requests': failed_requests,
             'success_rate_percent': round(success_rate, 2),
             'configuration': {
                 'timeout': self.timeout,
@@ -684,15 +1221,26 @@ class HTTPClient:
             }
         }
     
+    def request_shutdown(self) -> None:
+        """
+        Interrupt any retry backoff in progress and make further retries fail fast.
+        
+        Safe to call from signal handlers and other threads.
+        """
+        self._shutdown.set()
+    
     def close(self) -> None:
         """
         Close the HTTP session and cleanup resources.
         """
+        self._shutdown.set()
         with self._session_lock:
-            if self.session:
-                self.session.close()
-                self.session = None
-                self.logger.debug("HTTP session closed")
+            for session in self._sessions:
+                session.close()
+            if self._sessions:
+                self.logger.debug(f"Closed {len(self._sessions)} HTTP sessions")
+            self._sessions.clear()
+            self._session_generation += 1
     
     def __enter__(self):
         """Context manager entry."""
@@ -729,6 +1277,15 @@ class ContentExtractor:
                 - min_content_length: Minimum content length threshold
                 - preserve_html: Whether to preserve HTML structure
                 - max_content_size: Maximum content size to process
+                - near_duplicate_threshold: Jaccard similarity above which content counts
+                  as a near-duplicate (MinHash signatures are only computed if set)
+                - stream_parse_threshold: Body size in bytes above which HTML is
+                  parsed incrementally
+                - content_hash_algorithm: Algorithm for content hashes ('sha256',
+                  'blake2b', 'blake3' or 'xxh3_128'); changing it invalidates stored hashes
+        
+        Raises:
+            ConfigurationError: If the content hash algorithm is not available
         """
         self.config = config
         self.logger = get_logger(__name__)
@@ -737,6 +1294,14 @@ class ContentExtractor:
         self.min_content_length = config.get('min_content_length', 100)
         self.preserve_html = config.get('preserve_html', False)
         self.max_content_size = config.get('max_content_size', 10 * 1024 * 1024)  # 10MB
+        self.stream_parse_threshold = config.get('stream_parse_threshold', 256 * 1024)  # 256KB
+        self._minhasher = MinHasher() if config.get('near_duplicate_threshold') else None
+        
+        self.hash_algorithm = config.get('content_hash_algorithm', 'sha256')
+        try:
+            calculate_content_hash("", self.hash_algorithm)
+        except ValueError as e:
+            raise ConfigurationError(str(e)) from e
         
         # Elements to remove during content cleaning
         self.remove_selectors = [
@@ -752,6 +1317,19 @@ class ContentExtractor:
             '.article-body', '.story-body'
         ]
         
+        # Compile selectors once: removal and content lookup each run as a single
+        # combined tree walk; the per-selector matchers rank content candidates
+        self._remove_selector = soupsieve.compile(', '.join(self.remove_selectors))
+        self._content_selector = soupsieve.compile(', '.join(self.content_selectors))
+        self._content_selectors = [soupsieve.compile(selector) for selector in self.content_selectors]
+        
+        # Parsed selectors for the single-pass lxml extraction walk
+        remove_specs = [_parse_simple_selector(sel) for sel in self.remove_selectors]
+        self._remove_tags = frozenset(name for kind, name in remove_specs if kind == 'tag')
+        self._remove_classes = frozenset(name for kind, name in remove_specs if kind == 'class')
+        self._remove_ids = frozenset(name for kind, name in remove_specs if kind == 'id')
+        self._content_specs = [_parse_simple_selector(sel) for sel in self.content_selectors]
+        
         self.logger.info(f"ContentExtractor initialized with min_length={self.min_content_length}, "
                         f"preserve_html={self.preserve_html}")
     
@@ -774,37 +1352,62 @@ class ContentExtractor:
         extraction_error = None
         
         try:
+            # Don't run the parse pipeline over binary responses
+            if not self._is_html_response(response):
+                return self._non_html_content(response, url, start_time)
+            
             # Detect and handle character encoding
             encoding = self._detect_encoding(response)
             
-            # Get content with proper encoding
-            if response.encoding != encoding:
-                response.encoding = encoding
-                content_text = response.text
-            else:
-                content_text = response.text
-            
-            # Validate content size
-            if len(content_text) > self.max_content_size:
-                self.logger.warning(f"Content size ({len(content_text)} bytes) exceeds maximum, truncating")
-                content_text = content_text[:self.max_content_size]
-            
-            # Parse HTML with error recovery
-            soup = self._create_soup(content_text)
-            
-            # Extract title using multiple strategies
-            title = self._extract_title(soup, url)
+            # lxml decodes the raw bytes itself, so the body is never materialized as
+            # a Python str; large documents are also parsed incrementally. HTML output
+            # keeps BeautifulSoup's serialization, which stored hashes were computed from
+            tree = None
+            if response.content and not self.preserve_html:
+                if len(response.content) > self.stream_parse_threshold:
+                    tree = self._stream_parse(response.content, encoding)
+                else:
+                    tree = self._parse_lxml_bytes(response.content, encoding)
             
-            # Extract and clean main content
-            content = self._extract_main_content(soup)
+            if tree is None:
+                # Get content with proper encoding
+                if response.encoding != encoding:
+                    response.encoding = encoding
+                    content_text = response.text
+                else:
+                    content_text = response.text
+                
+                # Validate content size
+                if len(content_text) > self.max_content_size:
+                    self.logger.warning(f"Content size ({len(content_text)} bytes) exceeds maximum, truncating")
+                    content_text = content_text[:self.max_content_size]
+                
+                # Parse with lxml directly; BeautifulSoup only handles documents lxml
+                # rejects, and HTML output
+                if not self.preserve_html:
+                    tree = self._parse_lxml(content_text)
+            
+            if tree is not None:
+                # Title and content come from a single walk over the tree
+                title, content = self._extract_all(tree, url)
+            else:
+                # Parse HTML with error recovery
+                soup = self._create_soup(content_text)
+                
+                # Extract title using multiple strategies (before content
+                # extraction, which strips header elements from the tree)
+                title = self._extract_title(soup, url)
+                
+                # Extract and clean main content
+                content = self._extract_main_content(soup)
             
             # Validate content
             if len(content.strip()) < self.min_content_length:
                 self.logger.warning(f"Extracted content is too short ({len(content)} chars) for {url}")
                 # Don't fail entirely, but flag it
             
-            # Calculate content hash
-            content_hash = calculate_content_hash(content)
+            # Calculate content hashes
+            content_hash, normalized_hash = calculate_content_hashes(content, self.hash_algorithm)
             
             # Extract Last-Modified header if present
             last_modified = self._extract_last_modified(response)
@@ -818,10 +1421,12 @@ class ContentExtractor:
                 title=title,
                 content=content,
                 content_hash=content_hash,
+                normalized_hash=normalized_hash,
                 response_status=response.status_code,
                 response_time_ms=response_time_ms,
                 content_length=len(response.content) if response.content else 0,
-                last_modified=last_modified
+                last_modified=last_modified,
+                minhash_signature=self._minhasher.signature(content) if self._minhasher else None
             )
             
             self.logger.info(f"Content extracted successfully from {url}: "
@@ -850,41 +1455,110 @@ class ContentExtractor:
             
             return scraped_content
     
+    def _is_html_response(self, response: requests.Response) -> bool:
+        """
+        Check whether the response declares an HTML media type.
+        
+        Args:
+            response: HTTP response object
+            
+        Returns:
+            True if the content should be parsed as HTML
+        """
+        return _is_html_content_type(response.headers.get('content-type'))
+    
+    def _non_html_content(self, response: requests.Response, url: str, start_time: float) -> ScrapedContent:
+        """
+        Build an empty ScrapedContent for a response that is not HTML.
+        
+        Args:
+            response: HTTP response object
+            url: Original URL
+            start_time: Extraction start time, for the response time fallback
+            
+        Returns:
+            ScrapedContent with empty content
+        """
+        self.logger.info(f"Skipping extraction for non-HTML response from {url}: "
+                        f"{response.headers.get('content-type')}")
+        
+        return ScrapedContent(
+            url=url,
+            title=self._generate_fallback_title(url),
+            content="",
+            content_hash=calculate_content_hash(""),
+            response_status=response.status_code,
+            response_time_ms=getattr(response, '_response_time_ms',
+                                      int((time.time() - start_time) * 1000)),
+            content_length=len(response.content) if response.content else 0,
+            last_modified=self._extract_last_modified(response)
+        )
+    
     def _detect_encoding(self, response: requests.Response) -> str:
         """
         Detect character encoding from response headers and content.
         
+        Declared encodings are cheap and almost always right, so statistical
+        detection only runs on a bounded prefix when neither the Content-Type
+        header nor a meta tag declares a charset Python can decode, and the
+        prefix is not valid UTF-8. An ISO-8859-1 header is often a server default
+        rather than a declaration, so it only applies once the meta tags and the
+        UTF-8 check have had their say.
+        
         Args:
             response: HTTP response object
             
         Returns:
             Detected encoding string
         """
-        # Try encoding from HTTP headers first
-        if response.encoding and response.encoding.lower() != 'iso-8859-1':
-            return response.encoding
+        # Try charset declared in the Content-Type header first
+        content_type = response.headers.get('content-type', '')
+        header_match = _CHARSET_HEADER_RE.search(content_type)
+        header_charset = _known_encoding(header_match.group(1)) if header_match else None
+        if header_charset and codecs.lookup(header_charset).name != 'iso8859-1':
+            return header_charset
         
         # Try encoding from content meta tags
         if response.content:
             # Look for charset in meta tags
             content_sample = response.content[:1024]  # First 1KB should contain meta tags
             
-            # Check for charset in meta http-equiv
-            charset_match = re.search(rb'<meta[^>]+charset[=\s]*["\']?([^"\'>\s]+)', content_sample, re.IGNORECASE)
-            if charset_match:
-                charset = charset_match.group(1).decode('ascii', errors='ignore')
-                return charset
+            # Check for charset in meta tags, scanning bytes directly and only
+            # using the regex for markup the scan doesn't recognize
+            declared_charset = _find_meta_charset(content_sample)
+            if declared_charset is None and b'charset' in content_sample.lower():
+                charset_match = _META_CHARSET_RE.search(content_sample)
+                declared_charset = charset_match.group(1) if charset_match else None
+            if declared_charset:
+                charset = _known_encoding(declared_charset.decode('ascii', errors='ignore'))
+                if charset:
+                    return charset
+            
+            # Most undeclared pages are UTF-8; a strict decode of the prefix is far
+            # cheaper than statistical detection. A multi-byte sequence cut off at
+            # the end of the prefix is not an error (final=False).
+            detection_sample = response.content[:8192]
+            try:
+                codecs.getincrementaldecoder('utf-8')().decode(detection_sample, final=False)
+                return 'utf-8'
+            except UnicodeDecodeError:
+                pass
+            
+            if header_charset:
+                return header_charset
             
-            # Use chardet for automatic detection as last resort
+            # Use statistical detection on a bounded prefix as last resort
             try:
-                detected = chardet.detect(content_sample)
-                if detected and detected['confidence'] > 0.7:
-                    return detected['encoding']
+                detected = encoding_detector.detect(detection_sample)
+                if detected and (detected.get('confidence') or 0) > 0.7:
+                    encoding = _known_encoding(detected.get('encoding'))
+                    if encoding:
+                        return encoding
             except Exception:
                 pass
         
         # Default fallback
-        return 'utf-8'
+        return header_charset or 'utf-8'
     
     def _create_soup(self, content: str) -> BeautifulSoup:
         """
@@ -959,12 +1633,9 @@ class ContentExtractor:
         Returns:
             Cleaned title string
         """
-        # Remove excessive whitespace
-        title = re.sub(r'\s+', ' ', title.strip())
-        
-        # Remove common title suffixes (site names, etc.)
-        # This could be made configurable in the future
-        title = re.sub(r'\s*[-|–—]\s*[^-|–—]*$', '', title)
+        # Collapse whitespace and remove common title suffixes (site names, etc.)
+        # in a single scan. The suffix rule could be made configurable in the future
+        title = _TITLE_CLEAN_RE.sub(_title_clean_replacement, title).strip()
         
         # Truncate if too long
         if len(title) > 200:
@@ -983,7 +1654,7 @@ class ContentExtractor:
             Generated title string
         """
         try:
-            parsed = urlparse(url)
+            parsed = parse_url(url)
             
             # Use path for title if available
             if parsed.path and parsed.path != '/':
@@ -1005,34 +1676,38 @@ class ContentExtractor:
         """
         Extract main content from HTML, removing navigation and boilerplate.
         
+        Unwanted elements are decomposed in place, so the soup must not be used
+        for anything else (such as title extraction) afterwards.
+        
         Args:
             soup: BeautifulSoup object
             
         Returns:
             Extracted content string
         """
-        # Create a copy to avoid modifying the original
-        content_soup = BeautifulSoup(str(soup), soup.original_encoding or 'html.parser')
-        
         # Remove unwanted elements
-        for selector in self.remove_selectors:
-            for element in content_soup.select(selector):
-                element.decompose()
+        for element in self._remove_selector.select(soup):
+            element.decompose()
         
-        # Try to find main content area
+        # Find the main content area in one walk, preferring earlier selectors
+        # and document order within a selector
         content_element = None
-        for selector in self.content_selectors:
-            content_element = content_soup.select_one(selector)
-            if content_element:
+        best_rank = len(self._content_selectors)
+        for candidate in self._content_selector.select(soup):
+            for rank in range(best_rank):
+                if self._content_selectors[rank].match(candidate):
+                    content_element, best_rank = candidate, rank
+                    break
+            if best_rank == 0:
                 break
         
         # If no specific content area found, use body
         if not content_element:
-            content_element = content_soup.find('body')
+            content_element = soup.find('body')
         
         # Last resort: use the entire document
         if not content_element:
-            content_element = content_soup
+            content_element = soup
         
         # Extract text or HTML based on configuration
         if self.preserve_html:
@@ -1041,35 +1716,292 @@ class ContentExtractor:
             content = content_element.get_text(separator=' ', strip=True)
         
         # Clean up whitespace
-        content = re.sub(r'\s+', ' ', content.strip())
+        content = _WHITESPACE_RE.sub(' ', content.strip())
         
         return content
     
-    def _extract_last_modified(self, response: requests.Response) -> Optional[str]:
+    def _parse_lxml(self, content: str) -> Optional[etree._Element]:
         """
-        Extract Last-Modified header from HTTP response.
+        Parse HTML with lxml directly.
         
         Args:
-            response: HTTP response object
+            content: HTML content string
             
         Returns:
-            Last-Modified header value or None if not present
+            Root element, or None if lxml cannot parse the document
         """
         try:
-            last_modified = response.headers.get('Last-Modified')
-            if last_modified:
-                self.logger.debug(f"Found Last-Modified header: {last_modified}")
-                return last_modified
-            else:
-                self.logger.debug("No Last-Modified header found")
-                return None
-        except Exception as e:
-            self.logger.warning(f"Error extracting Last-Modified header: {e}")
+            return lxml.html.fromstring(content)
+        except (etree.ParserError, ValueError):
+            # Empty documents and strings with an XML encoding declaration
             return None
-
-
-class RobotChecker:
-    """
+    
+    def _parse_lxml_bytes(self, body: bytes, encoding: str) -> Optional[etree._Element]:
+        """
+        Parse an HTML body with lxml without decoding it in Python first.
+        
+        Args:
+            body: Raw response body
+            encoding: Character encoding of body
+            
+        Returns:
+            Root element, or None if lxml cannot parse the document
+        """
+        if len(body) > self.max_content_size:
+            self.logger.warning(f"Content size ({len(body)} bytes) exceeds maximum, truncating")
+            body = body[:self.max_content_size]
+        
+        if _ends_mid_character(body, encoding):
+            return None
+        
+        try:
+            return lxml.html.fromstring(body, parser=lxml.html.HTMLParser(encoding=encoding))
+        except (etree.ParserError, LookupError, ValueError):
+            return None
+    
+    def _stream_parse(self, body: bytes, encoding: str) -> Optional[etree._Element]:
+        """
+        Parse a large HTML document incrementally, keeping only what extraction needs.
+        
+        Subtrees matched by the removal selectors are emptied as soon as they
+        close, and parsing stops once both a non-empty <title> and an element
+        matching the most preferred content selector have been seen, since
+        _extract_all() ignores the rest of the document in that case.
+        
+        Args:
+            body: Raw response body
+            encoding: Character encoding of body
+            
+        Returns:
+            Root element, or None if the document could not be parsed
+        """
+        if len(body) > self.max_content_size:
+            self.logger.warning(f"Content size ({len(body)} bytes) exceeds maximum, truncating")
+            body = body[:self.max_content_size]
+        
+        if _ends_mid_character(body, encoding):
+            return None
+        
+        try:
+            parser = etree.HTMLPullParser(events=('start', 'end'), encoding=encoding)
+        except LookupError:
+            return None
+        parser.set_element_class_lookup(lxml.html.HtmlElementClassLookup())
+        
+        preferred_spec = self._content_specs[0] if self._content_specs else None
+        title_element = preferred_element = removed_root = None
+        title_found = preferred_found = False
+        
+        try:
+            for offset in range(0, len(body), 64 * 1024):
+                parser.feed(body[offset:offset + 64 * 1024])
+                
+                for event, element in parser.read_events():
+                    tag = element.tag
+                    if not isinstance(tag, str):
+                        continue
+                    
+                    if event == 'start':
+                        if tag == 'title' and title_element is None:
+                            title_element = element
+                        if removed_root is not None:
+                            continue
+                        if (tag in self._remove_tags
+                                or element.get('id') in self._remove_ids
+                                or not self._remove_classes.isdisjoint((element.get('class') or '').split())):
+                            removed_root = element
+                        elif (preferred_element is None and preferred_spec
+                                and _element_matches(element, *preferred_spec)):
+                            preferred_element = element
+                        continue
+                    
+                    if element is title_element:
+                        title_found = bool(element.text and element.text.strip())
+                    elif element is preferred_element:
+                        preferred_found = True
+                    elif element is removed_root:
+                        # Dropped by _extract_all() anyway, so empty it unless it holds
+                        # title candidates; the element itself keeps its tail text
+                        if next(element.iter('title', 'h1', 'meta'), None) is None:
+                            del element[:]
+                            element.text = None
+                        removed_root = None
+                
+                if title_found and preferred_found:
+                    break
+            
+            return parser.close()
+        except (etree.ParserError, etree.XMLSyntaxError, ValueError):
+            return None
+    
+    def _extract_all(self, tree: etree._Element, url: str) -> Tuple[str, str]:
+        """
+        Extract title and main content from an lxml tree in a single walk.
+        
+        Follows the same title strategies as _extract_title() and the same
+        element removal and content area preference as _extract_main_content().
+        Title candidates are collected regardless of removal, matching the
+        BeautifulSoup path where the title is extracted first. Only text content
+        is produced; preserve_html output comes from the BeautifulSoup path. The
+        tree is modified in place.
+        
+        Args:
+            tree: Root element from _parse_lxml()
+            url: Page URL for fallback title generation
+            
+        Returns:
+            Tuple of (title, content)
+        """
+        title_element = h1_element = og_title = meta_title = body_element = None
+        content_candidates = [None] * len(self._content_specs)
+        removed_elements = []
+        removed_root = None
+        
+        for event, element in etree.iterwalk(tree, events=('start', 'end')):
+            tag = element.tag
+            if not isinstance(tag, str):
+                # Comments and processing instructions
+                continue
+            
+            if event == 'end':
+                if element is removed_root:
+                    removed_root = None
+                continue
+            
+            # Title candidates, first occurrence of each
+            if tag == 'title':
+                if title_element is None:
+                    title_element = element
+            elif tag == 'h1':
+                if h1_element is None:
+                    h1_element = element
+            elif tag == 'meta':
+                if og_title is None and element.get('property') == 'og:title':
+                    og_title = element.get('content') or ''
+                elif meta_title is None and element.get('name') == 'title':
+                    meta_title = element.get('content') or ''
+            elif tag == 'body':
+                if body_element is None:
+                    body_element = element
+            
+            # Everything below a removed element is dropped with it
+            if removed_root is not None:
+                continue
+            
+            if (tag in self._remove_tags
+                    or element.get('id') in self._remove_ids
+                    or not self._remove_classes.isdisjoint((element.get('class') or '').split())):
+                removed_elements.append(element)
+                removed_root = element
+                continue
+            
+            for index, (kind, name) in enumerate(self._content_specs):
+                if content_candidates[index] is None and _element_matches(element, kind, name):
+                    content_candidates[index] = element
+        
+        # Title strategies in order: <title>, first <h1>, Open Graph, meta title
+        title = ''
+        if title_element is not None and title_element.text:
+            title = title_element.text.strip()
+        if not title and h1_element is not None:
+            title = ''.join(text.strip() for text in _visible_text(h1_element))
+        if not title and og_title:
+            title = og_title.strip()
+        if not title and meta_title:
+            title = meta_title.strip()
+        title = self._clean_title(title) if title else self._generate_fallback_title(url)
+        
+        # Remove unwanted elements, keeping their tail text as a separate word
+        for element in removed_elements:
+            if element.getparent() is None:
+                continue
+            if element.tail:
+                element.tail = ' ' + element.tail
+            element.drop_tree()
+        
+        # Preferred content area, falling back to body and then the whole document
+        content_element = next((candidate for candidate in content_candidates if candidate is not None), None)
+        if content_element is None:
+            content_element = body_element if body_element is not None else tree
+        
+        # Text nodes are joined with spaces, as get_text(separator=' ') does
+        content = ' '.join(_visible_text(content_element))
+        
+        # Clean up whitespace
+        return title, _WHITESPACE_RE.sub(' ', content.strip())
+    
+    def _extract_last_modified(self, response: requests.Response) -> Optional[str]:
+        """
+        Extract Last-Modified header from HTTP response.
+        
+        Args:
+            response: HTTP response object
+            
+        Returns:
+            Last-Modified header value or None if not present
+        """
+        try:
+            last_modified = response.headers.get('Last-Modified')
+            if last_modified:
+                self.logger.debug(f"Found Last-Modified header: {last_modified}")
+                return last_modified
+            else:
+                self.logger.debug("No Last-Modified header found")
+                return None
+        except Exception as e:
+            self.logger.warning(f"Error extracting Last-Modified header: {e}")
+            return None
+
+
+# Process-local extractor used by extraction pool workers
+_worker_extractor = None
+
+
+def _init_extract_worker(settings: Dict[str, Any], log_queue=None, log_level: int = logging.INFO) -> None:
+    """
+    Build the process-local ContentExtractor for an extraction pool worker.
+    
+    Args:
+        settings: Scraping settings used to configure the extractor
+        log_queue: Queue from get_worker_log_queue() carrying records to the parent
+        log_level: Root log level for the worker
+    """
+    global _worker_extractor
+    setup_worker_logging(log_queue, log_level)
+    _worker_extractor = ContentExtractor(settings)
+
+
+def _extract_worker(url: str, body: bytes, headers: Dict[str, str], status_code: int,
+                    encoding: Optional[str], response_time_ms: Optional[int]) -> ScrapedContent:
+    """
+    Extract content in an extraction pool worker from the parts of a response.
+    
+    Args:
+        url: Original URL
+        body: Raw response body
+        headers: Response headers
+        status_code: HTTP status code
+        encoding: Encoding requests derived from the headers, if any
+        response_time_ms: Response time measured by the HTTP client
+        
+    Returns:
+        ScrapedContent object with extracted information
+    """
+    response = requests.Response()
+    response._content = body
+    response._content_consumed = True
+    response.status_code = status_code
+    response.headers.update(headers)
+    response.encoding = encoding
+    response.url = url
+    if response_time_ms is not None:
+        response._response_time_ms = response_time_ms
+    
+    return _worker_extractor.extract_content(response, url)
+
+
+class RobotChecker:
+    """
     Check robots.txt compliance for URLs.
     
     This class provides robots.txt fetching, parsing, and compliance checking including:
@@ -1088,6 +2020,11 @@ class RobotChecker:
             config: Scraping configuration dictionary containing:
                 - respect_robots_txt: Whether to check robots.txt compliance
                 - user_agent: User agent string for robots.txt rules
+                - robots_cache_dir: Directory for persisting parsed rules across runs
+                  (disabled if not set)
+                - robots_cache_ttl: Seconds parsed rules stay valid (default 24 hours)
+                - robots_cache_max_entries: Domains kept in memory; the least recently
+                  used domain is evicted beyond this
         """
         self.config = config
         self.http_client = http_client
@@ -1096,11 +2033,15 @@ class RobotChecker:
         # Configuration
         self.respect_robots = config.get('respect_robots_txt', True)
         self.user_agent = config.get('user_agent', 'WebScraper/1.0')
-        self.cache_ttl = 86400  # 24 hours in seconds
+        self.cache_ttl = config.get('robots_cache_ttl', 86400)  # 24 hours in seconds
+        self.cache_max_entries = config.get('robots_cache_max_entries', 1024)
+        self.cache_dir = config.get('robots_cache_dir')
         
-        # Cache for robots.txt data
-        self._robots_cache = {}
+        # Cache for robots.txt data, least recently used domain first
+        self._robots_cache: OrderedDict = OrderedDict()
         self._cache_lock = threading.Lock()
+        # In-progress robots.txt loads per cache key, so each domain is fetched once
+        self._pending_loads: Dict[str, Future] = {}
         
         self.logger.info(f"RobotChecker initialized: respect_robots={self.respect_robots}, "
                         f"user_agent='{self.user_agent}', cache_ttl={self.cache_ttl}s")
@@ -1122,17 +2063,14 @@ class RobotChecker:
         user_agent = user_agent or self.user_agent
         
         try:
-            parsed_url = urlparse(url)
-            base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
-            
             # Get robots.txt rules for this domain
-            robots_rules = self._get_robots_rules(base_url)
+            robots_rules = self._get_robots_rules(get_base_url(url))
             if not robots_rules:
                 # No robots.txt found or parsing failed - allow all
                 return True
             
             # Check rules for this user agent
-            path = parsed_url.path or '/'
+            path = parse_url(url).path or '/'
             return self._check_path_allowed(path, user_agent, robots_rules)
             
         except Exception as e:
@@ -1157,10 +2095,7 @@ class RobotChecker:
         user_agent = user_agent or self.user_agent
         
         try:
-            parsed_url = urlparse(url)
-            base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
-            
-            robots_rules = self._get_robots_rules(base_url)
+            robots_rules = self._get_robots_rules(get_base_url(url))
             if not robots_rules:
                 return 0.0
             
@@ -1175,6 +2110,9 @@ class RobotChecker:
         """
         Get robots.txt rules for domain, using cache when available.
         
+        Concurrent callers for a domain that isn't cached wait for the first
+        caller's load instead of fetching robots.txt themselves.
+        
         Args:
             base_url: Base URL of the domain (e.g., https://example.com)
             
@@ -1188,11 +2126,50 @@ class RobotChecker:
             if cache_key in self._robots_cache:
                 cache_entry = self._robots_cache[cache_key]
                 if self._is_cache_valid(cache_entry):
+                    self._robots_cache.move_to_end(cache_key)
                     self.logger.debug(f"Using cached robots.txt for {base_url}")
                     return cache_entry['rules']
                 else:
                     # Cache expired, remove entry
                     del self._robots_cache[cache_key]
+            
+            pending_load = self._pending_loads.get(cache_key)
+            if pending_load is None:
+                self._pending_loads[cache_key] = Future()
+        
+        if pending_load is not None:
+            self.logger.debug(f"Waiting for in-progress robots.txt load for {base_url}")
+            return pending_load.result()
+        
+        try:
+            robots_rules = self._load_robots_rules(base_url, cache_key)
+        except BaseException as e:
+            with self._cache_lock:
+                self._pending_loads.pop(cache_key).set_exception(e)
+            raise
+        
+        with self._cache_lock:
+            self._pending_loads.pop(cache_key).set_result(robots_rules)
+        
+        return robots_rules
+    
+    def _load_robots_rules(self, base_url: str, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Load robots.txt rules from the disk cache or the network and cache them.
+        
+        Args:
+            base_url: Base URL of the domain
+            cache_key: Cache key from _get_cache_key()
+            
+        Returns:
+            Parsed robots.txt rules or None if unavailable
+        """
+        # Rules persisted by a previous run skip both the fetch and the parse
+        cache_entry = self._load_disk_cache_entry(cache_key)
+        if cache_entry is not None:
+            self._store_cache_entry(cache_key, cache_entry)
+            self.logger.debug(f"Using robots.txt for {base_url} from disk cache")
+            return cache_entry['rules']
         
         # Fetch fresh robots.txt
         robots_content = self._fetch_robots_txt(base_url)
@@ -1203,15 +2180,99 @@ class RobotChecker:
         robots_rules = self._parse_robots_txt(robots_content)
         
         # Cache the result
-        with self._cache_lock:
-            self._robots_cache[cache_key] = {
-                'rules': robots_rules,
-                'timestamp': time.time(),
-                'url': base_url
-            }
+        cache_entry = {
+            'rules': robots_rules,
+            'timestamp': time.time(),
+            'url': base_url
+        }
+        self._store_cache_entry(cache_key, cache_entry)
+        self._save_disk_cache_entry(cache_key, cache_entry)
         
         return robots_rules
     
+    def _store_cache_entry(self, cache_key: str, cache_entry: Dict[str, Any]) -> None:
+        """
+        Add a cache entry, evicting the least recently used domains beyond the limit.
+        
+        Args:
+            cache_key: Cache key from _get_cache_key()
+            cache_entry: Cache entry dictionary
+        """
+        with self._cache_lock:
+            self._robots_cache[cache_key] = cache_entry
+            self._robots_cache.move_to_end(cache_key)
+            while len(self._robots_cache) > self.cache_max_entries:
+                evicted_key, _ = self._robots_cache.popitem(last=False)
+                self.logger.debug(f"Evicted robots.txt cache entry for {evicted_key}")
+    
+    def _get_disk_cache_path(self, cache_key: str) -> str:
+        """
+        Get the on-disk cache file path for a domain.
+        
+        Args:
+            cache_key: Cache key from _get_cache_key()
+            
+        Returns:
+            Path of the pickle file for this domain
+        """
+        file_name = hashlib.sha1(cache_key.encode('utf-8')).hexdigest() + '.pickle'
+        return os.path.join(self.cache_dir, file_name)
+    
+    def _load_disk_cache_entry(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a still-valid cache entry persisted by a previous run.
+        
+        Args:
+            cache_key: Cache key from _get_cache_key()
+            
+        Returns:
+            Cache entry dictionary, or None if disabled, missing, expired or unreadable
+        """
+        if not self.cache_dir:
+            return None
+        
+        try:
+            with open(self._get_disk_cache_path(cache_key), 'rb') as cache_file:
+                cache_entry = pickle.load(cache_file)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable robots.txt disk cache for {cache_key}: {e}")
+            return None
+        
+        if (not isinstance(cache_entry, dict) or 'rules' not in cache_entry
+                or not self._is_cache_valid(cache_entry)):
+            return None
+        
+        return cache_entry
+    
+    def _save_disk_cache_entry(self, cache_key: str, cache_entry: Dict[str, Any]) -> None:
+        """
+        Persist a cache entry so later runs can skip fetching and parsing.
+        
+        Writes to a temporary file first so readers never see a partial entry.
+        
+        Args:
+            cache_key: Cache key from _get_cache_key()
+            cache_entry: Cache entry dictionary
+        """
+        if not self.cache_dir:
+            return
+        
+        path = self._get_disk_cache_path(cache_key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, 'wb') as cache_file:
+                pickle.dump(cache_entry, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            self.logger.warning(f"Failed to write robots.txt disk cache for {cache_key}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    
     def _fetch_robots_txt(self, base_url: str) -> Optional[str]:
         """
         Fetch robots.txt for domain.
@@ -1259,15 +2320,20 @@ class RobotChecker:
             Dictionary with parsed rules
         """
         rules = {
-            'user_agents': {},  # user-agent -> {'disallow': [], 'allow': [], 'crawl_delay': None}
+            'user_agents': {},  # user-agent -> {'disallow': [], 'allow': [], 'crawl_delay': None,
+                                #                 'disallow_matchers': [], 'allow_matchers': []}
             'sitemaps': []      # List of sitemap URLs
         }
         
         current_user_agent = None
         
-        for line_num, line in enumerate(content.split('\n'), 1):
+        # Iterate lines lazily instead of materializing a list of every line
+        for line_num, line in enumerate(io.StringIO(content), 1):
             # Remove comments and whitespace
-            line = line.split('#')[0].strip()
+            comment_start = line.find('#')
+            if comment_start >= 0:
+                line = line[:comment_start]
+            line = line.strip()
             if not line:
                 continue
             
@@ -1306,6 +2372,11 @@ class RobotChecker:
             elif directive == 'sitemap':
                 rules['sitemaps'].append(value)
         
+        # Compile each pattern once here rather than on every path check
+        for agent_rules in rules['user_agents'].values():
+            agent_rules['allow_matchers'] = [_robots_matcher(pattern) for pattern in agent_rules['allow']]
+            agent_rules['disallow_matchers'] = [_robots_matcher(pattern) for pattern in agent_rules['disallow']]
+        
         return rules
     
     def _check_path_allowed(self, path: str, user_agent: str, robots_rules: Dict[str, Any]) -> bool:
@@ -1344,14 +2415,21 @@ class RobotChecker:
         if applicable_rules is None:
             return True
         
-        # Check Allow rules first (they take precedence)
-        for allow_pattern in applicable_rules.get('allow', []):
-            if self._path_matches_pattern(path, allow_pattern):
+        # Check Allow rules first (they take precedence), using the matchers
+        # compiled at parse time when present
+        allow_matchers = applicable_rules.get('allow_matchers')
+        if allow_matchers is None:
+            allow_matchers = [_robots_matcher(pattern) for pattern in applicable_rules.get('allow', [])]
+        for matcher in allow_matchers:
+            if _robots_matcher_matches(matcher, path):
                 return True
         
         # Check Disallow rules
-        for disallow_pattern in applicable_rules.get('disallow', []):
-            if self._path_matches_pattern(path, disallow_pattern):
+        disallow_matchers = applicable_rules.get('disallow_matchers')
+        if disallow_matchers is None:
+            disallow_matchers = [_robots_matcher(pattern) for pattern in applicable_rules.get('disallow', [])]
+        for matcher in disallow_matchers:
+            if _robots_matcher_matches(matcher, path):
                 return False
         
         # No matching rules - allow by default
@@ -1368,31 +2446,7 @@ class RobotChecker:
         Returns:
             True if path matches pattern
         """
-        # robots.txt patterns are simple prefix matches with optional wildcards
-        # Convert to regex for proper matching
-        
-        # Escape special regex characters except * and $
-        escaped_pattern = re.escape(pattern)
-        
-        # Replace escaped wildcards with regex equivalents
-        escaped_pattern = escaped_pattern.replace(r'\*', '.*')
-        
-        # Handle end-of-line anchor
-        if escaped_pattern.endswith('$'):
-            escaped_pattern = escaped_pattern[:-1] + '$'
-        else:
-            # If no $ at end, pattern matches prefix
-            escaped_pattern = '^' + escaped_pattern
-        
-        # Add start anchor if not present
-        if not escaped_pattern.startswith('^'):
-            escaped_pattern = '^' + escaped_pattern
-        
-        try:
-            return bool(re.match(escaped_pattern, path))
-        except re.error:
-            # Invalid regex - fall back to simple prefix matching
-            return path.startswith(pattern.rstrip('*'))
+        return _robots_matcher_matches(_robots_matcher(pattern), path)
     
     def _get_crawl_delay_for_agent(self, user_agent: str, robots_rules: Dict[str, Any]) -> float:
         """
@@ -1439,8 +2493,7 @@ class RobotChecker:
         Returns:
             Cache key string
         """
-        parsed = urlparse(url)
-        return f"{parsed.scheme}://{parsed.netloc}"
+        return get_base_url(url)
     
     def _is_cache_valid(self, cache_entry: Dict) -> bool:
         """
@@ -1477,6 +2530,7 @@ class RobotChecker:
                 'total_entries': len(self._robots_cache),
                 'valid_entries': valid_entries,
                 'expired_entries': expired_entries,
+                'max_entries': self.cache_max_entries,
                 'cache_ttl_seconds': self.cache_ttl
             }
     
@@ -1491,6 +2545,10 @@ class RobotChecker:
 @dataclass
 class ScrapingSession:
     """Results of a scraping session."""
+    __slots__ = ('session_id', 'start_time', 'end_time', 'total_urls', 'successful_scrapes',
+                 'failed_scrapes', 'skipped_urls', 'errors', 'total_content_size',
+                 'average_response_time')
+    
     session_id: str
     start_time: datetime
     end_time: datetime
@@ -1503,6 +2561,79 @@ class ScrapingSession:
     average_response_time: float
 
 
+class SessionStats:
+    """
+    Running counters for a scraping session.
+    
+    Updated for every processed URL, so fields are slots rather than dict keys.
+    """
+    
+    __slots__ = ('total_urls', 'successful_scrapes', 'failed_scrapes', 'skipped_urls', 'errors',
+                 'recovery_actions', 'recent_error_types', 'total_content_size', 'total_response_time', 'start_time',
+                 'end_time', 'near_duplicates', 'reused_extractions')
+    
+    def __init__(self):
+        self.total_urls = 0
+        self.successful_scrapes = 0
+        self.failed_scrapes = 0
+        self.skipped_urls = 0
+        self.errors = []  # List of error dictionaries, timestamped in epoch nanoseconds
+        self.recovery_actions = Counter()  # Recovery action name -> number of errors
+        self.recent_error_types = deque(maxlen=10)  # Types of the most recent errors
+        self.total_content_size = 0
+        self.total_response_time = 0
+        self.start_time: Optional[datetime] = None
+        self.end_time: Optional[datetime] = None
+        self.near_duplicates = 0
+        self.reused_extractions = 0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get a shallow dictionary snapshot of the counters.
+        
+        Returns:
+            Dictionary mapping field names to current values
+        """
+        snapshot = {name: getattr(self, name) for name in self.__slots__}
+        snapshot['errors'] = self.formatted_errors()
+        return snapshot
+    
+    def formatted_errors(self) -> List[Dict[str, Any]]:
+        """
+        Get the error list with ISO 8601 timestamps.
+        
+        Timestamps are recorded as epoch nanoseconds and only formatted here,
+        when statistics are reported.
+        
+        Returns:
+            List of error dictionaries with a 'timestamp' string
+        """
+        return [
+            {
+                'url': error_info['url'],
+                'error_type': error_info['error_type'],
+                'error_message': error_info['error_message'],
+                'timestamp': _format_timestamp_ns(error_info['timestamp_ns']),
+                'decision': error_info['decision']
+            }
+            for error_info in self.errors
+        ]
+    
+    def progress(self) -> Dict[str, int]:
+        """
+        Get the URL outcome counters, without the error list or timestamps.
+        
+        Returns:
+            Dictionary of URL counts by outcome
+        """
+        return {
+            'total_urls': self.total_urls,
+            'successful_scrapes': self.successful_scrapes,
+            'failed_scrapes': self.failed_scrapes,
+            'skipped_urls': self.skipped_urls
+        }
+
+
 class WebScraper:
     """
     Main web scraper orchestrator that coordinates all scraping components.
@@ -1532,6 +2663,10 @@ class WebScraper:
         self.urls_config = scraping_config.get('urls', [])
         self.settings = scraping_config.get('settings', {})
         
+        # Filter disabled URLs once rather than on every session and stats call
+        self._enabled_urls = [url_config for url_config in self.urls_config
+                              if url_config.get('enabled', True)]
+        
         # Initialize components
         self.http_client = HTTPClient(self.settings)
         self.content_extractor = ContentExtractor(self.settings)
@@ -1540,17 +2675,43 @@ class WebScraper:
         
         # Session tracking
         self.session_id = f"scrape_{int(time.time())}_{random.randint(1000, 9999)}"
-        self.session_stats = {
-            'total_urls': 0,
-            'successful_scrapes': 0,
-            'failed_scrapes': 0,
-            'skipped_urls': 0,
-            'errors': [],
-            'total_content_size': 0,
-            'total_response_time': 0,
-            'start_time': None,
-            'end_time': None
-        }
+        self.session_stats = SessionStats()
+        self._stats_lock = threading.Lock()
+        
+        # URLs on different hosts are scraped concurrently when above 1
+        self.max_concurrency = self.settings.get('max_concurrency', 1)
+        
+        # Settings read for every URL are looked up once
+        self.reload_settings()
+        
+        # In-memory duplicate detection filters, seeded from the database per session
+        self.dedup_filter_capacity = self.settings.get('dedup_filter_capacity', 1_000_000)
+        self.dedup_filter_error_rate = self.settings.get('dedup_filter_error_rate', 1e-6)
+        self._seen_urls = None
+        self._seen_content = None
+        # Bloom filter adds are read-modify-writes, so concurrent URL workers serialize on this
+        self._dedup_lock = threading.Lock()
+        
+        # Latest (content_hash, last_modified) per URL, preloaded per session
+        self._latest_scrapes = None
+        
+        # Optionally treat changes confined to digits/tag attributes as duplicates
+        self.dedup_normalized_content = self.settings.get('dedup_normalized_content', False)
+        
+        # Optional near-duplicate index over content stored this session
+        near_duplicate_threshold = self.settings.get('near_duplicate_threshold')
+        self._near_duplicates = MinHashLSH(near_duplicate_threshold) if near_duplicate_threshold else None
+        
+        # Extraction results of recent raw responses by fingerprint, so a body served
+        # under several URLs (error pages, tracking-parameter variants) is parsed once
+        self.extraction_cache_size = self.settings.get('extraction_cache_size', 256)
+        self._extraction_cache: OrderedDict = OrderedDict()
+        self._extraction_cache_lock = threading.Lock()
+        
+        # Optional process pool so CPU-bound extraction runs outside the GIL (0 disables)
+        self.extraction_workers = self.settings.get('extraction_workers', 0)
+        self._extraction_pool = None
+        self._extraction_pool_lock = threading.Lock()
         
         self.logger.info(f"WebScraper initialized with session_id={self.session_id}, "
                         f"{len(self.urls_config)} URLs configured")
@@ -1566,59 +2727,34 @@ class WebScraper:
         Returns:
             ScrapingSession object with results and statistics
         """
-        self.session_stats['start_time'] = datetime.now()
+        self.session_stats.start_time = datetime.now()
         
         if dry_run:
             return self._simulate_scraping()
         
         self.logger.info(f"Starting scraping session {self.session_id}")
         
-        # Filter enabled URLs
-        enabled_urls = [url_config for url_config in self.urls_config 
-                       if url_config.get('enabled', True)]
+        enabled_urls = self._enabled_urls
         
-        self.session_stats['total_urls'] = len(enabled_urls)
+        self.session_stats.total_urls = len(enabled_urls)
         
         if not enabled_urls:
             self.logger.warning("No enabled URLs found in configuration")
             return self._create_session_result()
         
-        # Process each URL
-        for i, url_config in enumerate(enabled_urls):
-            url = url_config.get('url')
-            name = url_config.get('name', url)
-            
-            self.logger.info(f"Processing {i+1}/{len(enabled_urls)}: {name} ({url})")
-            
-            try:
-                scraped_content = self.scrape_single_url(url_config)
-                if scraped_content:
-                    # Store in database
-                    self._store_content(scraped_content)
-                    self.session_stats['successful_scrapes'] += 1
-                    self.session_stats['total_content_size'] += len(scraped_content.content)
-                    self.session_stats['total_response_time'] += scraped_content.response_time_ms
-                else:
-                    self.session_stats['skipped_urls'] += 1
-                    
-            except RobotsError as e:
-                decision = self._handle_scraping_error(url, e)
-                if decision.count_as_failure:
-                    self.session_stats['failed_scrapes'] += 1
-                else:
-                    self.session_stats['skipped_urls'] += 1
-            except Exception as e:
-                decision = self._handle_scraping_error(url, e)
-                if decision.count_as_failure:
-                    self.session_stats['failed_scrapes'] += 1
-                else:
-                    self.session_stats['skipped_urls'] += 1
-            
-            # Apply delay between requests (except for last URL)
-            if i < len(enabled_urls) - 1:
-                self._apply_request_delay()
+        # Seed duplicate detection filters so new URLs skip database lookups
+        session_urls = [url_config.get('url') for url_config in enabled_urls]
+        self._load_dedup_filters(session_urls)
+        self._load_latest_scrapes(session_urls)
+        
+        if self.max_concurrency > 1:
+            asyncio.run(self.scrape_all_async(enabled_urls))
+        else:
+            # Process each URL; the HTTP client waits out per-host delays
+            for i, url_config in enumerate(enabled_urls):
+                self._process_url(url_config, i + 1, len(enabled_urls))
         
-        self.session_stats['end_time'] = datetime.now()
+        self.session_stats.end_time = datetime.now()
         
         session_result = self._create_session_result()
         self.logger.info(f"Scraping session completed: {session_result.successful_scrapes}/"
@@ -1626,6 +2762,94 @@ class WebScraper:
         
         return session_result
     
+    async def scrape_all_async(self, enabled_urls: List[Dict[str, Any]]) -> None:
+        """
+        Scrape URLs concurrently across hosts, sequentially within each host.
+        
+        At most max_concurrency URLs are in flight at once. Each host keeps the
+        configured delay between its own requests, so politeness is unchanged
+        while waits on different hosts overlap. Fetching and extraction stay on
+        the blocking HTTP client and run in a thread pool with one worker per
+        host, up to max_concurrency.
+        
+        Args:
+            enabled_urls: URL configuration dictionaries to scrape
+        """
+        host_groups: Dict[str, List[Dict[str, Any]]] = {}
+        for url_config in enabled_urls:
+            host = get_host(url_config.get('url') or '')
+            host_groups.setdefault(host, []).append(url_config)
+        
+        self.logger.info(f"Scraping {len(enabled_urls)} URLs across {len(host_groups)} hosts "
+                        f"with concurrency {self.max_concurrency}")
+        
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        positions = {id(url_config): i + 1 for i, url_config in enumerate(enabled_urls)}
+        
+        # Sized explicitly: the default executor may have fewer threads than
+        # max_concurrency, and never needs more than one per host
+        executor = ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(host_groups)),
+                                      thread_name_prefix='scrape')
+        
+        async def scrape_host(host: str, url_configs: List[Dict[str, Any]]) -> None:
+            loop = asyncio.get_running_loop()
+            for url_config in url_configs:
+                # Wait out the host's delay without holding a concurrency slot
+                wait = self.http_client.host_wait_time(host)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                
+                async with semaphore:
+                    await loop.run_in_executor(executor, self._process_url, url_config,
+                                               positions[id(url_config)], len(enabled_urls))
+        
+        try:
+            await asyncio.gather(*(scrape_host(host, url_configs) for host, url_configs in host_groups.items()))
+        finally:
+            executor.shutdown(wait=True)
+    
+    def _process_url(self, url_config: Dict[str, Any], position: int, total: int) -> None:
+        """
+        Scrape and store one URL, recording the outcome in the session statistics.
+        
+        Args:
+            url_config: URL configuration dictionary
+            position: 1-based position of the URL in this session, for logging
+            total: Number of URLs in this session
+        """
+        url = url_config.get('url')
+        name = url_config.get('name', url)
+        
+        self.logger.info("Processing %s/%s: %s (%s)", position, total, name, url)
+        
+        try:
+            scraped_content = self.scrape_single_url(url_config)
+            if scraped_content:
+                # Store in database
+                self._store_content(scraped_content)
+                with self._stats_lock:
+                    self.session_stats.successful_scrapes += 1
+                    self.session_stats.total_content_size += len(scraped_content.content)
+                    self.session_stats.total_response_time += scraped_content.response_time_ms
+            else:
+                with self._stats_lock:
+                    self.session_stats.skipped_urls += 1
+                
+        except RobotsError as e:
+            decision = self._handle_scraping_error(url, e)
+            with self._stats_lock:
+                if decision.count_as_failure:
+                    self.session_stats.failed_scrapes += 1
+                else:
+                    self.session_stats.skipped_urls += 1
+        except Exception as e:
+            decision = self._handle_scraping_error(url, e)
+            with self._stats_lock:
+                if decision.count_as_failure:
+                    self.session_stats.failed_scrapes += 1
+                else:
+                    self.session_stats.skipped_urls += 1
+    
     def scrape_single_url(self, url_config: Dict[str, Any]) -> Optional[ScrapedContent]:
         """
         Scrape a single URL with full error handling.
@@ -1647,36 +2871,39 @@ class WebScraper:
                 self.logger.warning(f"Robots.txt disallows scraping {url}, skipping")
                 raise RobotsError(f"Robots.txt disallows access to {url}", url)
             
-            # Apply crawl delay if specified in robots.txt
-            robots_delay = self.robot_checker.get_crawl_delay(url)
-            configured_delay = self.settings.get('delay_between_requests', 1)
-            
-            # Use the longer delay (robots.txt takes precedence if higher)
-            if robots_delay > configured_delay:
-                extra_delay = robots_delay - configured_delay
-                self.logger.debug(f"Applying additional robots.txt crawl delay: {extra_delay}s")
-                time.sleep(extra_delay)
-            
             # Check for conditional request opportunity
             last_modified_header = self._get_last_modified_for_url(url)
             
-            # Fetch URL using HTTP client with conditional request if available
-            response, metrics = self.http_client.fetch_url(url, if_modified_since=last_modified_header)
+            # Fetch URL using HTTP client with conditional request if available. The
+            # client spaces requests per host, using the robots.txt Crawl-delay if
+            # longer, and doesn't download bodies that won't be parsed
+            response, metrics = self.http_client.fetch_url(
+                url, if_modified_since=last_modified_header,
+                crawl_delay=self.robot_checker.get_crawl_delay(url), html_only=True
+            )
             
             # Handle 304 Not Modified response
             if response.status_code == 304:
-                self.logger.info(f"Content not modified for {url} (304 response), skipping")
+                self.logger.info("Content not modified for %s (304 response), skipping", url)
                 return None
             
             # Add response time to response object for ContentExtractor
             response._response_time_ms = metrics.response_time_ms
             
-            # Extract content
-            scraped_content = self.content_extractor.extract_content(response, url)
+            # Extract content, reusing the result for a body already extracted
+            scraped_content = self._extract_content_cached(response, url)
             
             # Check if content already exists (duplicate detection)
-            if self._check_for_duplicates(url, scraped_content.content_hash):
-                self.logger.info(f"Content already exists for {url}, skipping")
+            if self._check_for_duplicates(url, scraped_content.content_hash, scraped_content.normalized_hash):
+                self.logger.info("Content already exists for %s, skipping", url)
+                return None
+            
+            # Near-duplicates of content stored this session are skipped as well
+            near_duplicate_of = self._find_near_duplicate(scraped_content)
+            if near_duplicate_of:
+                with self._stats_lock:
+                    self.session_stats.near_duplicates += 1
+                self.logger.info("Content for %s is a near-duplicate of %s, skipping", url, near_duplicate_of)
                 return None
             
             return scraped_content
@@ -1694,6 +2921,155 @@ class WebScraper:
             self.logger.error(f"Unexpected error for {url}: {type(e).__name__} - {str(e)}")
             raise
     
+    def _find_near_duplicate(self, scraped_content: ScrapedContent) -> Optional[str]:
+        """
+        Find content stored this session that is nearly identical to scraped_content.
+        
+        Args:
+            scraped_content: Newly extracted content
+            
+        Returns:
+            URL of the stored near-duplicate, or None (always None when disabled)
+        """
+        if self._near_duplicates is None or not scraped_content.minhash_signature:
+            return None
+        return self._near_duplicates.query(scraped_content.minhash_signature)
+    
+    def _quick_fingerprint(self, response: requests.Response) -> bytes:
+        """
+        Fingerprint a raw response before any parsing.
+        
+        Covers everything extraction depends on apart from the URL: the
+        Content-Type header (which can change the detected encoding) and the
+        exact body bytes.
+        
+        Args:
+            response: HTTP response object
+            
+        Returns:
+            SHA-256 digest bytes
+        """
+        content_type = response.headers.get('content-type', '')
+        fingerprint = hashlib.sha256(content_type.encode('latin-1', errors='replace') + b'\0')
+        fingerprint.update(response.content or b'')
+        return fingerprint.digest()
+    
+    def _extract_content_cached(self, response: requests.Response, url: str) -> ScrapedContent:
+        """
+        Extract content, reusing the extraction of an identical earlier response.
+        
+        Only the extraction is reused: the result still goes through duplicate
+        detection and storage for this URL. Response metadata comes from this
+        response, and a title generated from the URL is regenerated for it.
+        
+        Args:
+            response: HTTP response object
+            url: Original URL
+            
+        Returns:
+            ScrapedContent object with extracted information
+        """
+        if not self.extraction_cache_size:
+            return self._extract_content(response, url)
+        
+        fingerprint = self._quick_fingerprint(response)
+        with self._extraction_cache_lock:
+            cached = self._extraction_cache.get(fingerprint)
+            if cached is not None:
+                self._extraction_cache.move_to_end(fingerprint)
+        
+        if cached is None:
+            scraped_content = self._extract_content(response, url)
+            # Failed extractions come back empty; they are not worth remembering
+            if scraped_content.content:
+                with self._extraction_cache_lock:
+                    self._extraction_cache[fingerprint] = (url, scraped_content)
+                    if len(self._extraction_cache) > self.extraction_cache_size:
+                        self._extraction_cache.popitem(last=False)
+            return scraped_content
+        
+        cached_url, cached_content = cached
+        title = cached_content.title
+        if title == self.content_extractor._generate_fallback_title(cached_url):
+            title = self.content_extractor._generate_fallback_title(url)
+        
+        with self._stats_lock:
+            self.session_stats.reused_extractions += 1
+        self.logger.debug("Response for %s is identical to the one extracted for %s, reusing it", url, cached_url)
+        
+        return replace(
+            cached_content,
+            url=url,
+            title=title,
+            response_status=response.status_code,
+            response_time_ms=getattr(response, '_response_time_ms', cached_content.response_time_ms),
+            last_modified=self.content_extractor._extract_last_modified(response)
+        )
+    
+    def _extract_content(self, response: requests.Response, url: str) -> ScrapedContent:
+        """
+        Extract content in the extraction pool if enabled, otherwise in-process.
+        
+        Args:
+            response: HTTP response object
+            url: Original URL
+            
+        Returns:
+            ScrapedContent object with extracted information
+        """
+        if self.extraction_workers <= 0:
+            return self.content_extractor.extract_content(response, url)
+        
+        try:
+            future = self._get_extraction_pool().submit(
+                _extract_worker, url, response.content, dict(response.headers),
+                response.status_code, response.encoding,
+                getattr(response, '_response_time_ms', None)
+            )
+            return future.result()
+        except BrokenProcessPool as e:
+            self.logger.warning(f"Extraction pool failed, extracting in-process from now on: {e}")
+            self._shutdown_extraction_pool()
+            self.extraction_workers = 0
+            return self.content_extractor.extract_content(response, url)
+    
+    def _get_extraction_pool(self) -> ProcessPoolExecutor:
+        """
+        Get the extraction process pool, creating it on first use.
+        
+        Workers are started through a fork server where supported, so they are
+        never forked from this process while its executor and logging threads
+        may hold locks; _init_extract_worker rebuilds everything they need.
+        
+        Returns:
+            ProcessPoolExecutor running _extract_worker tasks
+        """
+        with self._extraction_pool_lock:
+            if self._extraction_pool is None:
+                if 'forkserver' in multiprocessing.get_all_start_methods():
+                    mp_context = multiprocessing.get_context('forkserver')
+                else:
+                    mp_context = multiprocessing.get_context()
+                
+                self._extraction_pool = ProcessPoolExecutor(
+                    max_workers=self.extraction_workers,
+                    mp_context=mp_context,
+                    initializer=_init_extract_worker,
+                    initargs=(self.settings, get_worker_log_queue(mp_context),
+                              logging.getLogger().getEffectiveLevel())
+                )
+                self.logger.info(f"Extraction pool started with {self.extraction_workers} workers")
+            
+            return self._extraction_pool
+    
+    def _shutdown_extraction_pool(self) -> None:
+        """
+        Shut down the extraction process pool if it was started.
+        """
+        if self._extraction_pool is not None:
+            self._extraction_pool.shutdown(wait=True, cancel_futures=True)
+            self._extraction_pool = None
+    
     def _simulate_scraping(self) -> ScrapingSession:
         """
         Simulate scraping process for dry-run mode.
@@ -1703,11 +3079,10 @@ class WebScraper:
         """
         self.logger.info("Simulating scraping process (dry-run mode)")
         
-        enabled_urls = [url_config for url_config in self.urls_config 
-                       if url_config.get('enabled', True)]
+        enabled_urls = self._enabled_urls
         
-        self.session_stats['total_urls'] = len(enabled_urls)
-        self.session_stats['successful_scrapes'] = len(enabled_urls)  # Assume all would succeed
+        self.session_stats.total_urls = len(enabled_urls)
+        self.session_stats.successful_scrapes = len(enabled_urls)  # Assume all would succeed
         
         for url_config in enabled_urls:
             url = url_config.get('url')
@@ -1722,47 +3097,85 @@ class WebScraper:
         
         Args:
             scraped_content: ScrapedContent object to store
+            
+        Raises:
+            DatabaseError: If the database rejects the insert
         """
         try:
             record_id = self.db_manager.insert_content(scraped_content)
-            self.logger.debug(f"Content stored successfully for {scraped_content.url} with ID {record_id}")
+            self._remember_content(scraped_content.url, scraped_content.content_hash,
+                                   scraped_content.last_modified)
+            if self._near_duplicates is not None and scraped_content.minhash_signature:
+                self._near_duplicates.insert(scraped_content.url, scraped_content.minhash_signature)
+            self.logger.debug("Content stored successfully for %s with ID %s", scraped_content.url, record_id)
             
+        except psycopg2.Error as e:
+            self.logger.error(f"Failed to store content for {scraped_content.url}: {e}")
+            raise DatabaseError(f"Failed to store content: {e}", scraped_content.url) from e
         except Exception as e:
             self.logger.error(f"Failed to store content for {scraped_content.url}: {e}")
             raise
     
-    def _check_for_duplicates(self, url: str, content_hash: str) -> bool:
+    def _check_for_duplicates(self, url: str, content_hash: str,
+                              normalized_hash: Optional[str] = None) -> bool:
         """
         Check if content hash already exists for URL and log content changes.
         
         Args:
             url: URL to check
             content_hash: Content hash to check
+            normalized_hash: Hash of the content with digits and tag attributes
+                normalized away, used when dedup_normalized_content is enabled
             
         Returns:
             True if content is a duplicate
         """
         try:
+            # Bloom filter misses are definite, so they skip the database entirely
+            if not self._may_have_seen_url(url):
+                self.logger.info("New URL detected for scraping: %s", url)
+                return False
+            
+            if not self._may_have_seen_content(url, content_hash):
+                if self._is_normalized_duplicate(url, normalized_hash):
+                    return True
+                self.logger.info("Content change detected for %s: new_hash=%s...", url, (content_hash or '')[:12])
+                return False
+            
+            # The preloaded latest scrapes answer new and unchanged URLs without a database lookup
+            latest_scrape = None
+            if self._latest_scrapes is not None:
+                latest_scrape = self._latest_scrapes.get(url)
+                if latest_scrape is None:
+                    self.logger.info("New URL detected for scraping: %s", url)
+                    return False
+            if latest_scrape and latest_scrape[0] == content_hash:
+                self.logger.info("Duplicate content detected for %s (hash: %s...)", url, content_hash[:12])
+                return True
+            
             # Check if exact content already exists
             if self.db_manager.content_exists(url, content_hash):
-                self.logger.info(f"Duplicate content detected for {url} (hash: {content_hash[:12]}...)")
+                self.logger.info("Duplicate content detected for %s (hash: %s...)", url, content_hash[:12])
+                return True
+            
+            if self._is_normalized_duplicate(url, normalized_hash):
                 return True
             
             # Check if we have any previous content for this URL
-            latest_hash = self.db_manager.get_latest_content_hash(url)
+            latest_hash = latest_scrape[0] if latest_scrape else self.db_manager.get_latest_content_hash(url)
             if latest_hash:
                 if latest_hash != content_hash:
-                    self.logger.info(f"Content change detected for {url}: "
-                                   f"old_hash={latest_hash[:12]}... new_hash={content_hash[:12]}...")
+                    self.logger.info("Content change detected for %s: old_hash=%s... new_hash=%s...",
+                                     url, latest_hash[:12], content_hash[:12])
                     # Content has changed - not a duplicate, should scrape
                     return False
                 else:
                     # This case should already be caught above, but just in case
-                    self.logger.debug(f"Content unchanged for {url}")
+                    self.logger.debug("Content unchanged for %s", url)
                     return True
             else:
                 # First time scraping this URL
-                self.logger.info(f"New URL detected for scraping: {url}")
+                self.logger.info("New URL detected for scraping: %s", url)
                 return False
                 
         except Exception as e:
@@ -1779,22 +3192,157 @@ class WebScraper:
         Returns:
             Last-Modified header value or None if not available
         """
+        if not self._may_have_seen_url(url):
+            self.logger.debug("No previous scrape of %s, skipping Last-Modified lookup", url)
+            return None
+        
+        if self._latest_scrapes is not None:
+            latest_scrape = self._latest_scrapes.get(url)
+            return latest_scrape[1] if latest_scrape else None
+        
         try:
             # Get the most recent content for this URL
             recent_content = self.db_manager.get_content_by_url(url, limit=1)
             if recent_content and len(recent_content) > 0:
                 last_modified = recent_content[0].get('last_modified')
                 if last_modified:
-                    self.logger.debug(f"Found previous Last-Modified for {url}: {last_modified}")
+                    self.logger.debug("Found previous Last-Modified for %s: %s", url, last_modified)
                     return last_modified
             
-            self.logger.debug(f"No previous Last-Modified found for {url}")
+            self.logger.debug("No previous Last-Modified found for %s", url)
             return None
             
         except Exception as e:
             self.logger.warning(f"Error getting Last-Modified for {url}: {e}")
             return None
     
+    def _load_dedup_filters(self, urls: List[str]) -> None:
+        """
+        Seed the URL and content Bloom filters from content stored for this session's URLs.
+        
+        A single indexed query replaces the per-URL existence lookups for URLs
+        that have never been scraped. Only this session's URLs are looked up,
+        so startup cost follows the session size rather than the stored history.
+        On failure the filters stay disabled and every check falls through to
+        the database as before.
+        
+        Args:
+            urls: URLs scraped in this session
+        """
+        if self._seen_urls is not None:
+            return
+        
+        try:
+            pairs = self.db_manager.get_url_hash_pairs([url for url in urls if url])
+        except Exception as e:
+            self.logger.warning(f"Could not seed duplicate detection filters, using database lookups: {e}")
+            return
+        
+        # Filters also grow with the content stored during this session
+        seen_urls = ScalableBloomFilter(self.dedup_filter_capacity, self.dedup_filter_error_rate)
+        seen_content = ScalableBloomFilter(self.dedup_filter_capacity, self.dedup_filter_error_rate)
+        
+        for url, content_hash in pairs:
+            canonical_url = canonicalize_url(url)
+            seen_urls.add(canonical_url)
+            seen_content.add(f"{canonical_url} {content_hash or ''}")
+        
+        self._seen_urls = seen_urls
+        self._seen_content = seen_content
+        self.logger.info(f"Duplicate detection filters seeded with {len(pairs)} stored url/hash pairs")
+    
+    def _load_latest_scrapes(self, urls: List[str]) -> None:
+        """
+        Preload the latest content hash and Last-Modified value of this session's URLs.
+        
+        One query replaces the per-URL latest-hash and Last-Modified lookups. On
+        failure the preload stays disabled and those lookups query the database.
+        
+        Args:
+            urls: URLs scraped in this session
+        """
+        try:
+            self._latest_scrapes = self.db_manager.get_latest_scrape_info([url for url in urls if url])
+        except Exception as e:
+            self.logger.warning(f"Could not preload latest scrape info, using database lookups: {e}")
+            self._latest_scrapes = None
+            return
+        
+        self.logger.info(f"Preloaded latest scrape info for {len(self._latest_scrapes)} URLs")
+    
+    def _may_have_seen_url(self, url: str) -> bool:
+        """
+        Check whether URL may have been scraped before.
+        
+        Args:
+            url: URL to check
+            
+        Returns:
+            False only if the URL has definitely never been stored
+        """
+        if self._seen_urls is None:
+            return True
+        canonical_url = canonicalize_url(url)
+        with self._dedup_lock:
+            return canonical_url in self._seen_urls
+    
+    def _is_normalized_duplicate(self, url: str, normalized_hash: Optional[str]) -> bool:
+        """
+        Check whether content differing only in digits/tag attributes is already stored.
+        
+        Args:
+            url: URL to check
+            normalized_hash: Normalized content hash to check
+            
+        Returns:
+            True if dedup_normalized_content is enabled and the normalized hash exists for URL
+        """
+        if not self.dedup_normalized_content or not normalized_hash:
+            return False
+        
+        if self.db_manager.normalized_content_exists(url, normalized_hash):
+            self.logger.info("Only volatile content (digits/attributes) changed for %s "
+                             "(normalized_hash: %s...)", url, normalized_hash[:12])
+            return True
+        return False
+    
+    def _may_have_seen_content(self, url: str, content_hash: str) -> bool:
+        """
+        Check whether this content hash may already be stored for URL.
+        
+        Args:
+            url: URL to check
+            content_hash: Content hash to check
+            
+        Returns:
+            False only if the url/hash pair has definitely never been stored
+        """
+        if self._seen_content is None:
+            return True
+        key = f"{canonicalize_url(url)} {content_hash or ''}"
+        with self._dedup_lock:
+            return key in self._seen_content
+    
+    def _remember_content(self, url: str, content_hash: str, last_modified: Optional[str] = None) -> None:
+        """
+        Record stored content in the duplicate detection filters.
+        
+        Args:
+            url: URL of the stored content
+            content_hash: Hash of the stored content
+            last_modified: Last-Modified header of the stored response
+        """
+        if self._latest_scrapes is not None:
+            self._latest_scrapes[url] = (content_hash, last_modified)
+        
+        if self._seen_urls is None:
+            return
+        
+        canonical_url = canonicalize_url(url)
+        with self._dedup_lock:
+            self._seen_urls.add(canonical_url)
+            self._seen_content.add(f"{canonical_url} {content_hash or ''}")
+    
     def _handle_scraping_error(self, url: str, error: Exception, context: Dict[str, Any] = None) -> ErrorDecision:
         """
         Handle and log scraping errors using the enhanced ErrorDecisionEngine.
@@ -1809,13 +3357,15 @@ class WebScraper:
         """
         # Build comprehensive context
         context = context or {}
+        with self._stats_lock:
+            progress = self.session_stats.progress()
         context.update({
             'url': url,
             'session_id': self.session_id,
-            'session_stats': self.session_stats.copy(),
-            'user_agent': self.settings.get('user_agent', 'WebScraper/1.0'),
-            'timeout': self.settings.get('timeout', 30),
-            'max_retries': self.settings.get('retry_attempts', 3)
+            'session_stats': progress,
+            'user_agent': self._user_agent,
+            'timeout': self._timeout,
+            'max_retries': self._max_retries
         })
         
         # Get error handling decision from the engine
@@ -1829,7 +3379,7 @@ class WebScraper:
             'url': url,
             'error_type': type(error).__name__,
             'error_message': str(error),
-            'timestamp': datetime.now().isoformat(),
+            'timestamp_ns': error.timestamp_ns if isinstance(error, ScrapingError) else time.time_ns(),
             'decision': {
                 'should_retry': decision.should_retry,
                 'should_continue': decision.should_continue,
@@ -1838,7 +3388,11 @@ class WebScraper:
             }
         }
         
-        self.session_stats['errors'].append(error_info)
+        with self._stats_lock:
+            self.session_stats.errors.append(error_info)
+            self.session_stats.recent_error_types.append(error_info['error_type'])
+            if decision.recovery_action:
+                self.session_stats.recovery_actions[decision.recovery_action] += 1
         
         # Execute recovery actions based on decision
         self._execute_recovery_action(decision, url, error, context)
@@ -1859,10 +3413,10 @@ class WebScraper:
             self._attempt_partial_content_recovery(url, error, context)
             
         elif decision.recovery_action == 'skip_url':
-            self.logger.info(f"Skipping URL {url} due to {type(error).__name__}")
+            self.logger.info("Skipping URL %s due to %s", url, type(error).__name__)
             
         elif decision.recovery_action == 'retry_with_backoff':
-            self.logger.info(f"URL {url} will be retried with backoff")
+            self.logger.info("URL %s will be retried with backoff", url)
             # Retry logic is handled at the HTTP client level
             
         elif decision.recovery_action == 'retry_database_operation':
@@ -1873,7 +3427,7 @@ class WebScraper:
             # This would typically raise an exception to stop the scraping process
             
         else:
-            self.logger.debug(f"No specific recovery action for {url}")
+            self.logger.debug("No specific recovery action for %s", url)
     
     def _attempt_partial_content_recovery(self, url: str, error: Exception, context: Dict[str, Any]) -> None:
         """
@@ -1888,7 +3442,7 @@ class WebScraper:
             context: Error context
         """
         try:
-            self.logger.info(f"Attempting partial content recovery for {url}")
+            self.logger.info("Attempting partial content recovery for %s", url)
             
             # Try to get raw HTML content from context if available
             raw_content = context.get('raw_content')
@@ -1898,13 +3452,15 @@ class WebScraper:
                 raw_content = response.text
             
             if raw_content:
+                # Only the first 10KB is stored, so only that part is hashed
+                truncated_content = raw_content[:10000]
+                
                 # Create minimal scraped content with just the raw HTML
                 partial_content = ScrapedContent(
                     url=url,
                     title=f"[PARTIAL] Content from {url}",  # Indicate partial recovery
-                    content=raw_content[:10000],  # Limit to first 10KB
-                    content_hash=calculate_content_hash(raw_content),
-                    scraped_at=datetime.now(),
+                    content=truncated_content,
+                    hash_algorithm=self.content_extractor.hash_algorithm,
                     response_status=getattr(response, 'status_code', 0) if response else 0,
                     response_time_ms=context.get('response_time_ms', 0),
                     content_length=len(raw_content)
@@ -1913,11 +3469,13 @@ class WebScraper:
                 # Try to save partial content
                 try:
                     self.db_manager.insert_content(partial_content)
-                    self.logger.info(f"Successfully saved partial content for {url}")
+                    self._remember_content(url, partial_content.content_hash)
+                    self.logger.info("Successfully saved partial content for %s", url)
                     
                     # Update session stats for successful partial recovery
-                    self.session_stats['successful_scrapes'] += 1
-                    self.session_stats['total_content_size'] += len(raw_content)
+                    with self._stats_lock:
+                        self.session_stats.successful_scrapes += 1
+                        self.session_stats.total_content_size += len(raw_content)
                     
                 except Exception as db_error:
                     self.logger.error(f"Failed to save partial content for {url}: {db_error}")
@@ -1937,7 +3495,7 @@ class WebScraper:
             context: Error context
         """
         try:
-            self.logger.info(f"Attempting database recovery for {url}")
+            self.logger.info("Attempting database recovery for %s", url)
             
             # Check if we have content to retry saving
             scraped_content = context.get('scraped_content')
@@ -1953,12 +3511,14 @@ class WebScraper:
                     
                     # Retry saving the content
                     self.db_manager.insert_content(scraped_content)
-                    self.logger.info(f"Successfully recovered database operation for {url}")
+                    self._remember_content(url, scraped_content.content_hash, scraped_content.last_modified)
+                    self.logger.info("Successfully recovered database operation for %s", url)
                     
                     # Update session stats for successful recovery
-                    self.session_stats['successful_scrapes'] += 1
-                    if hasattr(scraped_content, 'content') and scraped_content.content:
-                        self.session_stats['total_content_size'] += len(scraped_content.content)
+                    with self._stats_lock:
+                        self.session_stats.successful_scrapes += 1
+                        if hasattr(scraped_content, 'content') and scraped_content.content:
+                            self.session_stats.total_content_size += len(scraped_content.content)
                     
                 except Exception as retry_error:
                     self.logger.error(f"Database recovery retry failed for {url}: {retry_error}")
@@ -1977,11 +3537,11 @@ class WebScraper:
             Dictionary with error pattern analysis
         """
         error_rates = self.error_engine.get_error_rates()
-        total_errors = len(self.session_stats['errors'])
-        
-        # Calculate error trend (recent vs overall)
-        recent_errors = self.session_stats['errors'][-10:] if total_errors > 10 else self.session_stats['errors']
-        recent_error_types = [e['error_type'] for e in recent_errors]
+        with self._stats_lock:
+            total_errors = len(self.session_stats.errors)
+            
+            # Calculate error trend (recent vs overall)
+            recent_error_types = list(self.session_stats.recent_error_types)
         
         analysis = {
             'total_errors': total_errors,
@@ -2017,32 +3577,35 @@ class WebScraper:
             Dictionary with error statistics, rates, and recommendations
         """
         pattern_analysis = self._analyze_error_patterns()
+        error_counts, total_requests = self.error_engine.get_error_counts()
+        with self._stats_lock:
+            recovery_actions = self.session_stats.recovery_actions.copy()
+            session_errors = len(self.session_stats.errors)
         
         return {
-            'error_counts': self.error_engine.error_counts.copy(),
+            'error_counts': error_counts,
             'error_rates': self.error_engine.get_error_rates(),
-            'total_requests': self.error_engine.total_requests,
-            'session_errors': len(self.session_stats['errors']),
+            'total_requests': total_requests,
+            'session_errors': session_errors,
             'session_id': self.session_id,
             'pattern_analysis': pattern_analysis,
             'recovery_statistics': {
-                'total_recovery_attempts': sum(1 for e in self.session_stats['errors'] 
-                                             if e.get('decision', {}).get('recovery_action')),
-                'partial_content_recoveries': sum(1 for e in self.session_stats['errors'] 
-                                                if e.get('decision', {}).get('recovery_action') == 'save_partial_content'),
-                'database_recoveries': sum(1 for e in self.session_stats['errors'] 
-                                         if e.get('decision', {}).get('recovery_action') == 'retry_database_operation')
+                'total_recovery_attempts': sum(recovery_actions.values()),
+                'partial_content_recoveries': recovery_actions['save_partial_content'],
+                'database_recoveries': recovery_actions['retry_database_operation']
             }
         }
     
-    def _apply_request_delay(self) -> None:
+    def reload_settings(self) -> None:
         """
-        Apply configured delay between requests to be respectful to servers.
+        Refresh the cached copies of settings used on every URL.
+        
+        Call after modifying self.settings so the per-URL paths see the new values.
         """
-        delay = self.settings.get('delay_between_requests', 1)
-        if delay > 0:
-            self.logger.debug(f"Applying request delay: {delay}s")
-            time.sleep(delay)
+        self.http_client.request_delay = self.settings.get('delay_between_requests', 1)
+        self._timeout = self.settings.get('timeout', 30)
+        self._max_retries = self.settings.get('retry_attempts', 3)
+        self._user_agent = self.settings.get('user_agent', 'WebScraper/1.0')
     
     def _create_session_result(self) -> ScrapingSession:
         """
@@ -2051,24 +3614,24 @@ class WebScraper:
         Returns:
             ScrapingSession object with complete results
         """
-        start_time = self.session_stats['start_time'] or datetime.now()
-        end_time = self.session_stats['end_time'] or datetime.now()
+        start_time = self.session_stats.start_time or datetime.now()
+        end_time = self.session_stats.end_time or datetime.now()
         
         # Calculate average response time
-        successful_scrapes = self.session_stats['successful_scrapes']
-        total_response_time = self.session_stats['total_response_time']
+        successful_scrapes = self.session_stats.successful_scrapes
+        total_response_time = self.session_stats.total_response_time
         average_response_time = (total_response_time / successful_scrapes) if successful_scrapes > 0 else 0.0
         
         return ScrapingSession(
             session_id=self.session_id,
             start_time=start_time,
             end_time=end_time,
-            total_urls=self.session_stats['total_urls'],
+            total_urls=self.session_stats.total_urls,
             successful_scrapes=successful_scrapes,
-            failed_scrapes=self.session_stats['failed_scrapes'],
-            skipped_urls=self.session_stats['skipped_urls'],
-            errors=self.session_stats['errors'],
-            total_content_size=self.session_stats['total_content_size'],
+            failed_scrapes=self.session_stats.failed_scrapes,
+            skipped_urls=self.session_stats.skipped_urls,
+            errors=self.session_stats.formatted_errors(),
+            total_content_size=self.session_stats.total_content_size,
             average_response_time=average_response_time
         )
     
@@ -2081,11 +3644,11 @@ class WebScraper:
         """
         return {
             'session_id': self.session_id,
-            'current_stats': self.session_stats.copy(),
+            'current_stats': self.session_stats.to_dict(),
             'http_client_stats': self.http_client.get_statistics(),
             'configuration': {
                 'total_configured_urls': len(self.urls_config),
-                'enabled_urls': len([u for u in self.urls_config if u.get('enabled', True)]),
+                'enabled_urls': len(self._enabled_urls),
                 'settings': self.settings
             }
         }
@@ -2096,6 +3659,7 @@ class WebScraper:
         """
         if hasattr(self.http_client, 'close'):
             self.http_client.close()
+        self._shutdown_extraction_pool()
         self.logger.debug("WebScraper resources cleaned up")
     
     def __enter__(self):
@@ -1,16 +1,105 @@
+import asyncio
+import atexit
+import inspect
 import logging
 import logging.handlers
+import multiprocessing
 import os
+import queue
 import hashlib
 import time
 import re
-from functools import wraps
-from typing import Dict, Any, Optional, Callable
-from urllib.parse import urlparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import wraps, lru_cache, partial
+from typing import Dict, Any, Optional, Callable, Iterable, List, Tuple, Union
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode, ParseResult
 
+# Optional hash packages for the 'xxh3_128' and 'blake3' content hash algorithms
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
 
-# Global logger registry to avoid duplicate logger creation
-_logger_registry = {}
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+CONTENT_HASH_ALGORITHMS = ('sha256', 'blake2b', 'blake3', 'xxh3_128')
+
+# Batches smaller than this are hashed inline; thread dispatch would cost more
+_PARALLEL_HASH_MIN_BYTES = 1024 * 1024
+
+# Normalization for the volatile-content hash, in one pass: tags with
+# attributes (groups 1-2) lose them, digit runs collapse to 0
+_VOLATILE_RE = re.compile(r'<([A-Za-z][\w:-]*)\s[^>]*?(/?)>|\d+')
+_DIGITS_RE = re.compile(r'\d+')
+
+# http(s) scheme followed by a non-empty authority (RFC 3986 appendix B)
+_HTTP_URL_RE = re.compile(r'(https?)://[^/?#\s]+', re.IGNORECASE)
+
+# Units for format_bytes, one per factor of 1024
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# Characters sanitize_filename replaces with '_', as a str.translate table
+_FILENAME_TRANSLATION = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+
+# Shared pool for hash_contents_batch, created on first large batch
+_hash_pool: Optional[ThreadPoolExecutor] = None
+_hash_pool_lock = threading.Lock()
+
+
+# Background thread that writes queued records to the log file (see setup_logging)
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+# Listener forwarding records from worker processes (see get_worker_log_queue)
+_worker_log_listener: Optional[logging.handlers.QueueListener] = None
+_worker_log_lock = threading.Lock()
+
+
+def _stop_log_listener() -> None:
+    """Flush queued records to the log file and stop the listener threads."""
+    global _log_listener, _worker_log_listener
+    if _worker_log_listener is not None:
+        _worker_log_listener.stop()
+        _worker_log_listener = None
+    if _log_listener is not None:
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.close()
+        _log_listener = None
+
+
+atexit.register(_stop_log_listener)
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Log formatter that formats the record time once per second.
+    
+    Records logged within the same second reuse the formatted time instead
+    of calling localtime() and strftime() again.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (second, formatted time) of the last record, swapped as one tuple so
+        # the console and listener threads never see a mismatched pair
+        self._cached_time = (None, '')
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        second = int(record.created)
+        cached_second, formatted = self._cached_time
+        if second != cached_second:
+            formatted = time.strftime(datefmt or self.default_time_format, self.converter(second))
+            self._cached_time = (second, formatted)
+        
+        # Without a datefmt, logging.Formatter appends the milliseconds
+        if datefmt or not self.default_msec_format:
+            return formatted
+        return self.default_msec_format % (formatted, record.msecs)
 
 
 def setup_logging(config: Dict[str, Any]) -> logging.Logger:
@@ -18,6 +107,8 @@ def setup_logging(config: Dict[str, Any]) -> logging.Logger:
     Configure logging based on configuration settings.
     
     Sets up rotating file handlers, structured formatting, and console output.
+    File writes happen on a background listener thread, so logging calls only
+    enqueue the record; queued records are flushed at interpreter exit.
     
     Args:
         config: Dictionary containing logging configuration with keys:
@@ -34,6 +125,8 @@ def setup_logging(config: Dict[str, Any]) -> logging.Logger:
         ValueError: If configuration is invalid
         OSError: If log directory cannot be created
     """
+    global _log_listener
+    
     try:
         # Extract configuration values
         log_level = config.get('level', 'INFO')
@@ -42,9 +135,9 @@ def setup_logging(config: Dict[str, Any]) -> logging.Logger:
         backup_count = config.get('backup_count', 5)
         log_format = config.get('format', '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
         
-        # Create log directory if it doesn't exist
+        # Create log directory if it doesn't exist (exist_ok makes an existence check redundant)
         log_dir = os.path.dirname(log_file)
-        if log_dir and not os.path.exists(log_dir):
+        if log_dir:
             os.makedirs(log_dir, exist_ok=True)
         
         # Convert log level string to logging constant
@@ -58,9 +151,10 @@ def setup_logging(config: Dict[str, Any]) -> logging.Logger:
         
         # Clear existing handlers to avoid duplicates
         root_logger.handlers.clear()
+        _stop_log_listener()
         
         # Create formatter
-        formatter = logging.Formatter(
+        formatter = CachedTimeFormatter(
             fmt=log_format,
             datefmt='%Y-%m-%d %H:%M:%S'
         )
@@ -75,7 +169,14 @@ def setup_logging(config: Dict[str, Any]) -> logging.Logger:
         )
         file_handler.setLevel(numeric_level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        
+        # Hand records to the file handler through a queue drained by a listener thread
+        log_queue = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setLevel(numeric_level)
+        _log_listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+        _log_listener.start()
+        root_logger.addHandler(queue_handler)
         
         # Set up console handler for INFO and above
         console_handler = logging.StreamHandler()
@@ -85,10 +186,10 @@ def setup_logging(config: Dict[str, Any]) -> logging.Logger:
         
         # Log the successful setup
         root_logger.info("Logging system initialized successfully")
-        root_logger.info(f"Log level: {log_level}")
-        root_logger.info(f"Log file: {log_file}")
-        root_logger.info(f"Max file size: {max_size_mb} MB")
-        root_logger.info(f"Backup count: {backup_count}")
+        root_logger.info("Log level: %s", log_level)
+        root_logger.info("Log file: %s", log_file)
+        root_logger.info("Max file size: %s MB", max_size_mb)
+        root_logger.info("Backup count: %s", backup_count)
         
         return root_logger
         
@@ -101,17 +202,73 @@ def setup_logging(config: Dict[str, Any]) -> logging.Logger:
             handler.setFormatter(logging.Formatter('%(levelname)s - %(message)s'))
             fallback_logger.addHandler(handler)
         
-        fallback_logger.error(f"Failed to set up logging: {e}")
+        fallback_logger.error("Failed to set up logging: %s", e)
         raise
 
 
+def get_worker_log_queue(mp_context=None):
+    """
+    Get a queue through which worker processes can log to this process's handlers.
+    
+    Child processes don't run the listener thread set up by setup_logging, so
+    records they log locally never reach the log file. Pass the returned queue
+    to setup_worker_logging() in each worker; a listener in this process
+    writes its records to the log file and console.
+    
+    Args:
+        mp_context: multiprocessing context the workers are started with
+        
+    Returns:
+        Queue for setup_worker_logging(), or None if setup_logging() hasn't run
+    """
+    global _worker_log_listener
+    
+    with _worker_log_lock:
+        if _log_listener is None:
+            return None
+        
+        if _worker_log_listener is None:
+            log_queue = (mp_context or multiprocessing).Queue()
+            handlers = _log_listener.handlers + tuple(
+                handler for handler in logging.getLogger().handlers
+                if not isinstance(handler, logging.handlers.QueueHandler)
+            )
+            _worker_log_listener = logging.handlers.QueueListener(
+                log_queue, *handlers, respect_handler_level=True
+            )
+            _worker_log_listener.start()
+        
+        return _worker_log_listener.queue
+
+
+def setup_worker_logging(log_queue, level: int = logging.INFO) -> None:
+    """
+    Send a worker process's log records to the parent through log_queue.
+    
+    Replaces any handlers inherited from the parent, so records are written
+    once, by the parent's listener.
+    
+    Args:
+        log_queue: Queue from get_worker_log_queue(), or None to leave logging unconfigured
+        level: Root log level for the worker
+    """
+    if log_queue is None:
+        return
+    
+    root_logger = logging.getLogger()
+    root_logger.handlers.clear()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    root_logger.setLevel(level)
+
+
+@lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for a specific module.
     
     Creates a logger with the specified name and ensures it uses the
-    parent logger's configuration. Maintains a registry to avoid
-    duplicate logger creation.
+    parent logger's configuration. logging.getLogger already returns one
+    logger per name; memoizing skips its module lock on repeat calls.
     
     Args:
         name: Name of the logger (typically __name__ of the module)
@@ -119,17 +276,7 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         Logger instance for the specified module
     """
-    # Check if logger already exists in registry
-    if name in _logger_registry:
-        return _logger_registry[name]
-    
-    # Create new logger
-    logger = logging.getLogger(f"WebScraper.{name}")
-    
-    # Store in registry
-    _logger_registry[name] = logger
-    
-    return logger
+    return logging.getLogger(f"WebScraper.{name}")
 
 
 def log_performance(func: Callable) -> Callable:
@@ -145,35 +292,36 @@ def log_performance(func: Callable) -> Callable:
     Returns:
         Decorated function with performance logging
     """
+    # Logger and name are fixed for the decorated function, so look them up once
+    logger = get_logger(func.__module__)
+    function_name = f"{func.__module__}.{func.__name__}"
+    
     @wraps(func)
     def wrapper(*args, **kwargs):
-        # Get logger for the function's module
-        logger = get_logger(func.__module__)
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         
         # Record start time
-        start_time = time.time()
-        function_name = f"{func.__module__}.{func.__name__}"
+        start_time = time.perf_counter()
         
-        logger.debug(f"Starting execution of {function_name}")
+        if debug_enabled:
+            logger.debug("Starting execution of %s", function_name)
         
         try:
             # Execute the function
             result = func(*args, **kwargs)
             
-            # Calculate execution time
-            execution_time = time.time() - start_time
-            
             # Log successful execution
-            logger.debug(f"Completed {function_name} in {execution_time:.3f} seconds")
+            if debug_enabled:
+                logger.debug("Completed %s in %.3f seconds", function_name, time.perf_counter() - start_time)
             
             return result
             
         except Exception as e:
             # Calculate execution time even for failed executions
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             
             # Log failed execution
-            logger.error(f"Failed {function_name} after {execution_time:.3f} seconds: {e}")
+            logger.error("Failed %s after %.3f seconds: %s", function_name, execution_time, e)
             
             # Re-raise the exception
             raise
@@ -181,40 +329,289 @@ def log_performance(func: Callable) -> Callable:
     return wrapper
 
 
-def calculate_content_hash(content: str) -> str:
+def _check_hash_algorithm(algorithm: str) -> None:
+    """Raise ValueError unless algorithm is a usable content hash algorithm."""
+    if algorithm not in CONTENT_HASH_ALGORITHMS:
+        raise ValueError(f"Unknown content hash algorithm: {algorithm}")
+    if algorithm == 'xxh3_128' and xxhash is None:
+        raise ValueError("The 'xxh3_128' content hash algorithm requires the xxhash package")
+    if algorithm == 'blake3' and blake3 is None:
+        raise ValueError("The 'blake3' content hash algorithm requires the blake3 package")
+
+
+def calculate_content_hash(content: Union[str, bytes], algorithm: str = 'sha256') -> str:
     """
-    Calculate SHA-256 hash of content for duplicate detection.
+    Calculate hash of content for duplicate detection.
+    
+    Hashes are only compared with hashes produced by the same algorithm, so
+    changing the algorithm makes previously stored hashes stop matching.
     
     Args:
-        content: Content string to hash
+        content: Content to hash; str is hashed as UTF-8, bytes (e.g. an
+            already-encoded body) are hashed as-is without another copy
+        algorithm: One of CONTENT_HASH_ALGORITHMS; 'blake2b', 'blake3' and
+            'xxh3_128' are faster than 'sha256' on large pages
         
     Returns:
-        Hexadecimal hash string
+        Hexadecimal hash string (32 hex characters for 'xxh3_128', 64 otherwise)
+        
+    Raises:
+        ValueError: If the algorithm is unknown or its package is not installed
     """
+    _check_hash_algorithm(algorithm)
+    
     if not content:
         return ""
     
-    # Convert to bytes and calculate hash
-    content_bytes = content.encode('utf-8')
-    hash_object = hashlib.sha256(content_bytes)
-    return hash_object.hexdigest()
+    # Convert to bytes (unless already encoded) and calculate hash
+    content_bytes = content.encode('utf-8') if isinstance(content, str) else content
+    if algorithm == 'sha256':
+        return hashlib.sha256(content_bytes).hexdigest()
+    if algorithm == 'blake2b':
+        return hashlib.blake2b(content_bytes, digest_size=32).hexdigest()
+    if algorithm == 'blake3':
+        return blake3.blake3(content_bytes).hexdigest()
+    return xxhash.xxh3_128_hexdigest(content_bytes)
+
+
+def _volatile_replacement(match: re.Match) -> str:
+    """Replacement for _VOLATILE_RE: tags keep only their (digit-normalized) name, digit runs become 0."""
+    name = match.group(1)
+    if name is None:
+        return '0'
+    return f"<{_DIGITS_RE.sub('0', name)}{match.group(2)}>"
+
+
+def normalize_volatile_content(content: str) -> str:
+    """
+    Strip tag attributes and collapse digit runs to 0.
+    
+    Pages that differ only in visitor counters, timestamps or cache-busting
+    attributes normalize to the same string.
+    
+    Args:
+        content: Extracted content (text or HTML)
+        
+    Returns:
+        Normalized content, the same object if nothing was replaced
+    """
+    normalized, replacements = _VOLATILE_RE.subn(_volatile_replacement, content)
+    return normalized if replacements else content
+
+
+def calculate_content_hashes(content: str, algorithm: str = 'sha256') -> Tuple[str, str]:
+    """
+    Hash content both as-is and with tag attributes and digits normalized away.
+    
+    Content the normalization leaves unchanged is only hashed once.
+    
+    Args:
+        content: Extracted content (text or HTML)
+        algorithm: Content hash algorithm passed to calculate_content_hash
+        
+    Returns:
+        Tuple of (content hash, normalized content hash)
+    """
+    content_hash = calculate_content_hash(content, algorithm)
+    normalized = normalize_volatile_content(content)
+    if normalized is content:
+        return content_hash, content_hash
+    return content_hash, calculate_content_hash(normalized, algorithm)
+
+
+def hash_stream(chunks: Iterable[Union[str, bytes]], algorithm: str = 'sha256') -> str:
+    """
+    Calculate a content hash incrementally over chunks.
+    
+    Gives the same result as calculate_content_hash on the concatenated
+    content, without ever holding the whole content in memory (e.g. for
+    bodies read with response.iter_content()).
+    
+    Args:
+        chunks: Content pieces; str chunks are hashed as UTF-8
+        algorithm: One of CONTENT_HASH_ALGORITHMS
+        
+    Returns:
+        Hexadecimal hash string, or "" if there was no content
+        
+    Raises:
+        ValueError: If the algorithm is unknown or its package is not installed
+    """
+    _check_hash_algorithm(algorithm)
+    
+    if algorithm == 'sha256':
+        hasher = hashlib.sha256()
+    elif algorithm == 'blake2b':
+        hasher = hashlib.blake2b(digest_size=32)
+    elif algorithm == 'blake3':
+        hasher = blake3.blake3()
+    else:
+        hasher = xxhash.xxh3_128()
+    
+    empty = True
+    for chunk in chunks:
+        if chunk:
+            hasher.update(chunk.encode('utf-8') if isinstance(chunk, str) else chunk)
+            empty = False
+    
+    return "" if empty else hasher.hexdigest()
+
+
+def _get_hash_pool() -> ThreadPoolExecutor:
+    """Get the shared hashing thread pool, creating it on first use."""
+    global _hash_pool
+    with _hash_pool_lock:
+        if _hash_pool is None:
+            _hash_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1,
+                                            thread_name_prefix='content-hash')
+        return _hash_pool
+
+
+def hash_contents_batch(contents: Iterable[Union[str, bytes]], algorithm: str = 'sha256') -> List[str]:
+    """
+    Calculate content hashes for many items, in parallel for large batches.
+    
+    hashlib releases the GIL while hashing large buffers, so batches of
+    multi-KB pages are spread over a thread pool and hashed on several cores.
+    
+    Args:
+        contents: Items to hash, as accepted by calculate_content_hash
+        algorithm: One of CONTENT_HASH_ALGORITHMS
+        
+    Returns:
+        Hashes in the same order as contents
+        
+    Raises:
+        ValueError: If the algorithm is unknown or its package is not installed
+    """
+    # Encode up front so the pool threads spend their time in the hash itself
+    byte_list = [content.encode('utf-8') if isinstance(content, str) else content
+                 for content in contents]
+    hash_bytes = partial(calculate_content_hash, algorithm=algorithm)
+    
+    if len(byte_list) < 2 or sum(len(item) for item in byte_list) < _PARALLEL_HASH_MIN_BYTES:
+        return [hash_bytes(item) for item in byte_list]
+    return list(_get_hash_pool().map(hash_bytes, byte_list))
 
 
 def validate_url(url: str) -> bool:
     """
     Validate URL format.
     
+    A URL is valid if it has an http or https scheme and a non-empty host.
+    Lowercase schemes are checked with plain prefix tests; anything else
+    goes through the memoized regex.
+    
     Args:
         url: URL string to validate
         
     Returns:
         True if URL is valid, False otherwise
     """
-    try:
-        result = urlparse(url)
-        return all([result.scheme, result.netloc]) and result.scheme in ['http', 'https']
-    except Exception:
+    if not isinstance(url, str):
         return False
+    
+    if url.startswith('https://'):
+        host_start = 8
+    elif url.startswith('http://'):
+        host_start = 7
+    else:
+        # Mixed-case schemes are rare; everything not starting with "http" is invalid
+        return url[:4].lower() == 'http' and _is_http_url(url)
+    
+    # The host must be non-empty, i.e. not start with a path, query, fragment or space
+    return len(url) > host_start and url[host_start] not in '/?#' and not url[host_start].isspace()
+
+
+@lru_cache(maxsize=4096)
+def _is_http_url(url: str) -> bool:
+    """Match url against _HTTP_URL_RE, memoized per URL string."""
+    return _HTTP_URL_RE.match(url) is not None
+
+
+@lru_cache(maxsize=4096)
+def parse_url(url: str) -> ParseResult:
+    """
+    Parse URL, memoizing results since the same URL is parsed several times per fetch.
+    
+    Args:
+        url: URL string to parse
+    
+    Returns:
+        Immutable urllib ParseResult
+    """
+    return urlparse(url)
+
+
+@lru_cache(maxsize=4096)
+def get_base_url(url: str) -> str:
+    """
+    Get the scheme://netloc base of a URL, memoized per URL string.
+    
+    Args:
+        url: URL string
+    
+    Returns:
+        Base URL without path, query or fragment
+    """
+    parsed = parse_url(url)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+@lru_cache(maxsize=4096)
+def get_host(url: str) -> str:
+    """
+    Get the netloc (host and optional port) of a URL, memoized per URL string.
+    
+    Args:
+        url: URL string
+    
+    Returns:
+        Network location, or an empty string for relative URLs
+    """
+    return parse_url(url).netloc
+
+
+@lru_cache(maxsize=4096)
+def canonicalize_url(url: str) -> str:
+    """
+    Canonicalize URL so equivalent spellings map to the same key.
+    
+    Lowercases the scheme and host, drops default ports and the fragment,
+    sorts query parameters and normalizes an empty path to '/'. Results are
+    memoized because duplicate detection canonicalizes each URL several times.
+    
+    Args:
+        url: URL string to canonicalize
+    
+    Returns:
+        Canonical URL string, or the URL unchanged if it cannot be parsed
+        (such as a malformed port or IPv6 address)
+    """
+    try:
+        parsed = parse_url(url.strip())
+        port = parsed.port
+    except ValueError:
+        return url
+    
+    scheme = parsed.scheme.lower()
+    host = (parsed.hostname or '').lower()
+    if ':' in host:
+        # hostname drops the brackets around IPv6 addresses
+        host = f"[{host}]"
+    
+    if port and not ((scheme == 'http' and port == 80) or (scheme == 'https' and port == 443)):
+        host = f"{host}:{port}"
+    
+    if parsed.username:
+        userinfo = parsed.username
+        if parsed.password:
+            userinfo += f":{parsed.password}"
+        host = f"{userinfo}@{host}"
+    
+    query = urlencode(sorted(parse_qsl(parsed.query, keep_blank_values=True)))
+    
+    return urlunparse((scheme, host, parsed.path or '/', parsed.params, query, ''))
 
 
 def format_bytes(bytes_count: int) -> str:
@@ -230,7 +627,12 @@ def format_bytes(bytes_count: int) -> str:
     if bytes_count == 0:
         return "0 B"
     
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
+    if isinstance(bytes_count, int) and bytes_count > 0:
+        # Each unit covers 10 more bits: values below 1024 have at most 10 bits
+        unit_index = min((bytes_count.bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+        return f"{bytes_count / (1 << (unit_index * 10)):.1f} {_BYTE_UNITS[unit_index]}"
+    
+    for unit in _BYTE_UNITS[:-1]:
         if bytes_count < 1024.0:
             return f"{bytes_count:.1f} {unit}"
         bytes_count /= 1024.0
@@ -243,16 +645,18 @@ def get_current_timestamp() -> str:
     Get current timestamp in ISO format.
     
     Returns:
-        ISO formatted timestamp string
+        ISO formatted local timestamp string (YYYY-MM-DDTHH:MM:SS)
     """
-    return time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime())
+    return datetime.now().isoformat(timespec='seconds')
 
 
+@lru_cache(maxsize=4096)
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize filename for safe file operations.
     
     Removes or replaces characters that could be problematic in filenames.
+    Results are memoized, since filenames are often derived from repeated titles.
     
     Args:
         filename: Original filename
@@ -261,7 +665,7 @@ def sanitize_filename(filename: str) -> str:
         Sanitized filename
     """
     # Remove or replace problematic characters
-    sanitized = re.sub(r'[<>:"/\\|?*]', '_', filename)
+    sanitized = filename.translate(_FILENAME_TRANSLATION)
     
     # Remove leading/trailing whitespace and dots
     sanitized = sanitized.strip('. ')
@@ -270,11 +674,9 @@ def sanitize_filename(filename: str) -> str:
     if not sanitized:
         sanitized = 'unnamed'
     
-    # Limit length to 255 characters (common filesystem limit)
-    if len(sanitized) > 255:
-        sanitized = sanitized[:255]
-    
-    return sanitized
+    # Limit length to 255 characters (common filesystem limit); the slice returns
+    # the same string when it is already short enough
+    return sanitized[:255]
 
 
 def retry_with_backoff(func: Callable, max_retries: int = 3, delay: float = 1.0, 
@@ -282,8 +684,11 @@ def retry_with_backoff(func: Callable, max_retries: int = 3, delay: float = 1.0,
     """
     Retry function with exponential backoff.
     
+    Coroutine functions get an async wrapper that waits with asyncio.sleep,
+    so backoff never blocks the event loop.
+    
     Args:
-        func: Function to retry
+        func: Function or coroutine function to retry
         max_retries: Maximum number of retry attempts
         delay: Initial delay between retries in seconds
         backoff_factor: Factor to multiply delay by after each retry
@@ -291,6 +696,34 @@ def retry_with_backoff(func: Callable, max_retries: int = 3, delay: float = 1.0,
     Returns:
         Decorated function with retry logic
     """
+    retry_delays = [delay * (backoff_factor ** attempt) for attempt in range(max_retries)]
+    
+    def handle_failure(logger: logging.Logger, attempt: int, error: Exception) -> float:
+        """Log a failed attempt and return the delay before the next one (re-raises on the last)."""
+        if attempt == max_retries:
+            logger.error("Function %s failed after %s retries: %s", func.__name__, max_retries, error)
+            raise
+        
+        retry_delay = retry_delays[attempt]
+        logger.warning("Function %s failed (attempt %s/%s): %s", func.__name__, attempt + 1, max_retries + 1, error)
+        logger.info("Retrying in %.1f seconds...", retry_delay)
+        return retry_delay
+    
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            logger = get_logger(func.__module__)
+            
+            for attempt in range(max_retries + 1):
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    await asyncio.sleep(handle_failure(logger, attempt, e))
+            
+            return None  # Should never reach here
+        
+        return async_wrapper
+    
     @wraps(func)
     def wrapper(*args, **kwargs):
         logger = get_logger(func.__module__)
@@ -299,14 +732,7 @@ def retry_with_backoff(func: Callable, max_retries: int = 3, delay: float = 1.0,
             try:
                 return func(*args, **kwargs)
             except Exception as e:
-                if attempt == max_retries:
-                    logger.error(f"Function {func.__name__} failed after {max_retries} retries: {e}")
-                    raise
-                
-                retry_delay = delay * (backoff_factor ** attempt)
-                logger.warning(f"Function {func.__name__} failed (attempt {attempt + 1}/{max_retries + 1}): {e}")
-                logger.info(f"Retrying in {retry_delay:.1f} seconds...")
-                time.sleep(retry_delay)
+                time.sleep(handle_failure(logger, attempt, e))
         
         return None  # Should never reach here
     
@@ -325,10 +751,10 @@ def log_system_info():
     logger = get_logger(__name__)
     
     logger.info("System Information:")
-    logger.info(f"Python version: {sys.version}")
-    logger.info(f"Platform: {platform.platform()}")
-    logger.info(f"Architecture: {platform.architecture()[0]}")
-    logger.info(f"Working directory: {os.getcwd()}")
+    logger.info("Python version: %s", sys.version)
+    logger.info("Platform: %s", platform.platform())
+    logger.info("Architecture: %s", platform.architecture()[0])
+    logger.info("Working directory: %s", os.getcwd())
 
 
 def create_performance_logger(name: str) -> logging.Logger:
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Unit tests for BloomFilter class.
+
+This module contains tests for the Bloom filter used as an in-memory
+front-end for duplicate detection, including membership and growth.
+"""
+
+import unittest
+import os
+import sys
+
+# Add src directory to Python path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from bloom_filter import BloomFilter, ScalableBloomFilter
+
+
+class TestBloomFilter(unittest.TestCase):
+    """Test cases for BloomFilter class."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.bloom = BloomFilter(capacity=1000, error_rate=0.001)
+    
+    def test_initialization(self):
+        """Test filter sizing from capacity and error rate."""
+        self.assertGreater(self.bloom.num_bits, 1000)
+        self.assertGreater(self.bloom.num_hashes, 1)
+        self.assertEqual(len(self.bloom), 0)
+    
+    def test_invalid_parameters(self):
+        """Test invalid capacity and error rate are rejected."""
+        with self.assertRaises(ValueError):
+            BloomFilter(capacity=0)
+        with self.assertRaises(ValueError):
+            BloomFilter(error_rate=1.5)
+    
+    def test_no_false_negatives(self):
+        """Test every added item is reported as present."""
+        items = [f"https://example.com/page-{i}" for i in range(1000)]
+        self.bloom.update(items)
+        
+        for item in items:
+            self.assertIn(item, self.bloom)
+        self.assertEqual(len(self.bloom), 1000)
+    
+    def test_false_positive_rate(self):
+        """Test unseen items are rarely reported as present."""
+        self.bloom.update(f"https://example.com/page-{i}" for i in range(1000))
+        
+        false_positives = sum(1 for i in range(10000)
+                              if f"https://other.com/page-{i}" in self.bloom)
+        self.assertLess(false_positives, 50)
+
+
+class TestScalableBloomFilter(unittest.TestCase):
+    """Test cases for ScalableBloomFilter class."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.bloom = ScalableBloomFilter(initial_capacity=100, error_rate=0.001)
+    
+    def test_grows_beyond_initial_capacity(self):
+        """Test filters are added as items exceed the initial capacity."""
+        items = [f"https://example.com/page-{i}" for i in range(1000)]
+        self.bloom.update(items)
+        
+        for item in items:
+            self.assertIn(item, self.bloom)
+        self.assertGreater(self.bloom.capacity, 1000)
+        # Items that were already false positives are not added again
+        self.assertGreater(len(self.bloom), 990)
+    
+    def test_false_positive_rate_after_growth(self):
+        """Test the overall false positive rate stays bounded after growing."""
+        self.bloom.update(f"https://example.com/page-{i}" for i in range(1000))
+        
+        false_positives = sum(1 for i in range(10000)
+                              if f"https://other.com/page-{i}" in self.bloom)
+        self.assertLess(false_positives, 50)
+    
+    def test_repeated_adds_do_not_use_capacity(self):
+        """Test adding the same item again doesn't count against capacity."""
+        for _ in range(500):
+            self.bloom.add('https://example.com/same')
+        
+        self.assertEqual(len(self.bloom), 1)
+        self.assertEqual(self.bloom.capacity, 100)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Unit tests for ContentExtractor class.
+
+This module contains tests for title and content extraction, covering the
+lxml fast path, the streaming parser, encoding detection and HTML-preserving
+output. Expected titles and content are the output of the original
+BeautifulSoup-only extractor, so stored content hashes stay comparable.
+"""
+
+import unittest
+import requests
+import requests.utils
+import sys
+import os
+
+# Add src directory to Python path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from scraper import ContentExtractor, _ends_mid_character
+from utils import calculate_content_hash
+
+
+TEST_URL = 'https://example.com/articles/test-page'
+
+
+def make_response(body, content_type='text/html; charset=utf-8', url=TEST_URL):
+    """
+    Build a requests.Response for body as requests would for these headers.
+    
+    Args:
+        body: Raw response body
+        content_type: Content-Type header value, or None to omit the header
+        url: Response URL
+        
+    Returns:
+        requests.Response with the body already read
+    """
+    response = requests.Response()
+    response._content = body
+    response._content_consumed = True
+    response.status_code = 200
+    response.url = url
+    if content_type is not None:
+        response.headers['Content-Type'] = content_type
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    return response
+
+
+PAGE = (b'<!DOCTYPE html><html><head><title>  Test   Page - Example Site </title>\n'
+        b'<meta charset="utf-8"><style>p {color: red}</style><script>var x = 1;</script></head>\n'
+        b'<body><header><h1>Site header</h1></header><nav><a href="/">Home</a></nav>\n'
+        b'<div class="sidebar">Sidebar links</div>\n'
+        b'<main><h2>Heading</h2><p>First paragraph with <b>bold</b> and <a href="/x">a link</a>.</p>\n'
+        b'<p>Second&nbsp;paragraph &amp; entities &lt;tag&gt; caf\xc3\xa9</p><br><img src="a.png" alt="x">\n'
+        b'<!-- a comment --><div class="ads">Buy now</div><ul><li>One</li><li>Two</li></ul></main>\n'
+        b'<footer>Footer text</footer><div id="comments">Comment 1</div></body></html>')
+
+# (name, body, content type, title, content) as the BeautifulSoup extractor produced them
+PARITY_CASES = [
+    ('page', PAGE, 'text/html; charset=utf-8', 'Test Page',
+     'Heading First paragraph with bold and a link . Second paragraph & entities <tag> café One Two'),
+    ('no_content_type', PAGE, None, 'Test Page',
+     'Heading First paragraph with bold and a link . Second paragraph & entities <tag> café One Two'),
+    ('no_main', b'<html><head><title>No main</title></head><body><div class="navbar">Menu</div>'
+     b'<div class="wrapper"><p>Body text</p><div class="footer">f</div><p>More</p></div></body></html>',
+     'text/html', 'No main', 'Body text More'),
+    ('selector_preference', b'<html><body><article>Article text</article><div class="content">Content div</div>'
+     b'<main>Main text</main></body></html>', 'text/html', 'Test Page - example.com', 'Main text'),
+    ('content_inside_removed', b'<html><body><header><main>in header</main></header>'
+     b'<article>Real article</article></body></html>', 'text/html', 'Test Page - example.com', 'Real article'),
+    ('h1_title', b'<html><head><title>   </title></head><body><h1>  Big <span>Title</span> here </h1>'
+     b'<p>text</p></body></html>', 'text/html', 'BigTitlehere', 'Big Title here text'),
+    ('og_title', b'<html><head><meta property="og:title" content=" OG Title | Site "></head>'
+     b'<body><p>text</p></body></html>', 'text/html', 'OG Title', 'text'),
+    ('meta_title', b'<html><head><meta name="title" content="Meta Title"></head><body><p>text</p></body></html>',
+     'text/html', 'Meta Title', 'text'),
+    ('url_title', b'<html><body><p>text only</p></body></html>', 'text/html', 'Test Page - example.com', 'text only'),
+    ('removed_tails', b'<html><body><main>foo<script>x()</script>bar<span>baz</span>qux<nav>n</nav>end</main>'
+     b'</body></html>', 'text/html', 'Test Page - example.com', 'foo bar baz qux end'),
+    ('template_and_ruby', '<html><body><h1>T<template>x</template>itle</h1><main><template>tmpl</template>'
+     '<ruby>漢<rp>(</rp><rt>kan</rt><rp>)</rp></ruby>字 <iframe>ifr</iframe></main></body></html>'.encode('utf-8'),
+     'text/html', 'Title', '漢 字 ifr'),
+    ('byte_order_mark', '\ufeff<html><head><title>BOM</title></head><body><main>café</main></body></html>'.encode('utf-8'),
+     'text/html', 'BOM', 'café'),
+    ('uppercase_tags', b'<HTML><BODY><MAIN CLASS="X">Upper</MAIN><NAV>n</NAV></BODY></HTML>', 'text/html',
+     'Test Page - example.com', 'Upper'),
+    # Charsets declared wrongly or not at all
+    ('meta_charset', '<html><head><meta http-equiv="Content-Type" content="text/html; charset=windows-1252">'
+     '<title>Café</title></head><body><main>Crème “quoted”</main></body></html>'.encode('cp1252'),
+     'text/html', 'Café', 'Crème “quoted”'),
+    ('utf8_body_latin1_header', '<html><head><title>Café</title></head><body><main>Crème brûlée naïve</main>'
+     '</body></html>'.encode('utf-8'), 'text/html; charset=ISO-8859-1', 'Café', 'Crème brûlée naïve'),
+    ('latin1_body_utf8_header', '<html><head><title>Café</title></head><body><main>Crème brûlée and more text after'
+     '</main></body></html>'.encode('latin-1'), 'text/html; charset=utf-8',
+     'Caf\ufffd', 'Cr\ufffdme br\ufffdl\ufffde and more text after'),
+    ('cp1252_body_utf8_meta', '<html><head><meta charset="utf-8"><title>Café</title></head><body><main>'
+     'Crème “quoted” text after</main></body></html>'.encode('cp1252'), 'text/html',
+     'Caf\ufffd', 'Cr\ufffdme \ufffdquoted\ufffd text after'),
+    ('unknown_charset', '<html><head><title>Café</title></head><body><main>Crème</main></body></html>'.encode('utf-8'),
+     'text/html; charset=x-bogus', 'Café', 'Crème'),
+    # Truncated documents
+    ('truncated_mid_element', b'<html><head><title>Cut</title></head><body><main><p>Hello wor', 'text/html',
+     'Cut', 'Hello wor'),
+    ('truncated_mid_tag', b'<html><head><title>Cut</title></head><body><main><p>Hello</p><p class="a', 'text/html',
+     'Cut', 'Hello'),
+    ('truncated_in_head', b'<html><head><title>Cut off tit', 'text/html', 'Cut off tit', 'Cut off tit'),
+    ('truncated_utf8_character', '<html><body><main>café 日本'.encode('utf-8')[:-1], 'text/html; charset=utf-8',
+     'Test Page - example.com', 'café 日\ufffd'),
+    ('truncated_shift_jis_character', '<html><head><meta charset="shift_jis"><title>日本</title></head>'
+     '<body><main>日本語'.encode('shift_jis')[:-1], 'text/html', '日本', '日本\ufffd'),
+]
+
+
+class TestBaselineParity(unittest.TestCase):
+    """Test cases comparing extraction paths against the BeautifulSoup extractor."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.extractors = {
+            'lxml': ContentExtractor({'min_content_length': 0}),
+            'streaming': ContentExtractor({'min_content_length': 0, 'stream_parse_threshold': 1}),
+        }
+    
+    def test_title_content_and_hash(self):
+        """Test every extraction path reproduces the BeautifulSoup title, content and hash."""
+        for path, extractor in self.extractors.items():
+            for name, body, content_type, title, content in PARITY_CASES:
+                with self.subTest(path=path, document=name):
+                    result = extractor.extract_content(make_response(body, content_type), TEST_URL)
+                    
+                    self.assertEqual(result.title, title)
+                    self.assertEqual(result.content, content)
+                    self.assertEqual(result.content_hash, calculate_content_hash(content))
+    
+    def test_max_content_size_never_splits_a_character(self):
+        """Test a size limit falling inside a character doesn't leave a replacement character behind."""
+        body = '<html><body><main>日本語</main></body></html>'.encode('utf-8')
+        limit = body.index('語'.encode('utf-8')) + 1
+        
+        for stream_parse_threshold in (1, len(body)):
+            extractor = ContentExtractor({'min_content_length': 0, 'max_content_size': limit,
+                                          'stream_parse_threshold': stream_parse_threshold})
+            with self.subTest(stream_parse_threshold=stream_parse_threshold):
+                result = extractor.extract_content(make_response(body), TEST_URL)
+                
+                self.assertTrue(result.content.startswith('日本'))
+                self.assertNotIn('\ufffd', result.content)
+
+
+class TestEncodingDetection(unittest.TestCase):
+    """Test cases for charset detection where the baseline extractor was wrong."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.extractor = ContentExtractor({'min_content_length': 0})
+    
+    def test_latin1_header_applies_to_latin1_body(self):
+        """Test a Latin-1 header is used for a body that is not valid UTF-8."""
+        body = '<html><head><title>Café</title></head><body><main>Crème brûlée</main></body></html>'.encode('latin-1')
+        response = make_response(body, 'text/html; charset=iso-8859-1')
+        
+        self.assertEqual(self.extractor._detect_encoding(response), 'iso-8859-1')
+        self.assertEqual(self.extractor.extract_content(response, TEST_URL).content, 'Crème brûlée')
+    
+    def test_latin1_header_yields_to_utf8_body(self):
+        """Test a Latin-1 header, often a server default, does not override a UTF-8 body."""
+        response = make_response('<p>naïve</p>'.encode('utf-8'), 'text/html; charset=ISO-8859-1')
+        
+        self.assertEqual(self.extractor._detect_encoding(response), 'utf-8')
+    
+    def test_latin1_header_yields_to_meta_charset(self):
+        """Test a meta charset declaration wins over a Latin-1 header."""
+        body = '<meta charset="windows-1252"><p>“quoted”</p>'.encode('cp1252')
+        
+        self.assertEqual(self.extractor._detect_encoding(make_response(body, 'text/html; charset=latin-1')),
+                         'windows-1252')
+    
+    def test_meta_charset_after_first_kilobyte(self):
+        """Test a meta charset declared after a long comment is still found."""
+        body = (b'<html><head><!--' + b'x' * 1100 + b'--><meta charset="windows-1252"><title>Late</title></head>'
+                + '<body><main>Café</main></body></html>'.encode('cp1252'))
+        
+        result = self.extractor.extract_content(make_response(body, 'text/html'), TEST_URL)
+        
+        self.assertEqual(result.content, 'Café')
+    
+    def test_ends_mid_character(self):
+        """Test detection of an incomplete trailing multi-byte character."""
+        self.assertTrue(_ends_mid_character('日本'.encode('utf-8')[:-1], 'utf-8'))
+        self.assertFalse(_ends_mid_character('日本'.encode('utf-8'), 'utf-8'))
+        self.assertFalse(_ends_mid_character('日本'.encode('utf-16'), 'utf-16'))
+        self.assertFalse(_ends_mid_character(b'abc', 'x-bogus'))
+
+
+class TestPreserveHtml(unittest.TestCase):
+    """Test cases for HTML-preserving extraction."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.extractor = ContentExtractor({'preserve_html': True, 'min_content_length': 0})
+    
+    def test_html_output_uses_beautifulsoup_serialization(self):
+        """Test HTML output keeps BeautifulSoup's serialization, so stored hashes still match."""
+        body = (b'<html><body><nav>menu</nav><main><p>One<br>two &amp; <b>three</b></p>'
+                b'<span class="ads">ad</span> tail</main></body></html>')
+        
+        result = self.extractor.extract_content(make_response(body), TEST_URL)
+        
+        expected = '<main><p>One<br/>two &amp; <b>three</b></p> tail</main>'
+        self.assertEqual(result.content, expected)
+        self.assertEqual(result.content_hash, calculate_content_hash(expected))
+    
+    def test_fragment_has_no_wrapper_element(self):
+        """Test a document fragment is not wrapped in an extra element."""
+        result = self.extractor.extract_content(make_response(b'<p>Just a fragment</p><p>two</p>'), TEST_URL)
+        
+        self.assertEqual(result.content, '<body><p>Just a fragment</p><p>two</p></body>')
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
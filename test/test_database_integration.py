@@ -38,10 +38,16 @@ class TestDatabaseIntegration(unittest.TestCase):
             'password': os.getenv('TEST_DB_PASSWORD', 'secure_password'),
             'max_connections': 5,
             'min_connections': 2,
-            'connection_timeout': 10
+            'connection_timeout': 10,
+            # Same per-worker schema as test_database_queries, so xdist workers
+            # never drop or clean up each other's tables
+            'schema': os.getenv('TEST_DB_SCHEMA') or (
+                f"test_{os.environ['PYTEST_XDIST_WORKER']}" if 'PYTEST_XDIST_WORKER' in os.environ else None
+            )
         }
         
         cls.db_manager = None
+        cls.tables_created = False
     
     def setUp(self):
         """Set up each test."""
@@ -51,7 +57,10 @@ class TestDatabaseIntegration(unittest.TestCase):
         # Try to connect - if this fails, skip the test
         try:
             self.db_manager.connect()
-            self.db_manager.create_tables()  # Ensure tables exist
+            # Ensure tables exist; test_table_creation recreates any it drops
+            if not self.tables_created:
+                self.db_manager.create_tables()
+                type(self).tables_created = True
         except psycopg2.Error as e:
             self.skipTest(f"Cannot connect to test database: {e}")
     
@@ -59,9 +68,13 @@ class TestDatabaseIntegration(unittest.TestCase):
         """Clean up after each test."""
         if self.db_manager:
             try:
-                # Clean up test data
-                self.db_manager.execute_query("DELETE FROM scraped_content WHERE url LIKE 'https://test-%'")
-                self.db_manager.execute_query("DELETE FROM scraping_stats WHERE scrape_session_id LIKE 'test-%'")
+                # Clean up test data from both tables in one round-trip
+                self.db_manager.execute_query("""
+                    WITH deleted_content AS (
+                        DELETE FROM scraped_content WHERE url LIKE %s
+                    )
+                    DELETE FROM scraping_stats WHERE scrape_session_id LIKE %s
+                """, ('https://test-%', 'test-%'))
                 self.db_manager.disconnect()
             except Exception as e:
                 print(f"Error during cleanup: {e}")
@@ -87,7 +100,6 @@ class TestDatabaseIntegration(unittest.TestCase):
             url="https://test-example.com",
             title="Test Example Title",
             content="This is test content for insertion",
-            content_hash=calculate_content_hash("This is test content for insertion"),
             response_status=200,
             response_time_ms=150,
             content_length=34
@@ -188,6 +200,22 @@ class TestDatabaseIntegration(unittest.TestCase):
         self.assertEqual(latest_hash, second_hash)
         self.assertNotEqual(latest_hash, first_hash)
     
+    def test_get_url_hash_pairs(self):
+        """Test url/hash pairs are returned only for the requested URLs."""
+        for url, text in [("https://test-pairs-a.com", "First"), ("https://test-pairs-a.com", "Second"),
+                          ("https://test-pairs-a.com", "Second"), ("https://test-pairs-b.com", "Other")]:
+            self.db_manager.insert_content(ScrapedContent(
+                url=url, title="Pairs Test", content=text,
+                content_hash=calculate_content_hash(text), response_status=200
+            ))
+        
+        pairs = self.db_manager.get_url_hash_pairs(["https://test-pairs-a.com", "https://test-pairs-missing.com"])
+        self.assertEqual(sorted(pairs), sorted([
+            ("https://test-pairs-a.com", calculate_content_hash("First")),
+            ("https://test-pairs-a.com", calculate_content_hash("Second"))
+        ]))
+        self.assertEqual(self.db_manager.get_url_hash_pairs([]), [])
+    
     def test_last_modified_storage(self):
         """Test storage and retrieval of Last-Modified headers."""
         test_url = "https://test-last-modified.com"
@@ -423,6 +451,25 @@ class TestDatabaseUtilities(unittest.TestCase):
         # Test None content
         none_hash = calculate_content_hash(None)
         self.assertEqual(none_hash, "")
+    
+    def test_scraped_content_hash_derived(self):
+        """Test ScrapedContent hashes content when no content_hash is given."""
+        content = ScrapedContent(url="https://example.com", content="Page text")
+        self.assertEqual(content.content_hash, calculate_content_hash("Page text"))
+        
+        content = ScrapedContent(url="https://example.com", content="Page text", hash_algorithm='blake2b')
+        self.assertEqual(content.content_hash, calculate_content_hash("Page text", 'blake2b'))
+        
+        # Without content there is nothing to hash
+        self.assertIsNone(ScrapedContent(url="https://example.com").content_hash)
+    
+    def test_scraped_content_hash_kept(self):
+        """Test a given content_hash is kept instead of hashing content again."""
+        with patch('database.calculate_content_hash') as calculate:
+            content = ScrapedContent(url="https://example.com", content="Page text", content_hash="abc123")
+        
+        self.assertEqual(content.content_hash, "abc123")
+        calculate.assert_not_called()
 
 
 class TestDatabaseMocking(unittest.TestCase):
@@ -458,6 +505,18 @@ class TestDatabaseMocking(unittest.TestCase):
         self.assertEqual(custom_db_manager.min_connections, 3)
         self.assertEqual(custom_db_manager.max_connections, 15)
         self.assertEqual(custom_db_manager.connection_timeout, 60)
+        
+        # Without a schema the server's search_path is left alone
+        self.assertIsNone(db_manager.schema)
+        self.assertNotIn('options', db_manager.db_params)
+        
+        schema_db_manager = DatabaseManager(dict(config, schema='test_gw0'))
+        self.assertEqual(schema_db_manager.db_params['options'], '-c search_path=test_gw0')
+        
+        # Names search_path would case-fold or split are rejected
+        for schema in ('Test_GW0', 'test schema', 'test"schema'):
+            with self.assertRaises(ValueError):
+                DatabaseManager(dict(config, schema=schema))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the analytics data classes.
+
+This module contains tests for the ContentStatistics, TrendAnalysis and
+SearchResult data classes. They need no database, so they can run where
+PostgreSQL isn't available.
+"""
+
+import unittest
+import os
+import sys
+from dataclasses import asdict
+
+# Add src directory to Python path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from database_queries import ContentStatistics, TrendAnalysis, SearchResult
+
+
+class TestDataClasses(unittest.TestCase):
+    """Test data classes used in analytics."""
+    
+    def test_content_statistics_dataclass(self):
+        """Test ContentStatistics dataclass."""
+        stats = ContentStatistics(
+            total_content=100,
+            unique_urls=50,
+            status_distribution={200: 80, 404: 15, 500: 5},
+            avg_response_time_ms=150.5,
+            avg_content_length=1024,
+            content_by_day={'2023-01-01': 20, '2023-01-02': 30},
+            most_scraped_urls=[],
+            least_scraped_urls=[],
+            error_rate=20.0,
+            success_rate=80.0
+        )
+        
+        self.assertEqual(stats.total_content, 100)
+        self.assertEqual(stats.unique_urls, 50)
+        self.assertEqual(stats.success_rate, 80.0)
+        self.assertEqual(stats.error_rate, 20.0)
+        
+        # Test conversion to dict
+        stats_dict = asdict(stats)
+        self.assertIsInstance(stats_dict, dict)
+        self.assertEqual(stats_dict['total_content'], 100)
+    
+    def test_trend_analysis_dataclass(self):
+        """Test TrendAnalysis dataclass."""
+        trends = TrendAnalysis(
+            period_days=30,
+            success_rate_trend=[],
+            response_time_trend=[],
+            content_change_frequency={},
+            error_patterns=[],
+            volume_trend=[]
+        )
+        
+        self.assertEqual(trends.period_days, 30)
+        self.assertIsInstance(trends.success_rate_trend, list)
+    
+    def test_search_result_dataclass(self):
+        """Test SearchResult dataclass."""
+        search_result = SearchResult(
+            total_matches=42,
+            results=[],
+            facets={},
+            query_time_ms=123.45
+        )
+        
+        self.assertEqual(search_result.total_matches, 42)
+        self.assertEqual(search_result.query_time_ms, 123.45)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Unit tests for ErrorDecisionEngine class.
+
+This module contains table-driven tests for the error decision matrix: each
+exception class and HTTP status code maps to its retry, failure counting and
+recovery action decision.
+"""
+
+import unittest
+import psycopg2
+import sys
+import os
+
+# Add src directory to Python path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from scraper import (
+    ErrorDecisionEngine, ScrapingError, NetworkError, ParseError,
+    RobotsError, ConfigurationError, DatabaseError
+)
+
+
+class CustomNetworkError(NetworkError):
+    """NetworkError subclass, resolved through the MRO."""
+    pass
+
+
+class TestErrorDecisionMatrix(unittest.TestCase):
+    """Test cases for decisions by exception class."""
+    
+    # (error, attempt_number, should_retry, should_continue, count_as_failure, recovery_action)
+    DECISIONS = [
+        (NetworkError("Timed out"), 1, True, True, False, 'retry_with_backoff'),
+        (NetworkError("Timed out"), 3, False, True, True, 'skip_url'),
+        (NetworkError("Server error", status_code=500), 1, True, True, False, 'retry_with_backoff'),
+        (NetworkError("Server error", status_code=503), 3, False, True, True, 'skip_url'),
+        (NetworkError("Not found", status_code=404), 1, False, True, True, 'skip_url'),
+        (NetworkError("Forbidden", status_code=403), 1, False, True, True, 'skip_url'),
+        (NetworkError("Rate limited", status_code=429), 1, False, True, True, 'skip_url'),
+        (CustomNetworkError("Reset", status_code=502), 1, True, True, False, 'retry_with_backoff'),
+        (ParseError("Bad markup"), 1, False, True, False, 'save_partial_content'),
+        (RobotsError("Disallowed"), 1, False, True, False, 'skip_url'),
+        (ConfigurationError("Bad selector"), 1, False, False, True, 'stop_execution'),
+        (DatabaseError("Insert failed"), 1, True, False, True, 'retry_database_operation'),
+        (DatabaseError("Insert failed"), 3, False, True, True, 'stop_execution'),
+        (psycopg2.OperationalError("Connection lost"), 1, True, False, True, 'retry_database_operation'),
+        (psycopg2.IntegrityError("Duplicate key"), 3, False, True, True, 'stop_execution'),
+        (ScrapingError("Generic"), 1, False, True, True, 'skip_url'),
+        (ValueError("Unexpected"), 1, False, True, True, 'skip_url'),
+        (KeyError("missing"), 1, False, True, True, 'skip_url'),
+    ]
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.engine = ErrorDecisionEngine({})
+    
+    def test_decision_matrix(self):
+        """Test each exception class and status code gets its decision."""
+        for error, attempt_number, should_retry, should_continue, count_as_failure, recovery_action in self.DECISIONS:
+            context = {'attempt_number': attempt_number, 'max_retries': 3}
+            with self.subTest(error=repr(error), status_code=getattr(error, 'status_code', None),
+                              attempt_number=attempt_number):
+                decision = self.engine.get_error_decision(error, context)
+                
+                self.assertEqual(decision.should_retry, should_retry)
+                self.assertEqual(decision.should_continue, should_continue)
+                self.assertEqual(decision.count_as_failure, count_as_failure)
+                self.assertEqual(decision.recovery_action, recovery_action)
+    
+    def test_default_context(self):
+        """Test a missing context means the first of three attempts."""
+        self.assertTrue(self.engine.get_error_decision(NetworkError("Timed out")).should_retry)
+        self.assertTrue(self.engine.get_error_decision(DatabaseError("Insert failed")).should_retry)
+    
+    def test_log_levels(self):
+        """Test the log level of each error type."""
+        levels = {
+            NetworkError("Not found", status_code=404): 'ERROR',
+            NetworkError("Timed out"): 'WARNING',
+            ParseError("Bad markup"): 'ERROR',
+            RobotsError("Disallowed"): 'WARNING',
+            ConfigurationError("Bad selector"): 'CRITICAL',
+            DatabaseError("Insert failed"): 'CRITICAL',
+            ValueError("Unexpected"): 'ERROR',
+        }
+        for error, log_level in levels.items():
+            with self.subTest(error=repr(error)):
+                self.assertEqual(self.engine.get_error_decision(error).log_level, log_level)
+
+
+class TestErrorCounts(unittest.TestCase):
+    """Test cases for error rate tracking."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.engine = ErrorDecisionEngine({})
+    
+    def test_counts_by_class_name(self):
+        """Test errors are counted under their class name."""
+        for error in (NetworkError("a"), NetworkError("b"), psycopg2.OperationalError("c"), ValueError("d")):
+            self.engine.get_error_decision(error)
+        
+        counts, total = self.engine.get_error_counts()
+        
+        self.assertEqual(total, 4)
+        self.assertEqual(counts['NetworkError'], 2)
+        self.assertEqual(counts['OperationalError'], 1)
+        self.assertEqual(counts['ValueError'], 1)
+        self.assertEqual(counts['DatabaseError'], 0)
+    
+    def test_error_rates(self):
+        """Test error rates are recomputed after new errors."""
+        self.assertEqual(self.engine.get_error_rates()['ParseError'], 0.0)
+        
+        self.engine.get_error_decision(ParseError("a"))
+        self.engine.get_error_decision(RobotsError("b"))
+        
+        rates = self.engine.get_error_rates()
+        self.assertEqual(rates['ParseError'], 0.5)
+        self.assertEqual(rates['RobotsError'], 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
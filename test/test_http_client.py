@@ -9,6 +9,7 @@ including retry logic, error handling, session management, and metrics collectio
 import unittest
 import time
 import threading
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
 import requests
 from requests.exceptions import Timeout, ConnectionError, HTTPError, SSLError, ChunkedEncodingError
@@ -18,12 +19,36 @@ import os
 # Add src directory to Python path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from scraper import HTTPClient, NetworkError, ScrapingError, RequestMetrics
+from scraper import HTTPClient, NetworkError, ParseError, ScrapingError, RequestMetrics
+
+
+def make_response(status_code, content, url):
+    """
+    Build a lightweight stand-in for a streamed requests.Response.
+    
+    Plain attributes are much cheaper to read than Mock's, and provide
+    everything fetch_url touches on a response.
+    """
+    return SimpleNamespace(
+        status_code=status_code,
+        content=content,
+        url=url,
+        headers={},
+        iter_content=lambda chunk_size=None: iter([content]),
+        close=lambda: None
+    )
 
 
 class TestHTTPClient(unittest.TestCase):
     """Test cases for HTTPClient class."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build error responses shared by every test (fetch_url never modifies them)."""
+        cls.not_found_response = make_response(404, b'Not Found', 'https://example.com/missing')
+        cls.server_error_response = make_response(500, b'Internal Server Error', 'https://example.com/error')
+        cls.rate_limited_response = make_response(429, b'Too Many Requests', 'https://example.com/rate-limited')
+    
     def setUp(self):
         """Set up test environment."""
         # Test configuration
@@ -62,11 +87,7 @@ class TestHTTPClient(unittest.TestCase):
         # Add a small delay to ensure response time > 0
         def slow_response(*args, **kwargs):
             time.sleep(0.001)  # 1ms delay
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.content = b'Test content'
-            mock_response.url = 'https://example.com'
-            return mock_response
+            return make_response(200, b'Test content', 'https://example.com')
         
         mock_get.side_effect = slow_response
         
@@ -94,17 +115,13 @@ class TestHTTPClient(unittest.TestCase):
         self.assertEqual(stats['success_rate_percent'], 100.0)
         
         # Verify session.get was called with correct parameters
-        mock_get.assert_called_once_with('https://example.com', timeout=10)
+        mock_get.assert_called_once_with('https://example.com', timeout=10, headers={}, stream=True)
     
     @patch('requests.Session.get')
     def test_http_error_no_retry(self, mock_get):
         """Test HTTP 4xx errors that should not be retried."""
         # Mock 404 response
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_response.content = b'Not Found'
-        mock_response.url = 'https://example.com/missing'
-        mock_get.return_value = mock_response
+        mock_get.return_value = self.not_found_response
         
         # Request should fail with NetworkError
         with self.assertRaises(NetworkError) as context:
@@ -129,11 +146,7 @@ class TestHTTPClient(unittest.TestCase):
     def test_http_error_with_retry(self, mock_get):
         """Test HTTP 5xx errors that should be retried."""
         # Mock 500 response
-        mock_response = Mock()
-        mock_response.status_code = 500
-        mock_response.content = b'Internal Server Error'
-        mock_response.url = 'https://example.com/error'
-        mock_get.return_value = mock_response
+        mock_get.return_value = self.server_error_response
         
         # Request should fail after retries
         with self.assertRaises(NetworkError) as context:
@@ -151,11 +164,7 @@ class TestHTTPClient(unittest.TestCase):
     def test_rate_limit_retry(self, mock_get):
         """Test HTTP 429 (rate limit) errors are retried."""
         # Mock 429 response
-        mock_response = Mock()
-        mock_response.status_code = 429
-        mock_response.content = b'Too Many Requests'
-        mock_response.url = 'https://example.com/rate-limited'
-        mock_get.return_value = mock_response
+        mock_get.return_value = self.rate_limited_response
         
         # Request should fail after retries
         with self.assertRaises(NetworkError):
@@ -224,10 +233,7 @@ class TestHTTPClient(unittest.TestCase):
     def test_successful_retry_after_failure(self, mock_get):
         """Test successful request after initial failures."""
         # Mock response: first two fail, third succeeds
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.content = b'Success after retry'
-        mock_response.url = 'https://example.com/retry-success'
+        mock_response = make_response(200, b'Success after retry', 'https://example.com/retry-success')
         
         mock_get.side_effect = [
             Timeout('First attempt timeout'),
@@ -248,6 +254,148 @@ class TestHTTPClient(unittest.TestCase):
         # Verify all attempts were made
         self.assertEqual(mock_get.call_count, 3)
     
+    @patch('requests.Session.get')
+    def test_oversized_body_rejected(self, mock_get):
+        """Test bodies without Content-Length fail like declared ones once past the limit."""
+        config = self.test_config.copy()
+        config['max_content_size'] = 100
+        client = HTTPClient(config)
+        
+        chunks = iter([b'A' * 64, b'B' * 64, b'C' * 64])
+        mock_response = requests.Response()
+        mock_response.status_code = 200
+        mock_response.url = 'https://example.com/large'
+        mock_response.raw = Mock()
+        mock_response.iter_content = Mock(return_value=chunks)
+        mock_get.return_value = mock_response
+        
+        try:
+            with self.assertRaises(ParseError) as context:
+                client.fetch_url('https://example.com/large')
+        finally:
+            client.close()
+        
+        # The download stops at the first chunk past the limit
+        self.assertEqual(context.exception.content_length, 128)
+        self.assertEqual(next(chunks), b'C' * 64)
+        mock_response.raw.close.assert_called()
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(client.get_statistics()['failed_requests'], 1)
+    
+    @patch('requests.Session.get')
+    def test_body_at_limit_accepted(self, mock_get):
+        """Test a body of exactly max_content_size is read in full."""
+        config = self.test_config.copy()
+        config['max_content_size'] = 128
+        client = HTTPClient(config)
+        
+        mock_response = requests.Response()
+        mock_response.status_code = 200
+        mock_response.url = 'https://example.com/large'
+        mock_response.raw = Mock()
+        mock_response.iter_content = Mock(return_value=iter([b'A' * 64, b'B' * 64]))
+        mock_get.return_value = mock_response
+        
+        try:
+            response, metrics = client.fetch_url('https://example.com/large')
+        finally:
+            client.close()
+        
+        self.assertEqual(response.content, b'A' * 64 + b'B' * 64)
+        self.assertEqual(metrics.content_length, 128)
+    
+    @patch('requests.Session.get')
+    def test_html_only_skips_non_html_body(self, mock_get):
+        """Test html_only leaves non-HTML bodies undownloaded and still reads HTML ones."""
+        responses = {}
+        for content_type in ('image/png', 'application/pdf', 'text/html; charset=utf-8', 'application/xhtml+xml', None):
+            response = requests.Response()
+            response.status_code = 200
+            response.url = 'https://example.com/file'
+            response.raw = Mock()
+            if content_type:
+                response.headers['Content-Type'] = content_type
+            response.iter_content = Mock(return_value=iter([b'body bytes']))
+            responses[content_type] = response
+        
+        try:
+            for content_type, mock_response in responses.items():
+                mock_get.return_value = mock_response
+                with self.subTest(content_type=content_type):
+                    response, metrics = self.client.fetch_url('https://example.com/file', html_only=True)
+                    
+                    if content_type in ('image/png', 'application/pdf'):
+                        self.assertEqual(response.content, b'')
+                        mock_response.iter_content.assert_not_called()
+                        mock_response.raw.close.assert_called()
+                    else:
+                        self.assertEqual(response.content, b'body bytes')
+                    self.assertEqual(response.status_code, 200)
+        finally:
+            self.client.close()
+    
+    @patch('requests.Session.get')
+    def test_non_html_body_read_by_default(self, mock_get):
+        """Test bodies of any type are downloaded without html_only (e.g. robots.txt)."""
+        mock_response = requests.Response()
+        mock_response.status_code = 200
+        mock_response.url = 'https://example.com/robots.txt'
+        mock_response.raw = Mock()
+        mock_response.headers['Content-Type'] = 'text/plain'
+        mock_response.iter_content = Mock(return_value=iter([b'User-agent: *']))
+        mock_get.return_value = mock_response
+        
+        try:
+            response, metrics = self.client.fetch_url('https://example.com/robots.txt')
+        finally:
+            self.client.close()
+        
+        self.assertEqual(response.content, b'User-agent: *')
+    
+    @patch('requests.Session.get')
+    def test_oversized_content_length_rejected(self, mock_get):
+        """Test declared Content-Length over the limit fails without downloading."""
+        config = self.test_config.copy()
+        config['max_content_size'] = 100
+        client = HTTPClient(config)
+        
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {'Content-Length': '5000'}
+        mock_get.return_value = mock_response
+        
+        try:
+            with self.assertRaises(ParseError) as context:
+                client.fetch_url('https://example.com/huge')
+        finally:
+            client.close()
+        
+        self.assertEqual(context.exception.content_length, 5000)
+        mock_response.iter_content.assert_not_called()
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(client.get_statistics()['failed_requests'], 1)
+    
+    @patch('requests.Session.get')
+    def test_shutdown_interrupts_retry_backoff(self, mock_get):
+        """Test request_shutdown cuts a retry backoff short."""
+        config = self.test_config.copy()
+        config['retry_delay'] = 30  # Long enough that an uninterrupted wait would hang the test
+        client = HTTPClient(config)
+        
+        mock_get.side_effect = Timeout('Request timed out')
+        threading.Timer(0.1, client.request_shutdown).start()
+        
+        start_time = time.time()
+        try:
+            with self.assertRaises(ScrapingError) as context:
+                client.fetch_url('https://example.com/timeout')
+        finally:
+            client.close()
+        
+        self.assertLess(time.time() - start_time, 5)
+        self.assertNotIsInstance(context.exception, NetworkError)
+        self.assertEqual(mock_get.call_count, 1)
+    
     def test_retry_delay_calculation(self):
         """Test exponential backoff calculation."""
         # Test exponential backoff with jitter
@@ -345,6 +493,48 @@ class TestHTTPClient(unittest.TestCase):
         finally:
             client_with_delay.close()
     
+    def test_crawl_delay_extends_host_schedule(self):
+        """Test a longer crawl delay holds back only its own host."""
+        config_with_delay = self.test_config.copy()
+        config_with_delay['delay_between_requests'] = 0.05
+        client_with_delay = HTTPClient(config_with_delay)
+        
+        try:
+            client_with_delay._apply_request_delay('a.example.com', crawl_delay=0.3)
+            self.assertGreater(client_with_delay.host_wait_time('a.example.com'), 0.2)
+            self.assertLessEqual(client_with_delay.host_wait_time('b.example.com'), 0)
+            
+            # Other hosts are not delayed
+            start_time = time.monotonic()
+            client_with_delay._apply_request_delay('b.example.com')
+            self.assertLess(time.monotonic() - start_time, 0.05)
+        finally:
+            client_with_delay.close()
+    
+    def test_concurrent_request_delay_spacing(self):
+        """Test concurrent requests to one host each wait for their own slot."""
+        config_with_delay = self.test_config.copy()
+        config_with_delay['delay_between_requests'] = 0.05
+        client_with_delay = HTTPClient(config_with_delay)
+        request_times = []
+        
+        def request():
+            client_with_delay._apply_request_delay('example.com')
+            request_times.append(time.monotonic())
+        
+        try:
+            threads = [threading.Thread(target=request) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            client_with_delay.close()
+        
+        request_times.sort()
+        for earlier, later in zip(request_times, request_times[1:]):
+            self.assertGreaterEqual(later - earlier, 0.04)
+    
     def test_concurrent_requests(self):
         """Test thread safety of HTTP client."""
         results = []
@@ -353,11 +543,7 @@ class TestHTTPClient(unittest.TestCase):
         def make_request(url_suffix):
             try:
                 with patch('requests.Session.get') as mock_get:
-                    mock_response = Mock()
-                    mock_response.status_code = 200
-                    mock_response.content = f'Content {url_suffix}'.encode()
-                    mock_response.url = f'https://example.com/{url_suffix}'
-                    mock_get.return_value = mock_response
+                    mock_get.return_value = make_response(200, f'Content {url_suffix}'.encode(), f'https://example.com/{url_suffix}')
                     
                     response, metrics = self.client.fetch_url(f'https://example.com/{url_suffix}')
                     results.append((url_suffix, response.status_code))
@@ -386,6 +572,43 @@ class TestHTTPClient(unittest.TestCase):
         for url_suffix, status_code in results:
             self.assertEqual(status_code, 200)
     
+    def test_sessions_are_per_thread(self):
+        """Test each thread gets its own session and close() closes them all."""
+        sessions = []
+        threads = [threading.Thread(target=lambda: sessions.append(self.client._get_session()))
+                   for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(len({id(session) for session in sessions}), 3)
+        self.assertIs(self.client._get_session(), self.client._get_session())
+        
+        self.client.close()
+        self.assertIsNone(self.client.session)
+        self.assertIsNotNone(self.client._get_session())
+    
+    @patch('requests.Session.get')
+    def test_concurrent_request_counting(self, mock_get):
+        """Test request counters are exact when many threads fetch at once."""
+        mock_get.side_effect = lambda url, **kwargs: make_response(200, b'ok', url)
+        
+        def fetch_many(thread_index):
+            for i in range(25):
+                self.client.fetch_url(f'https://example.com/{thread_index}/{i}')
+        
+        threads = [threading.Thread(target=fetch_many, args=(index,)) for index in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        stats = self.client.get_statistics()
+        self.assertEqual(stats['total_requests'], 200)
+        self.assertEqual(stats['successful_requests'], 200)
+        self.assertEqual(stats['failed_requests'], 0)
+    
     def test_context_manager(self):
         """Test HTTPClient as context manager."""
         config = self.test_config.copy()
@@ -396,11 +619,7 @@ class TestHTTPClient(unittest.TestCase):
             
             # Mock a successful request
             with patch('requests.Session.get') as mock_get:
-                mock_response = Mock()
-                mock_response.status_code = 200
-                mock_response.content = b'Test content'
-                mock_response.url = 'https://example.com'
-                mock_get.return_value = mock_response
+                mock_get.return_value = make_response(200, b'Test content', 'https://example.com')
                 
                 response, metrics = client.fetch_url('https://example.com')
                 self.assertEqual(response.status_code, 200)
@@ -415,11 +634,7 @@ class TestHTTPClient(unittest.TestCase):
             # Add a small delay to ensure response time > 0
             def slow_response(*args, **kwargs):
                 time.sleep(0.001)  # 1ms delay
-                mock_response = Mock()
-                mock_response.status_code = 200
-                mock_response.content = b'A' * 1000  # 1000 bytes
-                mock_response.url = 'https://example.com/metrics'
-                return mock_response
+                return make_response(200, b'A' * 1000, 'https://example.com/metrics')  # 1000 bytes
             
             mock_get.side_effect = slow_response
             
@@ -502,10 +717,7 @@ class TestRequestMetrics(unittest.TestCase):
         client = HTTPClient(self.test_config)
         
         # Mock successful response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.content = b'Test content'
-        mock_response.url = 'https://example.com/conditional'
+        mock_response = make_response(200, b'Test content', 'https://example.com/conditional')
         mock_response.headers = {'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT'}
         mock_get.return_value = mock_response
         
@@ -534,12 +746,7 @@ class TestRequestMetrics(unittest.TestCase):
         client = HTTPClient(self.test_config)
         
         # Mock 304 Not Modified response
-        mock_response = Mock()
-        mock_response.status_code = 304
-        mock_response.content = b''
-        mock_response.url = 'https://example.com/not-modified'
-        mock_response.headers = {}
-        mock_get.return_value = mock_response
+        mock_get.return_value = make_response(304, b'', 'https://example.com/not-modified')
         
         last_modified = 'Wed, 21 Oct 2015 07:28:00 GMT'
         
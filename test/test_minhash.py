@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Unit tests for MinHash near-duplicate detection.
+
+This module contains tests for MinHash signatures and the banded LSH index
+used to skip storing pages that are nearly identical to ones already stored.
+"""
+
+import unittest
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Add src directory to Python path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from minhash import MinHasher, MinHashLSH, estimate_jaccard
+
+
+BASE_TEXT = ' '.join(f"word{i} token{i % 7} value{i % 13}" for i in range(300))
+
+
+class TestMinHasher(unittest.TestCase):
+    """Test cases for MinHasher class."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.hasher = MinHasher(num_perm=64)
+    
+    def test_signature_length(self):
+        """Test signature has one value per permutation."""
+        self.assertEqual(len(self.hasher.signature(BASE_TEXT)), 64)
+    
+    def test_signatures_are_deterministic(self):
+        """Test separate hashers with the same settings agree."""
+        self.assertEqual(self.hasher.signature(BASE_TEXT), MinHasher(num_perm=64).signature(BASE_TEXT))
+    
+    def test_case_and_punctuation_ignored(self):
+        """Test tokenization ignores case and punctuation."""
+        self.assertEqual(
+            self.hasher.signature("Hello, World! This is a test page."),
+            self.hasher.signature("hello world this is a test page")
+        )
+    
+    def test_similarity_estimates(self):
+        """Test near-identical texts score high and unrelated texts score low."""
+        near_duplicate = BASE_TEXT + " updated 2025-01-01"
+        unrelated = ' '.join(f"other{i} text{i}" for i in range(300))
+        
+        signature = self.hasher.signature(BASE_TEXT)
+        self.assertGreater(estimate_jaccard(signature, self.hasher.signature(near_duplicate)), 0.85)
+        self.assertLess(estimate_jaccard(signature, self.hasher.signature(unrelated)), 0.2)
+    
+    def test_invalid_parameters(self):
+        """Test invalid permutation count and shingle size are rejected."""
+        with self.assertRaises(ValueError):
+            MinHasher(num_perm=0)
+        with self.assertRaises(ValueError):
+            MinHasher(shingle_size=0)
+
+
+class TestMinHashLSH(unittest.TestCase):
+    """Test cases for MinHashLSH class."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.hasher = MinHasher(num_perm=64)
+        self.index = MinHashLSH(threshold=0.85, num_perm=64)
+    
+    def test_band_layout(self):
+        """Test bands times rows covers the whole signature."""
+        self.assertEqual(self.index.bands * self.index.rows, 64)
+    
+    def test_query_finds_near_duplicate(self):
+        """Test a near-duplicate is found and an unrelated text is not."""
+        self.index.insert('https://example.com/a', self.hasher.signature(BASE_TEXT))
+        
+        near_duplicate = self.hasher.signature(BASE_TEXT + " visitors 12345")
+        unrelated = self.hasher.signature(' '.join(f"other{i} text{i}" for i in range(300)))
+        
+        self.assertEqual(self.index.query(near_duplicate), 'https://example.com/a')
+        self.assertIsNone(self.index.query(unrelated))
+        self.assertEqual(len(self.index), 1)
+    
+    def test_concurrent_insert_and_query(self):
+        """Test queries running alongside inserts never see a half-inserted key."""
+        signatures = [self.hasher.signature(f"{BASE_TEXT} page{i}") for i in range(50)]
+        
+        def insert_then_query(i):
+            self.index.insert(f'https://example.com/{i}', signatures[i])
+            return self.index.query(signatures[i])
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(insert_then_query, range(50)))
+        
+        self.assertNotIn(None, results)
+        self.assertEqual(len(self.index), 50)
+    
+    def test_signature_length_mismatch(self):
+        """Test signatures of the wrong length are rejected."""
+        with self.assertRaises(ValueError):
+            self.index.insert('key', (1, 2, 3))
+    
+    def test_invalid_threshold(self):
+        """Test thresholds outside (0, 1] are rejected."""
+        with self.assertRaises(ValueError):
+            MinHashLSH(threshold=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
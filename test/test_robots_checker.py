@@ -7,6 +7,7 @@ compliance checking, and integration with the web scraping workflow.
 """
 
 import unittest
+import tempfile
 import time
 import threading
 from unittest.mock import Mock, MagicMock, patch
@@ -295,6 +296,48 @@ Crawl-delay: invalid_number
         self.robot_checker._get_robots_rules('https://example.com')
         self.mock_http_client.fetch_url.assert_called_once()
     
+    def test_disk_cache_warm_start(self):
+        """Test parsed rules persisted to disk are reused by a new checker."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.text = "User-agent: *\nDisallow: /private/"
+        
+        self.mock_http_client.fetch_url.return_value = (mock_response, Mock())
+        
+        with tempfile.TemporaryDirectory() as cache_dir:
+            config = self.config.copy()
+            config['robots_cache_dir'] = cache_dir
+            
+            # First checker fetches and persists the rules
+            rules1 = RobotChecker(config, self.mock_http_client)._get_robots_rules('https://example.com')
+            self.mock_http_client.fetch_url.assert_called_once()
+            
+            # A fresh checker (new process) loads them without fetching
+            self.mock_http_client.fetch_url.reset_mock()
+            rules2 = RobotChecker(config, self.mock_http_client)._get_robots_rules('https://example.com')
+            self.mock_http_client.fetch_url.assert_not_called()
+            self.assertEqual(rules1, rules2)
+    
+    def test_disk_cache_expiration(self):
+        """Test expired disk cache entries are refetched."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.text = "User-agent: *\nDisallow: /private/"
+        
+        self.mock_http_client.fetch_url.return_value = (mock_response, Mock())
+        
+        with tempfile.TemporaryDirectory() as cache_dir:
+            config = self.config.copy()
+            config['robots_cache_dir'] = cache_dir
+            
+            RobotChecker(config, self.mock_http_client)._get_robots_rules('https://example.com')
+            
+            robot_checker = RobotChecker(config, self.mock_http_client)
+            robot_checker.cache_ttl = 0
+            self.mock_http_client.fetch_url.reset_mock()
+            robot_checker._get_robots_rules('https://example.com')
+            self.mock_http_client.fetch_url.assert_called_once()
+    
     def test_cache_key_generation(self):
         """Test cache key generation for different URLs."""
         # Same domain should have same cache key
@@ -445,6 +488,24 @@ Crawl-delay: 5
         self.assertEqual(stats['valid_entries'], 2)
         self.assertEqual(stats['expired_entries'], 0)
     
+    def test_cache_evicts_least_recently_used(self):
+        """Test the cache keeps at most robots_cache_max_entries domains."""
+        robot_checker = RobotChecker({'robots_cache_max_entries': 2}, self.mock_http_client)
+        
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.text = "User-agent: *\nDisallow: /"
+        
+        self.mock_http_client.fetch_url.return_value = (mock_response, Mock())
+        
+        robot_checker._get_robots_rules('https://a.com')
+        robot_checker._get_robots_rules('https://b.com')
+        robot_checker._get_robots_rules('https://a.com')  # a.com is now most recently used
+        robot_checker._get_robots_rules('https://c.com')
+        
+        self.assertEqual(list(robot_checker._robots_cache), ['https://a.com', 'https://c.com'])
+        self.assertEqual(self.mock_http_client.fetch_url.call_count, 3)
+    
     def test_clear_cache(self):
         """Test cache clearing functionality."""
         # Add cache entry
@@ -489,6 +550,39 @@ Crawl-delay: 5
         
         # Should have only one cache entry despite multiple threads
         self.assertEqual(len(self.robot_checker._robots_cache), 1)
+    
+    def test_concurrent_loads_fetch_once(self):
+        """Test concurrent lookups for an uncached domain share one fetch."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.text = "User-agent: *\nDisallow: /private"
+        
+        fetch_started = threading.Event()
+        release_fetch = threading.Event()
+        
+        def slow_fetch(*args, **kwargs):
+            fetch_started.set()
+            release_fetch.wait(5)
+            return mock_response, Mock()
+        
+        self.mock_http_client.fetch_url.side_effect = slow_fetch
+        
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(
+            self.robot_checker._get_robots_rules('https://example.com'))) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        
+        fetch_started.wait(5)
+        time.sleep(0.05)
+        release_fetch.set()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(self.mock_http_client.fetch_url.call_count, 1)
+        self.assertEqual(len(results), 5)
+        self.assertTrue(all(rules is results[0] for rules in results))
+        self.assertEqual(self.robot_checker._pending_loads, {})
 
 
 class TestRobotCheckerIntegration(unittest.TestCase):
@@ -2,19 +2,31 @@ import unittest
 import tempfile
 import os
 import logging
+import multiprocessing
 import time
+from concurrent.futures import ProcessPoolExecutor
 from unittest.mock import patch, MagicMock, call
 import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from utils import (
     calculate_content_hash,
+    calculate_content_hashes,
+    hash_contents_batch,
+    hash_stream,
     validate_url,
+    parse_url,
+    get_base_url,
+    get_host,
+    canonicalize_url,
     format_bytes,
     get_current_timestamp,
     sanitize_filename,
     retry_with_backoff,
     setup_logging,
+    get_worker_log_queue,
+    setup_worker_logging,
+    CachedTimeFormatter,
     get_logger,
     log_performance,
     log_system_info
@@ -64,6 +76,86 @@ class TestCalculateContentHash(unittest.TestCase):
         hash1 = calculate_content_hash(content1)
         hash2 = calculate_content_hash(content2)
         self.assertNotEqual(hash1, hash2)
+    
+    def test_bytes_content(self):
+        """Test bytes are hashed the same as their UTF-8 string."""
+        content = "Hello, 世界!"
+        self.assertEqual(calculate_content_hash(content.encode('utf-8')), calculate_content_hash(content))
+        self.assertEqual(calculate_content_hash(b""), "")
+    
+    def test_blake2b_algorithm(self):
+        """Test hashing with BLAKE2b differs from SHA-256 but keeps the width."""
+        content = "Hello, World!"
+        result = calculate_content_hash(content, 'blake2b')
+        self.assertEqual(len(result), 64)
+        self.assertNotEqual(result, calculate_content_hash(content))
+    
+    def test_blake3_algorithm(self):
+        """Test hashing with BLAKE3 gives the published test vector."""
+        try:
+            import blake3  # noqa: F401
+        except ImportError:
+            self.skipTest("blake3 package not installed")
+        result = calculate_content_hash("abc", 'blake3')
+        self.assertEqual(result, "6437b3ac38465133ffb63b75273a8db548c558465d79db03fd359c6cd5bd9d85")
+    
+    def test_unknown_algorithm(self):
+        """Test an unknown hash algorithm is rejected."""
+        with self.assertRaises(ValueError):
+            calculate_content_hash("content", 'md5')
+
+
+class TestHashContentsBatch(unittest.TestCase):
+    """Test the hash_contents_batch function."""
+    
+    def test_small_batch_matches_single_hashes(self):
+        """Test small batches hash inline and keep input order."""
+        contents = ["first", b"second", ""]
+        self.assertEqual(hash_contents_batch(contents), [calculate_content_hash(c) for c in contents])
+    
+    def test_large_batch_matches_single_hashes(self):
+        """Test batches large enough for the thread pool give the same hashes."""
+        contents = [f"page {i} " * 50000 for i in range(4)]
+        self.assertEqual(hash_contents_batch(contents), [calculate_content_hash(c) for c in contents])
+
+
+class TestCalculateContentHashes(unittest.TestCase):
+    """Test the calculate_content_hashes function."""
+    
+    def test_volatile_content_normalized(self):
+        """Test digits and tag attributes don't change the normalized hash."""
+        first = calculate_content_hashes('<p class="a1">Visitors: 1234</p>')
+        second = calculate_content_hashes('<p class="b2">Visitors: 5678</p>')
+        
+        self.assertNotEqual(first[0], second[0])
+        self.assertEqual(first[1], second[1])
+        self.assertEqual(first[1], calculate_content_hash('<p>Visitors: 0</p>'))
+    
+    def test_unchanged_content_shares_hash(self):
+        """Test content without digits or attributes has equal hashes."""
+        content_hash, normalized_hash = calculate_content_hashes("plain text", 'blake2b')
+        self.assertEqual(content_hash, calculate_content_hash("plain text", 'blake2b'))
+        self.assertEqual(normalized_hash, content_hash)
+
+
+class TestHashStream(unittest.TestCase):
+    """Test the hash_stream function."""
+    
+    def test_matches_whole_content_hash(self):
+        """Test hashing chunks gives the hash of the joined content."""
+        chunks = [b"Hello, ", "世界", b"", b"!"]
+        expected = calculate_content_hash("Hello, 世界!")
+        self.assertEqual(hash_stream(chunks), expected)
+        self.assertEqual(hash_stream(iter(chunks)), expected)
+    
+    def test_empty_stream(self):
+        """Test a stream without content hashes to an empty string."""
+        self.assertEqual(hash_stream([]), "")
+        self.assertEqual(hash_stream([b"", ""]), "")
+    
+    def test_blake2b_algorithm(self):
+        """Test other algorithms match their one-shot hash."""
+        self.assertEqual(hash_stream([b"a", b"b"], 'blake2b'), calculate_content_hash("ab", 'blake2b'))
 
 
 class TestValidateUrl(unittest.TestCase):
@@ -94,6 +186,11 @@ class TestValidateUrl(unittest.TestCase):
         url = "https://example.com:8080/path"
         self.assertTrue(validate_url(url))
     
+    def test_valid_url_uppercase_scheme(self):
+        """Test the scheme is matched case-insensitively."""
+        url = "HTTPS://Example.com/"
+        self.assertTrue(validate_url(url))
+    
     def test_invalid_url_no_scheme(self):
         """Test invalid URL without scheme."""
         url = "example.com"
@@ -125,6 +222,92 @@ class TestValidateUrl(unittest.TestCase):
         self.assertFalse(validate_url(url))
 
 
+class TestParseUrl(unittest.TestCase):
+    """Test the parse_url function."""
+    
+    def test_matches_urlparse(self):
+        """Test results are the same as urllib's urlparse."""
+        from urllib.parse import urlparse
+        url = "https://example.com:8080/path?q=1#frag"
+        self.assertEqual(parse_url(url), urlparse(url))
+    
+    def test_repeated_calls_are_cached(self):
+        """Test parsing the same URL twice returns the cached result."""
+        url = "https://example.com/cached"
+        self.assertIs(parse_url(url), parse_url(url))
+
+
+class TestGetBaseUrl(unittest.TestCase):
+    """Test the get_base_url function."""
+    
+    def test_strips_path_query_and_fragment(self):
+        """Test only scheme and netloc are kept."""
+        self.assertEqual(get_base_url("https://example.com:8080/a/b?q=1#x"), "https://example.com:8080")
+    
+    def test_scheme_is_preserved(self):
+        """Test http and https bases differ."""
+        self.assertNotEqual(get_base_url("http://example.com/"), get_base_url("https://example.com/"))
+
+
+class TestGetHost(unittest.TestCase):
+    """Test the get_host function."""
+    
+    def test_host_and_port(self):
+        """Test the netloc including the port is returned."""
+        self.assertEqual(get_host("https://example.com:8080/a?q=1"), "example.com:8080")
+    
+    def test_relative_url(self):
+        """Test relative URLs have no host."""
+        self.assertEqual(get_host("/just/a/path"), "")
+
+
+class TestCanonicalizeUrl(unittest.TestCase):
+    """Test the canonicalize_url function."""
+    
+    def test_lowercases_scheme_and_host(self):
+        """Test scheme and host are lowercased but path is not."""
+        result = canonicalize_url("HTTPS://Example.COM/Path")
+        self.assertEqual(result, "https://example.com/Path")
+    
+    def test_strips_fragment(self):
+        """Test fragment is removed."""
+        result = canonicalize_url("https://example.com/page#section")
+        self.assertEqual(result, "https://example.com/page")
+    
+    def test_sorts_query(self):
+        """Test query parameters are sorted."""
+        result = canonicalize_url("https://example.com/search?q=test&a=1")
+        self.assertEqual(result, "https://example.com/search?a=1&q=test")
+    
+    def test_drops_default_port(self):
+        """Test default ports are removed and others kept."""
+        self.assertEqual(canonicalize_url("https://example.com:443/"), "https://example.com/")
+        self.assertEqual(canonicalize_url("http://example.com:80/"), "http://example.com/")
+        self.assertEqual(canonicalize_url("https://example.com:8080/"), "https://example.com:8080/")
+    
+    def test_empty_path(self):
+        """Test empty path normalizes to root."""
+        self.assertEqual(canonicalize_url("https://example.com"), "https://example.com/")
+    
+    def test_equivalent_urls_match(self):
+        """Test equivalent spellings produce the same key."""
+        self.assertEqual(
+            canonicalize_url("https://EXAMPLE.com:443?b=2&a=1#top"),
+            canonicalize_url("https://example.com/?a=1&b=2")
+        )
+    
+    def test_ipv6_host_keeps_brackets(self):
+        """Test IPv6 hosts stay bracketed, with and without a port."""
+        self.assertEqual(canonicalize_url("http://[::1]:8080/"), "http://[::1]:8080/")
+        self.assertEqual(canonicalize_url("HTTP://[2001:DB8::1]:80/a"), "http://[2001:db8::1]/a")
+    
+    def test_malformed_url_returned_unchanged(self):
+        """Test URLs that cannot be parsed fall back to the raw URL instead of raising."""
+        self.assertEqual(canonicalize_url("https://example.com:99999/"), "https://example.com:99999/")
+        self.assertEqual(canonicalize_url("https://example.com:abc/"), "https://example.com:abc/")
+        self.assertEqual(canonicalize_url("http://[::1/"), "http://[::1/")
+
+
 class TestFormatBytes(unittest.TestCase):
     """Test the format_bytes function."""
     
@@ -138,6 +321,11 @@ class TestFormatBytes(unittest.TestCase):
         result = format_bytes(512)
         self.assertEqual(result, "512.0 B")
     
+    def test_just_below_kilobyte(self):
+        """Test the largest value still shown in bytes."""
+        result = format_bytes(1023)
+        self.assertEqual(result, "1023.0 B")
+    
     def test_kilobytes(self):
         """Test formatting kilobytes."""
         result = format_bytes(1024)
@@ -191,13 +379,20 @@ class TestGetCurrentTimestamp(unittest.TestCase):
         self.assertIsInstance(timestamp1, str)
         self.assertIsInstance(timestamp2, str)
     
-    @patch('time.strftime')
-    def test_timestamp_mocked(self, mock_strftime):
+    @patch('utils.datetime')
+    def test_timestamp_mocked(self, mock_datetime):
         """Test timestamp with mocked time."""
-        mock_strftime.return_value = "2024-01-15T10:30:45"
+        mock_datetime.now.return_value.isoformat.return_value = "2024-01-15T10:30:45"
         result = get_current_timestamp()
         self.assertEqual(result, "2024-01-15T10:30:45")
-        mock_strftime.assert_called_once_with('%Y-%m-%dT%H:%M:%S', time.localtime())
+        mock_datetime.now.return_value.isoformat.assert_called_once_with(timespec='seconds')
+    
+    def test_timestamp_matches_local_time(self):
+        """Test the timestamp has the same format as strftime on local time."""
+        before = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime())
+        result = get_current_timestamp()
+        after = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime())
+        self.assertIn(result, (before, after))
 
 
 class TestSanitizeFilename(unittest.TestCase):
@@ -251,6 +446,11 @@ class TestSanitizeFilename(unittest.TestCase):
         filename = "文件名.txt"
         result = sanitize_filename(filename)
         self.assertEqual(result, "文件名.txt")
+    
+    def test_long_unicode_filename(self):
+        """Test long Unicode filenames are limited to 255 characters, not bytes."""
+        self.assertEqual(sanitize_filename("文" * 100), "文" * 100)
+        self.assertEqual(sanitize_filename("文" * 300), "文" * 255)
 
 
 class TestRetryWithBackoff(unittest.TestCase):
@@ -335,6 +535,32 @@ class TestRetryWithBackoff(unittest.TestCase):
         # Check sleep was called with correct delays
         expected_calls = [call(1.0), call(2.0)]
         mock_sleep.assert_has_calls(expected_calls)
+    
+    @patch('utils.time.sleep')
+    @patch('utils.asyncio.sleep')
+    def test_async_function_retry(self, mock_async_sleep, mock_sleep):
+        """Test coroutine functions are retried with asyncio.sleep instead of time.sleep."""
+        import asyncio
+        call_count = 0
+        
+        async def async_func():
+            nonlocal call_count
+            call_count += 1
+            if call_count <= 2:
+                raise Exception("Error")
+            return "success"
+        
+        decorated_func = retry_with_backoff(async_func, max_retries=2, delay=1.0, backoff_factor=2.0)
+        
+        result = asyncio.run(decorated_func())
+        self.assertEqual(result, "success")
+        mock_async_sleep.assert_has_calls([call(1.0), call(2.0)])
+        mock_sleep.assert_not_called()
+
+
+def log_from_worker(message):
+    """Log message from a process pool worker (module level so it pickles)."""
+    logging.getLogger('worker').info(message)
 
 
 class TestSetupLogging(unittest.TestCase):
@@ -368,6 +594,48 @@ class TestSetupLogging(unittest.TestCase):
         self.assertIsInstance(logger, logging.Logger)
         self.assertEqual(logger.level, logging.INFO)
     
+    def test_records_written_to_file(self):
+        """Test queued records reach the log file once the listener is stopped."""
+        import utils
+        config = {
+            'level': 'INFO',
+            'file': self.log_file,
+            'format': '%(levelname)s - %(message)s'
+        }
+        
+        logger = setup_logging(config)
+        logger.info("Queued %s", "message")
+        utils._stop_log_listener()
+        
+        with open(self.log_file, encoding='utf-8') as log:
+            self.assertIn("INFO - Queued message", log.read())
+    
+    def test_worker_process_records_written_to_file(self):
+        """Test records logged in a process pool worker reach the log file."""
+        import utils
+        config = {
+            'level': 'INFO',
+            'file': self.log_file,
+            'format': '%(levelname)s - %(message)s'
+        }
+        
+        setup_logging(config)
+        mp_context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=1, mp_context=mp_context,
+                                 initializer=setup_worker_logging,
+                                 initargs=(get_worker_log_queue(mp_context), logging.INFO)) as pool:
+            pool.submit(log_from_worker, "Worker message").result()
+        utils._stop_log_listener()
+        
+        with open(self.log_file, encoding='utf-8') as log:
+            self.assertIn("INFO - Worker message", log.read())
+    
+    def test_worker_log_queue_requires_setup(self):
+        """Test there is no worker queue before setup_logging has run."""
+        import utils
+        utils._stop_log_listener()
+        self.assertIsNone(get_worker_log_queue())
+    
     def test_log_directory_creation(self):
         """Test log directory creation."""
         nested_log_file = os.path.join(self.temp_dir, "nested", "test.log")
@@ -402,6 +670,26 @@ class TestSetupLogging(unittest.TestCase):
             self.assertIsInstance(logger, logging.Logger)
 
 
+class TestCachedTimeFormatter(unittest.TestCase):
+    """Test the CachedTimeFormatter class."""
+    
+    def make_record(self, created):
+        """Build a log record created at the given epoch time."""
+        record = logging.LogRecord('test', logging.INFO, __file__, 1, 'message', None, None)
+        record.created = created
+        record.msecs = (created - int(created)) * 1000
+        return record
+    
+    def test_matches_standard_formatter(self):
+        """Test output matches logging.Formatter with and without a datefmt."""
+        for datefmt in ('%Y-%m-%d %H:%M:%S', None):
+            cached = CachedTimeFormatter('%(asctime)s %(message)s', datefmt=datefmt)
+            standard = logging.Formatter('%(asctime)s %(message)s', datefmt=datefmt)
+            for created in (1700000000.25, 1700000000.75, 1700000001.5):
+                record = self.make_record(created)
+                self.assertEqual(cached.format(record), standard.format(record))
+
+
 class TestGetLogger(unittest.TestCase):
     """Test the get_logger function."""
     
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the WebScraper orchestrator.
+
+This module contains tests for URL processing, session statistics and error
+recovery, with HTTP requests and the database replaced by stubs.
+"""
+
+import unittest
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+import requests
+import sys
+import os
+
+# Add src directory to Python path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from scraper import WebScraper, ParseError, DatabaseError
+import psycopg2
+from utils import get_host
+from database import DatabaseManager, ScrapedContent, calculate_content_hash
+
+
+def make_scraper(urls=None, **settings):
+    """
+    Build a WebScraper over stub configuration and a mocked database manager.
+    
+    Args:
+        urls: URL configuration dictionaries
+        **settings: Scraping settings overriding the test defaults
+        
+    Returns:
+        WebScraper instance
+    """
+    scraping_settings = {
+        'delay_between_requests': 0,
+        'retry_attempts': 0,
+        'respect_robots_txt': False,
+        'min_content_length': 0
+    }
+    scraping_settings.update(settings)
+    config = SimpleNamespace(get_scraping_config=lambda: {'urls': urls or [], 'settings': scraping_settings})
+    
+    db_manager = Mock(spec=DatabaseManager)
+    db_manager.get_url_hash_pairs.return_value = []
+    db_manager.get_latest_scrape_info.return_value = {}
+    db_manager.insert_content.return_value = 1
+    
+    return WebScraper(config, db_manager)
+
+
+def make_response(url, body, status_code=200):
+    """
+    Build a requests.Response with an already-read body.
+    
+    The HTTP client streams bodies with iter_content(), which serves the
+    stored body once it is marked as consumed.
+    """
+    response = requests.Response()
+    response._content = body
+    response._content_consumed = True
+    response.status_code = status_code
+    response.headers['Content-Type'] = 'text/html; charset=utf-8'
+    response.url = url
+    return response
+
+
+class RecordingSessionGet:
+    """Stand-in for requests.Session.get that records when each URL was requested."""
+    
+    def __init__(self):
+        self.requests = []  # (url, time.monotonic()) in request order
+        self._lock = threading.Lock()
+    
+    def __call__(self, url, **kwargs):
+        with self._lock:
+            self.requests.append((url, time.monotonic()))
+        # Give other workers a chance to run while this request is "in flight"
+        time.sleep(0.002)
+        if '/missing' in url:
+            return make_response(url, b'Not Found', 404)
+        return make_response(url, f'<html><head><title>{url}</title></head><body><main>Page {url}</main></body></html>'.encode())
+    
+    def times_by_host(self):
+        """Get request times grouped by host, in request order."""
+        times = {}
+        for url, request_time in self.requests:
+            times.setdefault(get_host(url), []).append(request_time)
+        return times
+
+
+class TestConcurrentScraping(unittest.TestCase):
+    """Test cases for the concurrent multi-host session driver."""
+    
+    def scrape(self, urls, **settings):
+        """Run a session over urls with requests stubbed, returning (scraper, session, recorder)."""
+        scraper = make_scraper([{'url': url} for url in urls], **settings)
+        recorder = RecordingSessionGet()
+        try:
+            with patch('requests.Session.get', side_effect=recorder):
+                session = scraper.scrape_urls()
+        finally:
+            scraper.close()
+        return scraper, session, recorder
+    
+    def test_results_keep_per_host_order(self):
+        """Test URLs of each host are fetched and stored in configuration order."""
+        urls = [f'https://host{host}.example.com/page-{page}' for page in range(4) for host in range(3)]
+        
+        scraper, session, recorder = self.scrape(urls, max_concurrency=3)
+        
+        stored_urls = [call[0][0].url for call in scraper.db_manager.insert_content.call_args_list]
+        self.assertEqual(sorted(stored_urls), sorted(urls))
+        for host in range(3):
+            prefix = f'https://host{host}.example.com/'
+            expected = [url for url in urls if url.startswith(prefix)]
+            self.assertEqual([url for url, _ in recorder.requests if url.startswith(prefix)], expected)
+            self.assertEqual([url for url in stored_urls if url.startswith(prefix)], expected)
+        
+        self.assertEqual(session.successful_scrapes, len(urls))
+    
+    def test_host_delay_applied_per_host(self):
+        """Test requests to one host are spaced by the delay while hosts overlap."""
+        urls = [f'https://host{host}.example.com/page-{page}' for page in range(3) for host in range(2)]
+        
+        scraper, session, recorder = self.scrape(urls, max_concurrency=2, delay_between_requests=0.05)
+        
+        times_by_host = recorder.times_by_host()
+        self.assertEqual(len(times_by_host), 2)
+        for request_times in times_by_host.values():
+            self.assertEqual(len(request_times), 3)
+            for earlier, later in zip(request_times, request_times[1:]):
+                self.assertGreaterEqual(later - earlier, 0.045)
+        
+        # Both hosts start without waiting for each other
+        first_requests = [request_times[0] for request_times in times_by_host.values()]
+        self.assertLess(max(first_requests) - min(first_requests), 0.04)
+    
+    def test_stats_and_errors_counted_once(self):
+        """Test every URL is counted exactly once under concurrency."""
+        urls = [f'https://host{host}.example.com/{"missing" if page % 3 == 0 else "page"}-{page}'
+                for page in range(10) for host in range(4)]
+        missing = sum(1 for url in urls if '/missing' in url)
+        
+        scraper, session, recorder = self.scrape(urls, max_concurrency=4)
+        
+        self.assertEqual(len(recorder.requests), len(urls))
+        self.assertEqual(session.total_urls, len(urls))
+        self.assertEqual(session.successful_scrapes, len(urls) - missing)
+        self.assertEqual(session.failed_scrapes, missing)
+        self.assertEqual(session.skipped_urls, 0)
+        self.assertEqual(len(session.errors), missing)
+        self.assertEqual(scraper.db_manager.insert_content.call_count, len(urls) - missing)
+        
+        error_counts, total_errors = scraper.error_engine.get_error_counts()
+        self.assertEqual(error_counts['NetworkError'], missing)
+        self.assertEqual(total_errors, missing)
+        
+        http_stats = scraper.http_client.get_statistics()
+        self.assertEqual(http_stats['total_requests'], len(urls))
+        self.assertEqual(http_stats['failed_requests'], missing)
+
+
+class TestPartialContentRecovery(unittest.TestCase):
+    """Test cases for saving partial content after parse errors."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.scraper = make_scraper()
+    
+    def tearDown(self):
+        """Clean up after tests."""
+        self.scraper.close()
+    
+    def test_parse_error_saves_partial_content(self):
+        """Test a parse error with raw content available stores the first 10KB."""
+        url = 'https://example.com/broken'
+        raw_content = '<html>' + 'x' * 20000
+        
+        decision = self.scraper._handle_scraping_error(
+            url, ParseError("Extraction failed", url), {'raw_content': raw_content}
+        )
+        
+        self.assertEqual(decision.recovery_action, 'save_partial_content')
+        self.scraper.db_manager.insert_content.assert_called_once()
+        
+        partial_content = self.scraper.db_manager.insert_content.call_args[0][0]
+        self.assertIsInstance(partial_content, ScrapedContent)
+        self.assertEqual(partial_content.url, url)
+        self.assertEqual(partial_content.content, raw_content[:10000])
+        self.assertEqual(partial_content.content_hash, calculate_content_hash(raw_content[:10000]))
+        self.assertEqual(partial_content.content_length, len(raw_content))
+        self.assertTrue(partial_content.title.startswith('[PARTIAL]'))
+        
+        self.assertEqual(self.scraper.session_stats.successful_scrapes, 1)
+        self.assertEqual(self.scraper.session_stats.total_content_size, len(raw_content))
+    
+    def test_parse_error_without_raw_content(self):
+        """Test nothing is stored when no raw content is available."""
+        self.scraper._handle_scraping_error('https://example.com/broken', ParseError("Extraction failed"))
+        
+        self.scraper.db_manager.insert_content.assert_not_called()
+        self.assertEqual(self.scraper.session_stats.successful_scrapes, 0)
+
+
+
+class TestExtractionReuse(unittest.TestCase):
+    """Test cases for reusing the extraction of identical responses."""
+    
+    def scrape(self, bodies, **settings):
+        """Run a session serving bodies by URL, returning (scraper, session, stored content)."""
+        scraper = make_scraper([{'url': url} for url in bodies], **settings)
+        try:
+            with patch('requests.Session.get', side_effect=lambda url, **kwargs: make_response(url, bodies[url])), \
+                    patch.object(scraper.content_extractor, 'extract_content',
+                                 wraps=scraper.content_extractor.extract_content) as extract_content:
+                session = scraper.scrape_urls()
+        finally:
+            scraper.close()
+        stored = [call_args[0][0] for call_args in scraper.db_manager.insert_content.call_args_list]
+        return scraper, session, stored, extract_content.call_count
+    
+    def test_identical_bodies_extracted_once(self):
+        """Test a body served under several URLs is parsed once and stored for each URL."""
+        page = b'<html><head><title>Access denied</title></head><body><main>Please log in</main></body></html>'
+        untitled = b'<html><body><main>No title here</main></body></html>'
+        bodies = {
+            'https://example.com/a': page,
+            'https://example.com/b?utm_source=x': page,
+            'https://example.com/first-page': untitled,
+            'https://example.com/second-page': untitled,
+        }
+        
+        scraper, session, stored, extractions = self.scrape(bodies)
+        
+        self.assertEqual(extractions, 2)
+        self.assertEqual(scraper.session_stats.reused_extractions, 2)
+        self.assertEqual([content.url for content in stored], list(bodies))
+        self.assertEqual(stored[1].title, 'Access denied')
+        self.assertEqual(stored[1].content_hash, stored[0].content_hash)
+        self.assertEqual(stored[2].title, 'First Page - example.com')
+        self.assertEqual(stored[3].title, 'Second Page - example.com')
+    
+    def test_cache_disabled(self):
+        """Test extraction_cache_size 0 extracts every response."""
+        page = b'<html><body><main>Same</main></body></html>'
+        
+        scraper, session, stored, extractions = self.scrape(
+            {'https://example.com/a': page, 'https://example.com/b': page}, extraction_cache_size=0
+        )
+        
+        self.assertEqual(extractions, 2)
+        self.assertEqual(scraper.session_stats.reused_extractions, 0)
+
+
+class TestStoreContent(unittest.TestCase):
+    """Test cases for classifying storage failures."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.scraper = make_scraper()
+        self.content = ScrapedContent(url='https://example.com/page', title='Page', content='text',
+                                      content_hash=calculate_content_hash('text'))
+    
+    def tearDown(self):
+        """Clean up after tests."""
+        self.scraper.close()
+    
+    def test_psycopg2_error_becomes_database_error(self):
+        """Test driver errors are raised as DatabaseError, which the engine retries."""
+        self.scraper.db_manager.insert_content.side_effect = psycopg2.OperationalError("connection lost")
+        
+        with self.assertRaises(DatabaseError) as raised:
+            self.scraper._store_content(self.content)
+        
+        self.assertIsInstance(raised.exception.__cause__, psycopg2.OperationalError)
+        decision = self.scraper.error_engine.get_error_decision(raised.exception, {'attempt_number': 1})
+        self.assertEqual(decision.recovery_action, 'retry_database_operation')
+    
+    def test_other_errors_propagate_unchanged(self):
+        """Test non-database errors are not reclassified."""
+        self.scraper.db_manager.insert_content.side_effect = ValueError("bad record")
+        
+        with self.assertRaises(ValueError):
+            self.scraper._store_content(self.content)
+
+
+class TestDuplicateFilters(unittest.TestCase):
+    """Test cases for the in-memory duplicate detection filters."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.scraper = make_scraper()
+        self.scraper._load_dedup_filters([])
+    
+    def tearDown(self):
+        """Clean up after tests."""
+        self.scraper.close()
+    
+    def test_ipv6_and_malformed_urls(self):
+        """Test IPv6 and unparseable URLs are remembered and looked up without raising."""
+        for url in ('http://[::1]:8080/page', 'https://example.com:99999/', 'http://[::1/'):
+            with self.subTest(url=url):
+                self.assertFalse(self.scraper._may_have_seen_url(url))
+                
+                self.scraper._remember_content(url, 'abc123')
+                
+                self.assertTrue(self.scraper._may_have_seen_url(url))
+                self.assertTrue(self.scraper._may_have_seen_content(url, 'abc123'))
+        
+        self.assertFalse(self.scraper._may_have_seen_url('http://[::2]:8080/page'))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)